@@ -1,5 +1,4 @@
 from django.contrib import admin
-from django.db.models import Sum
 from .models import LevelStep, JoinedCrew, JoinedRace, Record, CustomUser
 
 
@@ -25,13 +24,6 @@ class CustomUserAdmin(admin.ModelAdmin):
     inlines = [JoinedCrewInline, JoinedRaceInline, RecordInline]
     readonly_fields = ("total_distance",)
 
-    def total_distance(self, obj):
-        return (
-            obj.records.aggregate(total_distance=Sum("distance"))["total_distance"] or 0
-        )
-
-    total_distance.short_description = "Total Distance"
-
 
 admin.site.register(LevelStep)
 admin.site.register(Record)
@@ -0,0 +1,220 @@
+import numpy as np
+from django.conf import settings
+from django.core.cache import caches
+from config.tracks import decode_track, track_hash
+
+
+"""
+기록 트랙 분석 (GET /accounts/mypage/record/<id>/analysis/)
+
+- Record.track(config/tracks.py)의 포인트 배열로 NumPy 계산
+    - 누적 거리/누적 시간(구간이 바뀌는 이동 제외) 배열을 한 번 만들고 나머지는 보간/검색으로 계산
+    - splits: 1km 마다 걸린 시간, 페이스(초/km), 고도 변화 (마지막은 남은 거리)
+    - best_efforts: 1k/5k/10k 를 가장 빨리 달린 구간 (모든 시작점에서 searchsorted 로 끝점을 찾는 슬라이딩 윈도우)
+    - elevation: 이동 평균으로 GPS 고도 잡음을 줄인 뒤 누적 상승/하강
+    - pace_zones: 이동 구간을 이 기록의 평균 이동 페이스 대비 비율로 나눈 영역별 시간
+    - 시간 정보가 없는 트랙은 시간 관련 항목이 null
+- 결과는 CACHES[TRACK_ANALYSIS_CACHE_ALIAS] 에 트랙 해시(Record.track_hash)로 저장
+    - 같은 트랙은 파일을 다시 읽지 않음, 분석 방식이 바뀌면 ANALYSIS_VERSION 을 올림
+"""
+
+ANALYSIS_VERSION = 1
+TRACK_ANALYSIS_CACHE_ALIAS = "default"
+SPLIT_DISTANCE = 1000  # m
+MIN_SPLIT_REMAINDER = 10  # m
+BEST_EFFORT_DISTANCES = (1000, 5000, 10000)  # m
+ELEVATION_SMOOTHING = 5  # 포인트 수
+# (이름, 평균 이동 페이스 대비 하한 비율), 비율이 클수록 느림
+PACE_ZONES = (
+    ("recovery", 1.15),
+    ("easy", 1.05),
+    ("steady", 0.97),
+    ("tempo", 0.90),
+    ("fast", 0.0),
+)
+
+
+def get_cache_seconds():
+    return getattr(settings, "TRACK_ANALYSIS_CACHE_SECONDS", 60 * 60 * 24 * 7)
+
+
+def _round(value, digits=1):
+    return None if value is None else round(float(value), digits)
+
+
+def _pace(seconds, distance):
+    return _round(seconds / distance * 1000) if distance > 0 else None
+
+
+class TrackAnalysis:
+    def __init__(self, track):
+        self.track = track
+        self.steps = track.step_distances()
+        self.distances = np.concatenate(([0.0], np.cumsum(self.steps)))
+        self.step_seconds = track.step_seconds()
+        self.seconds = None
+        if self.step_seconds is not None:
+            self.seconds = np.concatenate(([0.0], np.cumsum(self.step_seconds)))
+
+    @property
+    def total_distance(self):
+        return float(self.distances[-1])
+
+    # 누적 거리 target 지점을 지난 시각 (처음 도달한 이동 구간에서 선형 보간)
+    def seconds_at(self, targets):
+        targets = np.asarray(targets, dtype=np.float64)
+        end = np.searchsorted(self.distances, targets, side="left")
+        end = np.clip(end, 1, len(self.distances) - 1)
+        start = end - 1
+        covered = self.distances[end] - self.distances[start]
+        ratio = np.divide(
+            targets - self.distances[start],
+            covered,
+            out=np.zeros_like(targets),
+            where=covered > 0,
+        )
+        elapsed = self.seconds[end] - self.seconds[start]
+        return self.seconds[start] + np.clip(ratio, 0.0, 1.0) * elapsed
+
+    def elevations_at(self, targets):
+        return np.interp(targets, self.distances, self.track.elevations)
+
+    def splits(self):
+        total = self.total_distance
+        if self.seconds is None or total <= 0:
+            return None
+        # 마지막 구간이 MIN_SPLIT_REMAINDER 보다 짧으면 앞 구간에 합침
+        boundaries = np.arange(0.0, total - MIN_SPLIT_REMAINDER, SPLIT_DISTANCE)
+        boundaries = np.append(boundaries, total)
+        times = self.seconds_at(boundaries)
+        elevations = None
+        if self.track.elevations is not None:
+            elevations = self.elevations_at(boundaries)
+        splits = []
+        for index in range(len(boundaries) - 1):
+            distance = boundaries[index + 1] - boundaries[index]
+            seconds = times[index + 1] - times[index]
+            splits.append(
+                {
+                    "index": index + 1,
+                    "distance": _round(distance),
+                    "seconds": _round(seconds),
+                    "pace": _pace(seconds, distance),
+                    "elevation_change": (
+                        None
+                        if elevations is None
+                        else _round(elevations[index + 1] - elevations[index])
+                    ),
+                }
+            )
+        return splits
+
+    # 모든 시작 포인트에서 distance 만큼 간 시각을 한 번에 구해 가장 짧은 구간 선택
+    def best_effort(self, distance):
+        if self.seconds is None or self.total_distance < distance:
+            return None
+        starts = np.flatnonzero(self.distances + distance <= self.total_distance)
+        durations = (
+            self.seconds_at(self.distances[starts] + distance) - self.seconds[starts]
+        )
+        best = int(np.argmin(durations))
+        return {
+            "distance": distance,
+            "seconds": _round(durations[best]),
+            "pace": _pace(durations[best], distance),
+            "start_distance": _round(self.distances[starts[best]]),
+        }
+
+    def best_efforts(self):
+        if self.seconds is None:
+            return None
+        efforts = (self.best_effort(distance) for distance in BEST_EFFORT_DISTANCES)
+        return [effort for effort in efforts if effort is not None]
+
+    def elevation(self):
+        elevations = self.track.elevations
+        if elevations is None:
+            return None
+        if len(elevations) >= ELEVATION_SMOOTHING:
+            window = np.ones(ELEVATION_SMOOTHING) / ELEVATION_SMOOTHING
+            padded = np.pad(elevations, ELEVATION_SMOOTHING // 2, mode="edge")
+            elevations = np.convolve(padded, window, mode="valid")
+        changes = np.where(self.track.step_mask(), np.diff(elevations), 0.0)
+        return {
+            "gain": _round(changes[changes > 0].sum()),
+            "loss": _round(-changes[changes < 0].sum()),
+            "min": _round(self.track.elevations.min()),
+            "max": _round(self.track.elevations.max()),
+        }
+
+    def pace_zones(self, moving):
+        moving_seconds = self.step_seconds[moving]
+        moving_distance = self.steps[moving].sum()
+        if moving_distance <= 0:
+            return None
+        average = moving_seconds.sum() / moving_distance * 1000
+        paces = moving_seconds / self.steps[moving] * 1000
+        zones, upper = [], None
+        for name, ratio in PACE_ZONES:
+            lower = average * ratio
+            in_zone = paces >= lower
+            if upper is not None:
+                in_zone &= paces < upper
+            zones.append(
+                {
+                    "zone": name,
+                    "min_pace": _round(lower) if ratio else None,
+                    "max_pace": _round(upper),
+                    "seconds": _round(moving_seconds[in_zone].sum()),
+                }
+            )
+            upper = lower
+        return zones
+
+    def as_dict(self):
+        summary = self.track.summary()
+        data = {
+            "version": ANALYSIS_VERSION,
+            "distance": _round(self.total_distance),
+            "duration": _round(summary["duration"]),
+            "moving_time": _round(summary["moving_time"]),
+            "average_pace": None,
+            "elevation": self.elevation(),
+            "splits": self.splits(),
+            "best_efforts": self.best_efforts(),
+            "pace_zones": None,
+        }
+        if self.seconds is not None:
+            moving = self.track.moving_mask(self.steps, self.step_seconds)
+            data["average_pace"] = _pace(
+                self.step_seconds[moving].sum(), self.steps[moving].sum()
+            )
+            data["pace_zones"] = self.pace_zones(moving)
+        return data
+
+
+def _read(field_file):
+    with field_file.open("rb") as file:
+        return file.read()
+
+
+def analyze_track(track):
+    return TrackAnalysis(track).as_dict()
+
+
+# 기록의 트랙 분석 결과 (트랙 해시로 캐시), 트랙이 없으면 None
+def get_record_analysis(record):
+    if not record.track:
+        return None
+    data, digest = None, record.track_hash
+    if not digest:  # 해시를 저장하지 않은 기록은 파일 내용으로 계산
+        data = _read(record.track)
+        digest = track_hash(data)
+    cache = caches[TRACK_ANALYSIS_CACHE_ALIAS]
+    key = f"track-analysis:{ANALYSIS_VERSION}:{digest}"
+    analysis = cache.get(key)
+    if analysis is None:
+        track = decode_track(data if data is not None else _read(record.track))
+        analysis = analyze_track(track)
+        cache.set(key, analysis, get_cache_seconds())
+    return analysis
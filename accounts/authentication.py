@@ -0,0 +1,138 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import F
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from .models import CustomUser
+
+
+"""
+클레임 기반 JWT 인증
+
+- 로그인/토큰 갱신 시 pk 외에 user_type, is_staff, nickname, token_version 을 토큰 클레임으로 서명해 발급
+- ClaimsJWTAuthentication 은 요청마다 유저 행을 조회하지 않고 클레임으로 CustomUser 인스턴스를 만듦
+    - 클레임 밖의 필드(email 등)는 지연 로딩, 처음 접근할 때 나머지 필드를 한 번에 조회 (CustomUser.refresh_from_db)
+    - 실제 CustomUser 인스턴스이므로 FK 대입, obj.owner == request.user 비교, 필터 인자로 그대로 사용 가능
+- 폐기: 토큰의 token_version 이 유저의 현재 token_version 과 다르면 거부
+    - 현재 버전은 CACHES["default"] 에 TOKEN_VERSION_CACHE_SECONDS 동안 캐시 (유저별 쿼리 1번)
+        - 캐시 미스 때는 read replica 가 아닌 primary 에서 읽음 (복제 지연 동안 이전 버전을 캐시하지 않도록)
+        - 폐기 시 캐시는 커밋 후 삭제 (커밋 전에 다른 요청이 이전 버전을 다시 캐시하지 않도록)
+    - user_type, is_staff, is_active, 비밀번호가 바뀌면 버전을 올림 (accounts/signals.py)
+    - nickname 은 폐기하지 않고, 토큰 갱신 시 DB 값으로 다시 발급 (최대 ACCESS_TOKEN_LIFETIME 동안 이전 값)
+- 클레임이 없는 이전 토큰은 기존처럼 DB 에서 유저를 조회
+"""
+
+CLAIM_FIELDS = ("user_type", "is_staff", "nickname")
+VERSION_CLAIM = "token_version"
+VERSION_CACHE_ALIAS = "default"
+MISSING_USER_VERSION = -1  # 없는/비활성 유저 (캐시에 None 대신 저장)
+
+
+def get_version_cache_seconds():
+    return getattr(settings, "TOKEN_VERSION_CACHE_SECONDS", 60)
+
+
+def _version_key(user_id):
+    return f"auth:token_version:{user_id}"
+
+
+def get_token_version(user_id):
+    cache = caches[VERSION_CACHE_ALIAS]
+    version = cache.get(_version_key(user_id))
+    if version is None:
+        version = (
+            CustomUser.objects.using(DEFAULT_DB_ALIAS)
+            .filter(pk=user_id, is_active=True)
+            .values_list("token_version", flat=True)
+            .first()
+        )
+        if version is None:
+            version = MISSING_USER_VERSION
+        cache.set(_version_key(user_id), version, get_version_cache_seconds())
+    return version
+
+
+# 유저의 모든 토큰 폐기
+def revoke_tokens(user_id):
+    CustomUser.objects.filter(pk=user_id).update(token_version=F("token_version") + 1)
+    forget_token_version(user_id)
+
+
+# 캐시된 버전 삭제 (트랜잭션 안이면 커밋 후)
+def forget_token_version(user_id):
+    transaction.on_commit(
+        lambda: caches[VERSION_CACHE_ALIAS].delete(_version_key(user_id))
+    )
+
+
+def set_user_claims(token, user):
+    for field in CLAIM_FIELDS:
+        token[field] = getattr(user, field)
+    token[VERSION_CLAIM] = user.token_version
+
+
+# 클레임으로 CustomUser 인스턴스 생성 (나머지 필드는 지연 로딩)
+def build_user_from_claims(token):
+    values = {field: token[field] for field in CLAIM_FIELDS}
+    values[api_settings.USER_ID_FIELD] = token[api_settings.USER_ID_CLAIM]
+    values["is_active"] = True  # 비활성화되면 토큰이 폐기되므로 항상 활성
+    values["token_version"] = token[VERSION_CLAIM]
+    field_names = [
+        field.attname
+        for field in CustomUser._meta.concrete_fields
+        if field.attname in values
+    ]
+    user = CustomUser.from_db(
+        DEFAULT_DB_ALIAS, field_names, [values[name] for name in field_names]
+    )
+    user._from_token_claims = True
+    return user
+
+
+def has_claims(token):
+    return all(claim in token for claim in (*CLAIM_FIELDS, VERSION_CLAIM))
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        if not has_claims(validated_token):
+            return super().get_user(validated_token)
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("토큰에 유저 정보가 없습니다.")
+        if validated_token[VERSION_CLAIM] != get_token_version(user_id):
+            raise AuthenticationFailed("폐기된 토큰입니다.", code="token_revoked")
+        return build_user_from_claims(validated_token)
+
+
+# 로그인 시 클레임 포함 (dj-rest-auth JWT_TOKEN_CLAIMS_SERIALIZER)
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        set_user_claims(token, user)
+        return token
+
+
+# 토큰 갱신 시 폐기 여부를 DB 에서 확인하고 최신 클레임으로 다시 발급
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    def validate(self, attrs):
+        refresh = RefreshToken(attrs["refresh"])
+        user = CustomUser.objects.filter(
+            **{api_settings.USER_ID_FIELD: refresh[api_settings.USER_ID_CLAIM]},
+            is_active=True,
+        ).first()
+        if user is None or refresh.get(VERSION_CLAIM, 0) != user.token_version:
+            raise InvalidToken("폐기된 토큰입니다.")
+        set_user_claims(refresh, user)
+        attrs["refresh"] = str(refresh)
+        return super().validate(attrs)
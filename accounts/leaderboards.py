@@ -0,0 +1,115 @@
+from django.utils import timezone
+from config.constants import LOCATION_CITY_CHOICES
+from .models import (
+    GLOBAL_BUCKET_CITY,
+    DistanceBucket,
+    DistanceRollup,
+    JoinedCrew,
+    bucket_floor,
+    distance_bucket,
+    period_starts,
+)
+
+
+"""
+거리 리더보드 (GET /accounts/leaderboard/)
+
+- 기록을 매번 합산하지 않고 DistanceRollup(유저별 주간/월간/전체 거리 합계)을 조회
+    - 합계는 Record 저장/삭제/일괄 추가 때 증감분만 반영 (accounts/models.py add_record_distances)
+    - 어긋나면 python manage.py rebuild_leaderboards 로 다시 계산
+- scope
+    - global: 전체 유저
+    - city: 거주지역별 (rollup 에 비정규화한 location_city, 유저가 지역을 바꾸면 시그널로 갱신)
+    - crew: 승인된(status="member") 크루원만
+- 순위는 거리 내림차순, 같은 거리는 같은 순위 (1, 2, 2, 4)
+    - 내 순위는 DistanceBucket(거리 구간별 행 수)으로 계산
+        - 내 구간보다 위 구간의 행 수 합 + 같은 구간 안에서 나보다 거리가 긴 행 수
+        - 구간은 거리가 2배가 될 때마다 32개라 구간 수는 거리 범위의 로그에 비례하고 순위와 무관
+        - 같은 구간 안은 (기간, 시작일[, 지역], 거리) 인덱스 범위로 셈 (구간 폭은 거리의 1/32 이하)
+        - 구간 개수는 합계와 같은 트랜잭션에서 증감, rollup 을 직접 고쳤으면 rebuild_leaderboards
+    - crew 는 구간을 따로 두지 않고 크루원 중 나보다 거리가 긴 행 수를 셈 (크루원 수에 비례)
+"""
+
+PERIOD_CHOICES = ("week", "month", "all")
+SCOPE_CHOICES = ("global", "city", "crew")
+CITY_CHOICES = tuple(city for city, _ in LOCATION_CITY_CHOICES)
+DEFAULT_SIZE = 50
+MAX_SIZE = 100
+
+
+class LeaderboardError(ValueError):
+    pass
+
+
+class Leaderboard:
+    def __init__(
+        self, period="week", scope="global", day=None, city=None, crew_id=None
+    ):
+        if period not in PERIOD_CHOICES:
+            raise LeaderboardError("period 는 week, month, all 중 하나여야 합니다.")
+        if scope not in SCOPE_CHOICES:
+            raise LeaderboardError("scope 는 global, city, crew 중 하나여야 합니다.")
+        if scope == "city" and city not in CITY_CHOICES:
+            raise LeaderboardError("지역(city)을 선택해 주세요.")
+        if scope == "crew" and crew_id is None:
+            raise LeaderboardError("크루(crew)를 선택해 주세요.")
+        self.period = period
+        self.scope = scope
+        self.period_start = period_starts(day or timezone.localdate())[period]
+        self.city = city if scope == "city" else None
+        self.crew_id = crew_id if scope == "crew" else None
+
+    def queryset(self):
+        return self._rows().filter(distance__gt=0)
+
+    # 거리 조건 없이 기간/범위만 건 합계 행
+    def _rows(self):
+        rows = DistanceRollup.objects.filter(
+            period=self.period, period_start=self.period_start
+        )
+        if self.scope == "city":
+            rows = rows.filter(location_city=self.city)
+        elif self.scope == "crew":
+            members = JoinedCrew.objects.filter(crew_id=self.crew_id, status="member")
+            rows = rows.filter(user__in=members.values("user"))
+        return rows
+
+    # 상위 size 명 (rank 속성 포함)
+    def top(self, size=DEFAULT_SIZE):
+        rows = list(
+            self.queryset()
+            .select_related("user")
+            .only("distance", "user__id", "user__nickname", "user__profile_image")
+            .order_by("-distance", "user_id")[:size]
+        )
+        rank, previous = 0, None
+        for position, row in enumerate(rows, 1):
+            if row.distance != previous:
+                rank, previous = position, row.distance
+            row.rank = rank
+        return rows
+
+    # 유저의 {"rank", "distance"}, 기록이 없으면 None
+    def rank_of(self, user_id):
+        distance = (
+            self.queryset()
+            .filter(user_id=user_id)
+            .values_list("distance", flat=True)
+            .first()
+        )
+        if distance is None:
+            return None
+        if self.scope == "crew":
+            above = self.queryset().filter(distance__gt=distance).count()
+        else:
+            bucket = distance_bucket(distance)
+            above = DistanceBucket.objects.count_above(
+                self.period, self.period_start, self.city or GLOBAL_BUCKET_CITY, bucket
+            )
+            # 범위 조건이 distance > 0 으로 잡히지 않도록 거리 조건은 구간 범위만 검
+            above += (
+                self._rows()
+                .filter(distance__gt=distance, distance__lt=bucket_floor(bucket + 1))
+                .count()
+            )
+        return {"rank": above + 1, "distance": distance}
@@ -0,0 +1,49 @@
+import bisect
+import threading
+import time
+from .models import LevelStep
+
+
+"""
+누적 거리 → 레벨 변환 테이블 (프로세스 내 캐시)
+
+- LevelStep 을 min_distance 순으로 정렬해 두고 bisect 로 O(log n) 조회
+- 레벨 구간은 [min_distance, max_distance) 로 겹치지 않는다고 가정
+    - 어느 구간에도 속하지 않으면 기존과 같이 마지막(pk 가 가장 큰) 레벨
+- LevelStep 이 저장/삭제되면 시그널로 무효화 (accounts/signals.py)
+    - 다른 워커 프로세스는 RELOAD_INTERVAL 초 안에 다시 읽음
+"""
+
+RELOAD_INTERVAL = 300
+
+
+class LevelTable:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded_at = None
+
+    def invalidate(self):
+        with self._lock:
+            self._loaded_at = None
+
+    def _load(self):
+        steps = sorted(LevelStep.objects.all(), key=lambda step: step.min_distance)
+        self._min_distances = [step.min_distance for step in steps]
+        self._steps = steps
+        self._fallback = max(steps, key=lambda step: step.pk) if steps else None
+        self._loaded_at = time.monotonic()
+
+    def resolve(self, total_distance):
+        with self._lock:
+            if (
+                self._loaded_at is None
+                or time.monotonic() - self._loaded_at > RELOAD_INTERVAL
+            ):
+                self._load()
+            index = bisect.bisect_right(self._min_distances, total_distance) - 1
+            if index >= 0 and total_distance < self._steps[index].max_distance:
+                return self._steps[index]
+            return self._fallback
+
+
+level_table = LevelTable()
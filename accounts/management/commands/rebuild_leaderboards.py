@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from accounts.models import DistanceRollup
+
+
+"""
+리더보드 합계 재계산 커맨드
+
+- DistanceRollup(유저별 주간/월간/전체 거리 합계)을 Record 기준으로 다시 만듦 (accounts/leaderboards.py)
+    - 기록 날짜는 운동 시작 시각, 없으면 작성 시각 (현지 시간 기준 주/월)
+    - 내 순위 계산용 DistanceBucket(거리 구간별 행 수)도 함께 다시 만듦
+- 사용법: python manage.py rebuild_leaderboards
+"""
+
+
+class Command(BaseCommand):
+    help = "리더보드용 기간별 거리 합계를 기록 기준으로 다시 계산합니다."
+
+    def handle(self, *args, **options):
+        created = DistanceRollup.objects.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f"기간별 거리 합계 {created}개를 다시 만들었습니다.")
+        )
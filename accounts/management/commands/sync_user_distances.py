@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from accounts.levels import level_table
+from accounts.models import CustomUser, LevelStep
+
+
+"""
+유저 누적 거리/레벨 재계산 커맨드
+
+- total_distance 를 Record 합계 기준으로 다시 맞춘 뒤 레벨 구간별로 레벨 갱신
+- 사용법: python manage.py sync_user_distances
+"""
+
+
+class Command(BaseCommand):
+    help = "유저의 total_distance 와 레벨을 기록 기준으로 재계산합니다."
+
+    def handle(self, *args, **options):
+        updated = CustomUser.objects.sync_total_distances()
+
+        level_table.invalidate()
+        steps = list(LevelStep.objects.order_by("-pk"))
+        if steps:
+            # 어느 구간에도 속하지 않는 유저는 마지막 레벨 (level_table.resolve 와 동일)
+            CustomUser.objects.update(level=steps[0])
+            for step in reversed(steps):
+                CustomUser.objects.filter(
+                    total_distance__gte=step.min_distance,
+                    total_distance__lt=step.max_distance,
+                ).update(level=step)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated}명의 누적 거리와 레벨을 갱신했습니다.")
+        )
@@ -1,4 +1,6 @@
 from django.contrib.auth.base_user import BaseUserManager
+from django.db.models import OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 
 
@@ -23,3 +25,17 @@ class CustomUserManager(BaseUserManager):
         if extra_fields.get("is_superuser") is not True:
             raise ValueError(_("Superuser must have is_superuser=True."))
         return self.create_user(email, password, **extra_fields)
+
+    # 누적 거리를 Record 합계 기준으로 다시 계산
+    def sync_total_distances(self, queryset=None):
+        record_model = self.model._meta.get_field("records").related_model
+        total_distance = (
+            record_model.objects.filter(user=OuterRef("pk"))
+            .values("user")
+            .annotate(total=Sum("distance"))
+            .values("total")
+        )
+        queryset = self.all() if queryset is None else queryset
+        return queryset.update(
+            total_distance=Coalesce(Subquery(total_distance), Value(0))
+        )
@@ -1,13 +1,23 @@
-from django.db import models
+import operator
+from collections import defaultdict
+from datetime import date, timedelta
+from functools import reduce
+from itertools import islice
+from django.db import models, transaction
+from django.db.models import Case, F, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, Trunc
+from django.utils import timezone
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
 from config.constants import (
     CREW_CHOICES,
     GENDER_CHOICES,
+    LEADERBOARD_PERIOD_CHOICES,
     USER_TYPE_CHOICES,
     LOCATION_CITY_CHOICES,
 )
+from config.images import validate_image_pixels
 from .managers import CustomUserManager
 from crews.models import Crew
 from races.models import Race
@@ -34,6 +44,11 @@ class JoinedCrew(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["crew", "status"], name="joinedcrew_crew_status_idx"),
+        ]
+
     def __str__(self):
         return f"{self.user.username} - {self.crew}"
 
@@ -59,12 +74,380 @@ class Record(models.Model):
     )
     description = models.TextField(null=True)  # 기록 설명
     distance = models.IntegerField(default=0)  # 거리 (m)
+    started_at = models.DateTimeField(null=True, blank=True)  # 운동 시작 시각
+    duration = models.IntegerField(null=True, blank=True)  # 경과 시간 (초)
+    moving_time = models.IntegerField(null=True, blank=True)  # 이동 시간 (초)
+    track = models.FileField(
+        upload_to="accounts/tracks/%Y/%m/%d/", null=True, blank=True
+    )  # GPS 트랙 바이너리 (config/tracks.py)
+    track_hash = models.CharField(max_length=40, blank=True)  # 트랙 내용 해시
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.user.username} - {self.distance}m"
 
+    # DB 에서 읽은 시점의 (유저, 날짜, 거리) 저장 (수정 시 누적 거리/리더보드 증감 계산용)
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        loaded = instance.__dict__
+        if all(name in loaded for name in CONTRIBUTION_FIELDS):
+            instance._loaded_contribution = instance.contribution()
+        return instance
+
+    # 이 기록이 누적 거리/리더보드에 반영하는 (유저, 날짜, 거리)
+    def contribution(self):
+        return (
+            self.user_id,
+            record_date(self.started_at, self.created_at),
+            self.distance,
+        )
+
+    # 저장/삭제 시 유저의 total_distance 와 기간별 합계를 전체 합산 대신 증감분만큼 갱신
+    def save(self, *args, **kwargs):
+        loaded = getattr(self, "_loaded_contribution", None)
+        with transaction.atomic():
+            if not self._state.adding and loaded is None:
+                row = (
+                    Record.objects.filter(pk=self.pk)
+                    .values_list(*CONTRIBUTION_FIELDS)
+                    .first()
+                )
+                if row is not None:
+                    user_id, distance, started_at, created_at = row
+                    loaded = (user_id, record_date(started_at, created_at), distance)
+            super().save(*args, **kwargs)
+            current = self.contribution()
+            changes = [current]
+            if loaded is not None:
+                changes.append((loaded[0], loaded[1], -loaded[2]))
+            add_record_distances(changes)
+        self._loaded_contribution = current
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            user_id, day, distance = self.contribution()
+            result = super().delete(*args, **kwargs)
+            add_record_distances([(user_id, day, -distance)])
+        return result
+
+
+CONTRIBUTION_FIELDS = ("user_id", "distance", "started_at", "created_at")
+
+
+# 기록의 날짜 (운동 시작 시각, 없으면 작성 시각 기준 현지 날짜)
+def record_date(started_at, created_at):
+    return timezone.localdate(started_at or created_at or timezone.now())
+
+
+def add_total_distance(user_id, delta):
+    if delta:
+        CustomUser.objects.filter(pk=user_id).update(
+            total_distance=F("total_distance") + delta
+        )
+
+
+# [(유저, 날짜, 증감 거리)] 를 누적 거리와 기간별 합계(리더보드)에 반영
+def add_record_distances(changes):
+    totals, buckets = defaultdict(int), defaultdict(int)
+    for user_id, day, delta in changes:
+        totals[user_id] += delta
+        for period, period_start in period_starts(day).items():
+            buckets[user_id, period, period_start] += delta
+    for user_id, delta in totals.items():
+        add_total_distance(user_id, delta)
+    DistanceRollup.objects.add_distances(buckets)
+
+
+# 날짜가 속한 {기간: 기간 시작일} (주는 월요일 시작)
+def period_starts(day):
+    return {
+        "week": day - timedelta(days=day.weekday()),
+        "month": day.replace(day=1),
+        "all": ALL_TIME_START,
+    }
+
+
+ALL_TIME_START = date(1970, 1, 1)
+ADD_DISTANCE_CHUNK = 200
+
+
+# 조건/CASE 가 너무 길면 SQLite 가 "Expression tree is too large" 로 실패하므로 나눠서 반영
+def chunked(items, size=ADD_DISTANCE_CHUNK):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+# [(조건 Q, 증감)] → 조건에 맞는 행의 증감값 (UPDATE ... SET x = x + CASE ... END)
+def delta_case(matches):
+    return Case(
+        *[When(match, then=Value(delta)) for match, delta in matches],
+        default=Value(0),
+        output_field=models.BigIntegerField(),
+    )
+
+
+class DistanceRollupQuerySet(models.QuerySet):
+    # {(유저, 기간, 기간 시작일): 증감 거리} 반영
+    # - ADD_DISTANCE_CHUNK 개마다 INSERT/SELECT/UPDATE 1회씩 + 순위 구간(DistanceBucket) 갱신
+    def add_distances(self, buckets):
+        buckets = [(key, delta) for key, delta in buckets.items() if delta]
+        for chunk in chunked(buckets):
+            with transaction.atomic(savepoint=False):
+                self._add_distances(chunk)
+
+    def _add_distances(self, buckets):
+        # 없는 행은 0 으로 먼저 만들고 (동시에 만들어도 충돌 무시) 한 번에 증감
+        self.bulk_create(
+            [
+                DistanceRollup(user_id=user_id, period=period, period_start=start)
+                for (user_id, period, start), _ in buckets
+            ],
+            ignore_conflicts=True,
+        )
+        matches = [
+            (Q(user_id=user_id, period=period, period_start=start), delta)
+            for (user_id, period, start), delta in buckets
+        ]
+        rows = self.filter(reduce(operator.or_, [match for match, _ in matches]))
+
+        # 바뀌기 전 거리/지역을 잠그고 읽어 순위 구간 개수를 옮김
+        deltas = dict(buckets)
+        counts = defaultdict(int)
+        for user_id, period, start, city, user_city, distance in (
+            rows.select_for_update(of=("self",))
+            .values_list(
+                "user_id",
+                "period",
+                "period_start",
+                "location_city",
+                "user__location_city",
+                "distance",
+            )
+            .iterator()
+        ):
+            for key in bucket_keys(period, start, city, distance):
+                counts[key] -= 1
+            new_distance = distance + deltas[user_id, period, start]
+            for key in bucket_keys(period, start, user_city, new_distance):
+                counts[key] += 1
+
+        city = CustomUser.objects.filter(pk=OuterRef("user_id")).values(
+            "location_city"
+        )
+        rows.update(
+            distance=F("distance") + delta_case(matches),
+            location_city=Subquery(city[:1]),
+        )
+        DistanceBucket.objects.add_counts(counts)
+
+    # 기록 전체에서 다시 계산 (python manage.py rebuild_leaderboards)
+    def rebuild(self, batch_size=1000):
+        rows = self._aggregate_records()
+        created = 0
+        with transaction.atomic():
+            self.all().delete()
+            while batch := list(islice(rows, batch_size)):
+                self.bulk_create(batch)
+                created += len(batch)
+            DistanceBucket.objects.rebuild()
+        return created
+
+    # 유저별 주간/월간/전체 합계를 DB 에서 GROUP BY 로 계산해 하나씩 반환
+    def _aggregate_records(self):
+        records = Record.objects.annotate(day=Coalesce("started_at", "created_at"))
+        cities = dict(CustomUser.objects.values_list("pk", "location_city"))
+        groups = [
+            records.annotate(period_start=Value(ALL_TIME_START)).values(
+                "user", "period_start"
+            )
+        ]
+        for period in ("week", "month"):
+            period_start = Trunc("day", period, output_field=models.DateField())
+            groups.append(
+                records.annotate(period_start=period_start).values(
+                    "user", "period_start"
+                )
+            )
+        for period, group in zip(("all", "week", "month"), groups):
+            for row in group.annotate(distance=Sum("distance")).iterator():
+                yield DistanceRollup(
+                    user_id=row["user"],
+                    period=period,
+                    period_start=row["period_start"],
+                    location_city=cities.get(row["user"]),
+                    distance=row["distance"],
+                )
+
+
+class DistanceRollup(models.Model):
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="distance_rollups",
+    )
+    period = models.CharField(max_length=5, choices=LEADERBOARD_PERIOD_CHOICES)
+    period_start = models.DateField()  # 주/월 시작일 (전체 기간은 ALL_TIME_START)
+    location_city = models.CharField(
+        max_length=30, choices=LOCATION_CITY_CHOICES, null=True
+    )  # 유저 거주지역 (비정규화, 지역별 순위용)
+    distance = models.BigIntegerField(default=0)  # 기간 내 기록 거리 합계 (m)
+
+    objects = DistanceRollupQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "period", "period_start"],
+                name="distancerollup_user_period_uniq",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["period", "period_start", "distance"],
+                name="distancerollup_rank_idx",
+            ),
+            models.Index(
+                fields=["period", "period_start", "location_city", "distance"],
+                name="distancerollup_city_rank_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.period} {self.period_start}: {self.distance}m"
+
+
+# 거리 → 순위 구간 번호 (거리가 2배가 될 때마다 BUCKETS_PER_DOUBLING 개 구간, 폭은 거리의 1/32 이하)
+# - 거리 < 2 * BUCKETS_PER_DOUBLING 이면 거리 그대로, 구간 번호 순서는 거리 순서와 같음
+def distance_bucket(distance):
+    shift = max(distance.bit_length() - 1 - BUCKET_BITS, 0)
+    return (shift << BUCKET_BITS) + (distance >> shift)
+
+
+# 순위 구간의 최소 거리 (distance_bucket 의 역)
+def bucket_floor(bucket):
+    shift = max((bucket >> BUCKET_BITS) - 1, 0)
+    return (bucket - (shift << BUCKET_BITS)) << shift
+
+
+# 합계 행이 속하는 순위 구간 키 (전체 + 지역), 거리가 0 이하면 순위에 없음
+def bucket_keys(period, period_start, city, distance):
+    if distance <= 0:
+        return []
+    bucket = distance_bucket(distance)
+    keys = [(period, period_start, GLOBAL_BUCKET_CITY, bucket)]
+    if city:
+        keys.append((period, period_start, city, bucket))
+    return keys
+
+
+BUCKET_BITS = 5
+BUCKETS_PER_DOUBLING = 1 << BUCKET_BITS
+GLOBAL_BUCKET_CITY = ""
+
+
+class DistanceBucketQuerySet(models.QuerySet):
+    # {(기간, 기간 시작일, 지역, 구간): 증감 행 수} 반영 (ADD_DISTANCE_CHUNK 개마다 INSERT 1회 + UPDATE 1회)
+    def add_counts(self, counts):
+        counts = [(key, delta) for key, delta in counts.items() if delta]
+        for chunk in chunked(counts):
+            self.bulk_create(
+                [
+                    DistanceBucket(
+                        period=period,
+                        period_start=start,
+                        location_city=city,
+                        bucket=bucket,
+                    )
+                    for (period, start, city, bucket), _ in chunk
+                ],
+                ignore_conflicts=True,
+            )
+            matches = [
+                (
+                    Q(
+                        period=period,
+                        period_start=start,
+                        location_city=city,
+                        bucket=bucket,
+                    ),
+                    delta,
+                )
+                for (period, start, city, bucket), delta in chunk
+            ]
+            self.filter(reduce(operator.or_, [match for match, _ in matches])).update(
+                count=F("count") + delta_case(matches)
+            )
+
+    # 합계 행에서 다시 계산 (DistanceRollup.objects.rebuild 에서 호출)
+    def rebuild(self):
+        counts = defaultdict(int)
+        rows = DistanceRollup.objects.filter(distance__gt=0).values_list(
+            "period", "period_start", "location_city", "distance"
+        )
+        for period, start, city, distance in rows.iterator():
+            for key in bucket_keys(period, start, city, distance):
+                counts[key] += 1
+        with transaction.atomic():
+            self.all().delete()
+            self.bulk_create(
+                [
+                    DistanceBucket(
+                        period=period,
+                        period_start=start,
+                        location_city=city,
+                        bucket=bucket,
+                        count=count,
+                    )
+                    for (period, start, city, bucket), count in counts.items()
+                ],
+                batch_size=1000,
+            )
+
+    # 구간이 bucket 보다 큰(거리가 더 긴) 행 수
+    def count_above(self, period, period_start, city, bucket):
+        return (
+            self.filter(
+                period=period,
+                period_start=period_start,
+                location_city=city,
+                bucket__gt=bucket,
+            ).aggregate(total=Sum("count"))["total"]
+            or 0
+        )
+
+
+# 기간/지역별 순위 구간마다 합계 행 수 (accounts/leaderboards.py 내 순위 계산용)
+# - location_city 가 GLOBAL_BUCKET_CITY("") 이면 전체, 아니면 그 지역
+class DistanceBucket(models.Model):
+    period = models.CharField(max_length=5, choices=LEADERBOARD_PERIOD_CHOICES)
+    period_start = models.DateField()
+    location_city = models.CharField(
+        max_length=30, choices=LOCATION_CITY_CHOICES, blank=True
+    )
+    bucket = models.IntegerField()  # distance_bucket(거리)
+    count = models.BigIntegerField(default=0)  # 구간에 속한 거리 > 0 인 합계 행 수
+
+    objects = DistanceBucketQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["period", "period_start", "location_city", "bucket"],
+                name="distancebucket_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.period} {self.period_start} {self.location_city} #{self.bucket}"
+
+
+# 바뀌면 이전 JWT 를 폐기할 필드 (accounts/authentication.py)
+TOKEN_REVOKING_FIELDS = ("user_type", "is_staff", "is_active", "password")
+# F() 로만 갱신하는 필드 (CustomUser.save)
+F_ONLY_FIELDS = ("total_distance", "token_version")
+
 
 class CustomUser(AbstractUser):
     email = models.EmailField(_("email address"), unique=True)
@@ -95,9 +478,63 @@ class CustomUser(AbstractUser):
         max_length=20, null=True
     )  # 전화번호 (010-1234-5678 형식)
     level = models.ForeignKey(LevelStep, on_delete=models.SET_NULL, null=True)  # 레벨
+    total_distance = models.BigIntegerField(default=0)  # 누적 거리 (m, Record 합계)
+    token_version = models.PositiveIntegerField(
+        default=0
+    )  # JWT 버전 (올리면 이전 토큰 폐기, accounts/authentication.py)
     profile_image = models.ImageField(
-        upload_to="accounts/profile/%Y/%m/%d/", null=True
+        upload_to="accounts/profile/%Y/%m/%d/",
+        null=True,
+        validators=[validate_image_pixels],
     )  # 프로필 이미지
 
     def __str__(self):
         return f"{self.email} / {self.username}"
+
+    # DB 에서 읽은 시점의 닉네임 저장 (닉네임 변경 시 캐시 무효화용, home/signals.py)
+    # 토큰 폐기 필드도 저장 (저장 시 다시 조회하지 않고 비교, accounts/signals.py)
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        loaded = instance.__dict__
+        if "nickname" in loaded:
+            instance._loaded_nickname = instance.nickname
+        instance._loaded_token_fields = {
+            field: loaded[field] for field in TOKEN_REVOKING_FIELDS if field in loaded
+        }
+        return instance
+
+    # total_distance, token_version 은 F() 로만 갱신하므로
+    # update_fields 없이 저장할 때 오래된 값으로 덮어쓰지 않도록 제외
+    # - 지연 로딩 필드가 있으면 Django 처럼 읽어 둔 필드만 저장 (지연 필드를 조회하지 않음)
+    # - 없으면 UPDATE 에서만 빼고, 행이 없으면 Django 기본 동작대로 INSERT
+    def save(self, *args, **kwargs):
+        deferred = self.get_deferred_fields()
+        if (
+            deferred
+            and not self._state.adding
+            and kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+        ):
+            kwargs["update_fields"] = [
+                field.attname
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and field.name not in F_ONLY_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        if update_fields is None:
+            values = [value for value in values if value[0].name not in F_ONLY_FIELDS]
+        return super()._do_update(
+            base_qs, using, pk_val, values, update_fields, forced_update
+        )
+
+    # 토큰 클레임으로 만든 유저는 클레임 밖의 필드에 처음 접근할 때 나머지 필드를 한 번에 조회
+    def refresh_from_db(self, using=None, fields=None):
+        if fields is not None and getattr(self, "_from_token_claims", False):
+            self._from_token_claims = False
+            fields = self.get_deferred_fields()
+        super().refresh_from_db(using, fields)
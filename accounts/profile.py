@@ -0,0 +1,161 @@
+from django.db.models import Prefetch
+from rest_framework.pagination import CursorPagination
+from boards.models import Comment, Like, Post, comment_count_subquery
+from boards.serializers import (
+    PostListSerializer,
+    ProfileCommentSerializer,
+    ProfileLikedPostSerializer,
+)
+from crews.models import CrewReview
+from crews.serializers import ProfileCrewReviewSerializer
+from races.models import RaceReview
+from races.serializers import ProfileRaceReviewSerializer
+from .models import CustomUser, JoinedCrew
+from .serializers import OpenProfileSerializer
+
+
+"""
+오픈프로필 섹션
+
+- ?include=user,posts,comments,reviews,likes 로 필요한 섹션만 조회 (생략 시 전체)
+    - 포함하지 않은 섹션은 쿼리하지 않음
+    - likes 는 본인일 때만 포함
+- 목록 섹션은 각각 커서 페이지네이션 (-id 순, ?posts_cursor=, ?comments_cursor= ...)
+    - 응답의 next/previous 링크로 해당 섹션만 이어서 불러옴 (예: ?include=posts&posts_cursor=...)
+- 섹션마다 select_related/annotate 로 페이지 크기와 무관하게 쿼리 수 일정
+    - 댓글 수는 상관 서브쿼리라 전체 글이 아니라 페이지에 포함된 글만 계산
+- 섹션은 서로 독립적이라 비동기 뷰(profile_async)에서는 동시에 조회 (config/async_sections.py)
+"""
+
+SECTION_CHOICES = ("user", "posts", "comments", "reviews", "likes")
+
+
+class ProfileSectionPagination(CursorPagination):
+    page_size = 10
+    page_size_query_param = "size"
+    max_page_size = 50
+    ordering = "-id"
+
+    def __init__(self, section):
+        self.cursor_query_param = f"{section}_cursor"
+
+    def get_page_data(self, queryset, request, serializer_class, context):
+        page = self.paginate_queryset(queryset, request)
+        return {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": serializer_class(page, many=True, context=context).data,
+        }
+
+
+def parse_include(value):
+    if not value:
+        return set(SECTION_CHOICES)
+    return {section for section in value.split(",") if section in SECTION_CHOICES}
+
+
+def get_profile_user(pk):
+    return (
+        CustomUser.objects.select_related("level")
+        .prefetch_related(
+            Prefetch("crews", queryset=JoinedCrew.objects.select_related("crew"))
+        )
+        .get(pk=pk)
+    )
+
+
+def _posts(user_id):
+    return (
+        Post.objects.filter(author_id=user_id)
+        .select_related("author")
+        .with_comment_count()
+    )
+
+
+def _comments(user_id):
+    return Comment.objects.filter(author_id=user_id).select_related("post__author")
+
+
+def _crew_reviews(user_id):
+    return CrewReview.objects.filter(author_id=user_id).select_related("crew")
+
+
+def _race_reviews(user_id):
+    return RaceReview.objects.filter(author_id=user_id).select_related("race")
+
+
+def _likes(user_id):
+    return (
+        Like.objects.filter(author_id=user_id)
+        .select_related("post__author")
+        .annotate(annotated_comment_count=comment_count_subquery("post_id"))
+    )
+
+
+# 목록 섹션 이름(= 커서 파라미터 접두어): (쿼리셋 생성 함수, 시리얼라이저)
+LIST_SECTIONS = {
+    "posts": (_posts, PostListSerializer),
+    "comments": (_comments, ProfileCommentSerializer),
+    "crew_reviews": (_crew_reviews, ProfileCrewReviewSerializer),
+    "race_reviews": (_race_reviews, ProfileRaceReviewSerializer),
+    "likes": (_likes, ProfileLikedPostSerializer),
+}
+
+
+def get_section_page(name, user_id, request, context):
+    get_queryset, serializer_class = LIST_SECTIONS[name]
+    paginator = ProfileSectionPagination(name)
+    return paginator.get_page_data(
+        get_queryset(user_id), request, serializer_class, context
+    )
+
+
+# 유저 섹션 (없는 유저면 None, user 를 포함하지 않으면 존재 여부만 확인해 {})
+def get_user_section(pk, include, request):
+    if "user" not in include:
+        return {} if CustomUser.objects.filter(pk=pk).exists() else None
+    try:
+        user = get_profile_user(pk)
+    except CustomUser.DoesNotExist:
+        return None
+    return OpenProfileSerializer(user, context={"request": request}).data
+
+
+# 목록 섹션 이름: 데이터를 만드는 함수 (섹션마다 context 를 따로 만들어 스레드 간 공유하지 않음)
+def get_list_section_loaders(user_pk, include, request):
+    names = []
+    if "posts" in include:
+        names.append("posts")
+    if "comments" in include:
+        names.append("comments")
+    if "reviews" in include:
+        names += ["crew_reviews", "race_reviews"]
+    # request.user와 pk가 일치하는 경우에만 'likes' 항목을 추가
+    if "likes" in include and request.user.pk == user_pk:
+        names.append("likes")
+    return {
+        name: (
+            lambda name=name: get_section_page(
+                name, user_pk, request, {"request": request}
+            )
+        )
+        for name in names
+    }
+
+
+# 섹션 결과를 응답 형태로 조합
+def build_profile_data(user_data, sections):
+    fin_data = {}
+    if user_data:
+        fin_data["user"] = user_data
+    for name in ("posts", "comments"):
+        if name in sections:
+            fin_data[name] = sections[name]
+    if "crew_reviews" in sections:
+        fin_data["reviews"] = {
+            "crew": sections["crew_reviews"],
+            "race": sections["race_reviews"],
+        }
+    if "likes" in sections:
+        fin_data["likes"] = sections["likes"]
+    return fin_data
@@ -1,8 +1,20 @@
+import os
 from dj_rest_auth.serializers import UserDetailsSerializer
 from dj_rest_auth.registration.serializers import RegisterSerializer
+from django.db import transaction
 from rest_framework import serializers
-from django.db.models import Sum
-from .models import CustomUser, LevelStep, Record, JoinedCrew, JoinedRace
+from config.images import ImageVariantsField, build_image_url
+from config.tracks import TrackError, iter_track_files, parse_track, track_file
+from .levels import level_table
+from .models import (
+    CustomUser,
+    DistanceRollup,
+    LevelStep,
+    Record,
+    JoinedCrew,
+    JoinedRace,
+    add_record_distances,
+)
 
 
 class CustomRegisterSerializer(RegisterSerializer):
@@ -49,7 +61,8 @@ class LevelStepSerializer(serializers.ModelSerializer):
 
 class ProfileSerializer(serializers.ModelSerializer):
     level = LevelStepSerializer(read_only=True)
-    distance = serializers.SerializerMethodField()
+    distance = serializers.IntegerField(source="total_distance", read_only=True)
+    profile_image_variants = ImageVariantsField(source="profile_image")
 
     class Meta:
         model = CustomUser
@@ -63,23 +76,29 @@ class ProfileSerializer(serializers.ModelSerializer):
             "distance",
             "level",
             "profile_image",
+            "profile_image_variants",
         ]
 
-    def get_distance(self, obj):
-        # 모든 Record 객체의 distance를 합산합니다.
-        # 이 코드는 distance 필드가 Record 모델에 있는 정수 필드라고 가정합니다.
-        return (
-            Record.objects.filter(user=obj).aggregate(total_distance=Sum("distance"))[
-                "total_distance"
-            ]
-            or 0
-        )
-
 
 class RecordSerialiser(serializers.ModelSerializer):
+    has_track = serializers.SerializerMethodField()
+
+    def get_has_track(self, obj):
+        return bool(obj.track)
+
     class Meta:
         model = Record
-        fields = ["id", "user", "created_at", "description", "distance"]
+        fields = [
+            "id",
+            "user",
+            "created_at",
+            "description",
+            "distance",
+            "started_at",
+            "duration",
+            "moving_time",
+            "has_track",
+        ]
         read_only_fields = ["user"]
 
     def save(self, **kwargs):
@@ -87,21 +106,112 @@ class RecordSerialiser(serializers.ModelSerializer):
         self.update_user_level(record.user)
         return record
 
+    # 누적 거리(Record 저장 시 증감분으로 갱신됨)로 레벨 결정. 기록 수와 무관하게 일정 비용
     def update_user_level(self, user):
-        total_distance = (
-            Record.objects.filter(user=user).aggregate(total_distance=Sum("distance"))[
-                "total_distance"
-            ]
-            or 0
-        )
-        user.level = LevelStep.objects.filter(
-            min_distance__lte=total_distance, max_distance__gt=total_distance
-        ).first()
-
-        if user.level is None:
-            user.level = LevelStep.objects.order_by("-pk").first()
-
-        user.save()
+        user.total_distance = CustomUser.objects.values_list(
+            "total_distance", flat=True
+        ).get(pk=user.pk)
+        level = level_table.resolve(user.total_distance)
+        if user.level_id != (level.pk if level else None):
+            user.level = level
+            CustomUser.objects.filter(pk=user.pk).update(level=level)
+
+
+"""
+기록 일괄 추가 (워치 기록 동기화, POST /accounts/mypage/record/bulk/)
+
+- 항목마다 RecordSerialiser 로 검증하고, 유효한 항목만 한 트랜잭션에서 bulk_create
+    - bulk_create 는 Record.save() 를 거치지 않으므로 누적 거리/기간별 합계는 한 번에, 레벨도 한 번만 갱신
+- 결과는 요청 순서대로 {"index", "status": "created"|"invalid", "record"|"errors"}
+
+GPS 트랙 업로드 (POST /accounts/mypage/record/upload/)
+
+- GPX/TCX 파일 또는 그 파일들을 묶은 zip 을 파일마다 기록 하나로 변환 (config/tracks.py)
+    - 거리/경과 시간/이동 시간/시작 시각은 트랙에서 계산, 설명은 트랙 이름(없으면 파일 이름)
+    - 트랙은 DB 행 대신 Record.track 바이너리 파일 하나로 저장
+- 저장은 일괄 추가와 같은 경로(insert_records), 결과에는 "name"(파일 이름)이 추가됨
+"""
+
+MAX_BULK_RECORDS = 1000
+
+
+def bulk_create_records(user, items):
+    results, records = [], []
+    for index, item in enumerate(items):
+        serializer = RecordSerialiser(data=item)
+        if serializer.is_valid():
+            records.append(Record(user=user, **serializer.validated_data))
+            results.append({"index": index, "status": "created"})
+        else:
+            results.append(
+                {"index": index, "status": "invalid", "errors": serializer.errors}
+            )
+    return insert_records(user, records, results)
+
+
+# 유효한 기록을 한 번에 저장하고 "created" 결과에 저장된 기록을 채움
+def insert_records(user, records, results):
+    if not records:
+        return results, 0
+
+    try:
+        with transaction.atomic():
+            Record.objects.bulk_create(records)
+            add_record_distances([record.contribution() for record in records])
+            RecordSerialiser().update_user_level(user)
+    except Exception:
+        # bulk_create 중 저장된 트랙 파일 정리
+        for record in records:
+            if record.track and record.track._committed:
+                record.track.delete(save=False)
+        raise
+    created = iter(records)
+    for result in results:
+        if result["status"] == "created":
+            result["record"] = RecordSerialiser(next(created)).data
+    return results, len(records)
+
+
+def _track_record(user, name, file):
+    track = parse_track(file)
+    summary = track.summary()
+    description = track.name or os.path.splitext(os.path.basename(name))[0]
+    content, digest = track_file(track)
+    return Record(
+        user=user,
+        description=description,
+        distance=round(summary["distance"]),
+        started_at=summary["started_at"],
+        duration=_seconds(summary["duration"]),
+        moving_time=_seconds(summary["moving_time"]),
+        track=content,
+        track_hash=digest,
+    )
+
+
+def _seconds(value):
+    return None if value is None else round(value)
+
+
+# 업로드 파일 목록 → (결과, 추가된 수), 파일이 MAX_BULK_RECORDS 개를 넘으면 TrackError
+def create_records_from_tracks(user, uploads):
+    results, records = [], []
+    for upload in uploads:
+        for name, file in iter_track_files(upload):
+            if len(results) >= MAX_BULK_RECORDS:
+                raise TrackError(
+                    f"한 번에 최대 {MAX_BULK_RECORDS}개까지 추가할 수 있습니다."
+                )
+            result = {"index": len(results), "name": name}
+            try:
+                if isinstance(file, TrackError):
+                    raise file
+                records.append(_track_record(user, name, file))
+                result["status"] = "created"
+            except TrackError as error:
+                result.update(status="invalid", errors={"file": [str(error)]})
+            results.append(result)
+    return insert_records(user, records, results)
 
 
 class JoinedCrewSerializer(serializers.ModelSerializer):
@@ -112,13 +222,13 @@ class JoinedCrewSerializer(serializers.ModelSerializer):
     meet_days = serializers.SerializerMethodField()
     meet_time = serializers.CharField(source="crew.meet_time")
     thumbnail_image = serializers.SerializerMethodField()
+    thumbnail_image_variants = ImageVariantsField(source="crew.thumbnail_image")
 
     def get_meet_days(self, obj):
         return obj.crew.meet_days
 
     def get_thumbnail_image(self, obj):
-        request = self.context.get("request")
-        return request.build_absolute_uri(obj.crew.thumbnail_image.url)
+        return build_image_url(self.context.get("request"), obj.crew.thumbnail_image)
 
     class Meta:
         model = JoinedCrew
@@ -131,6 +241,7 @@ class JoinedCrewSerializer(serializers.ModelSerializer):
             "meet_days",
             "meet_time",
             "thumbnail_image",
+            "thumbnail_image_variants",
         ]
         read_only_fields = ["user"]
 
@@ -149,13 +260,13 @@ class JoinedRaceGetSerializer(serializers.ModelSerializer):
     courses = serializers.SerializerMethodField()
     record = serializers.CharField(source="race_record")
     thumbnail_image = serializers.SerializerMethodField()
+    thumbnail_image_variants = ImageVariantsField(source="race.thumbnail_image")
 
     def get_courses(self, obj):
         return obj.race.courses
 
     def get_thumbnail_image(self, obj):
-        request = self.context.get("request")
-        return request.build_absolute_uri(obj.race.thumbnail_image.url)
+        return build_image_url(self.context.get("request"), obj.race.thumbnail_image)
 
     class Meta:
         model = JoinedRace
@@ -173,6 +284,7 @@ class JoinedRaceGetSerializer(serializers.ModelSerializer):
             "courses",
             "record",
             "thumbnail_image",
+            "thumbnail_image_variants",
         ]
 
 
@@ -198,5 +310,29 @@ class OpenProfileSerializer(ProfileSerializer):
             "distance",
             "level",
             "profile_image",
+            "profile_image_variants",
             "crew",
         ]
+
+
+# 리더보드 항목 (rank 는 Leaderboard.top 에서 설정, accounts/leaderboards.py)
+class LeaderboardEntrySerializer(serializers.ModelSerializer):
+    rank = serializers.IntegerField(read_only=True)
+    user_id = serializers.IntegerField(read_only=True)
+    nickname = serializers.CharField(source="user.nickname", read_only=True)
+    profile_image = serializers.SerializerMethodField()
+    profile_image_variants = ImageVariantsField(source="user.profile_image")
+
+    def get_profile_image(self, obj):
+        return build_image_url(self.context.get("request"), obj.user.profile_image)
+
+    class Meta:
+        model = DistanceRollup
+        fields = [
+            "rank",
+            "user_id",
+            "nickname",
+            "profile_image",
+            "profile_image_variants",
+            "distance",
+        ]
@@ -0,0 +1,118 @@
+from collections import defaultdict
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete, pre_save
+from django.dispatch import receiver
+from config.images import build_variants_on_save
+from .authentication import forget_token_version, revoke_tokens
+from .levels import level_table
+from .models import (
+    CustomUser,
+    DistanceBucket,
+    DistanceRollup,
+    LevelStep,
+    Record,
+    TOKEN_REVOKING_FIELDS,
+    bucket_keys,
+)
+
+# 프로필 이미지 변형 생성 (config/images.py)
+build_variants_on_save(CustomUser, "profile_image")
+
+
+# 레벨 구간이 바뀌면 레벨 테이블 캐시 무효화
+@receiver(post_save, sender=LevelStep)
+@receiver(post_delete, sender=LevelStep)
+def invalidate_level_table(sender, **kwargs):
+    level_table.invalidate()
+
+
+# 권한/인증 관련 필드가 바뀌는지 저장 전에 확인
+# - DB 에서 읽은 값(CustomUser.from_db)과 비교하고, 읽은 값이 없는 필드만 조회
+@receiver(pre_save, sender=CustomUser)
+def check_token_revoking_fields(sender, instance, raw, update_fields, **kwargs):
+    instance._revoke_tokens = False
+    if raw or instance._state.adding:
+        return
+    fields = [
+        field
+        for field in TOKEN_REVOKING_FIELDS
+        if update_fields is None or field in update_fields
+    ]
+    loaded = getattr(instance, "_loaded_token_fields", {})
+    saved = {field: loaded[field] for field in fields if field in loaded}
+    unknown = [field for field in fields if field not in loaded]
+    if unknown and not _changed(instance, saved):
+        row = CustomUser.objects.filter(pk=instance.pk).values(*unknown).first()
+        if row is None:
+            return
+        saved.update(row)
+    instance._revoke_tokens = _changed(instance, saved)
+
+
+def _changed(instance, saved):
+    return any(value != getattr(instance, field) for field, value in saved.items())
+
+
+@receiver(post_save, sender=CustomUser)
+def revoke_changed_user_tokens(sender, instance, created, update_fields, **kwargs):
+    if getattr(instance, "_revoke_tokens", False):
+        instance._revoke_tokens = False
+        revoke_tokens(instance.pk)
+        instance.token_version += 1
+    # 저장한 필드의 비교 기준을 지금 값으로
+    instance._loaded_token_fields = {
+        **getattr(instance, "_loaded_token_fields", {}),
+        **{
+            field: getattr(instance, field)
+            for field in TOKEN_REVOKING_FIELDS
+            if field in instance.__dict__
+            and (update_fields is None or field in update_fields)
+        },
+    }
+
+
+# 거주지역이 바뀌면 지역별 리더보드용 rollup 의 지역과 순위 구간도 갱신 (accounts/leaderboards.py)
+@receiver(post_save, sender=CustomUser)
+def sync_rollup_city(sender, instance, created, raw, update_fields, **kwargs):
+    if created or raw or "location_city" in instance.get_deferred_fields():
+        return
+    if update_fields is not None and "location_city" not in update_fields:
+        return
+    city = instance.location_city
+    rows = DistanceRollup.objects.filter(user=instance).exclude(location_city=city)
+    counts = defaultdict(int)
+    with transaction.atomic():
+        for period, start, old_city, distance in rows.values_list(
+            "period", "period_start", "location_city", "distance"
+        ):
+            for key in bucket_keys(period, start, old_city, distance):
+                counts[key] -= 1
+            for key in bucket_keys(period, start, city, distance):
+                counts[key] += 1
+        rows.update(location_city=city)
+        DistanceBucket.objects.add_counts(counts)
+
+
+# 탈퇴하면 rollup 이 함께 지워지므로 순위 구간에서 미리 빼기
+@receiver(pre_delete, sender=CustomUser)
+def remove_user_from_buckets(sender, instance, **kwargs):
+    counts = defaultdict(int)
+    for period, start, city, distance in DistanceRollup.objects.filter(
+        user=instance
+    ).values_list("period", "period_start", "location_city", "distance"):
+        for key in bucket_keys(period, start, city, distance):
+            counts[key] -= 1
+    DistanceBucket.objects.add_counts(counts)
+
+
+@receiver(post_delete, sender=CustomUser)
+def forget_deleted_user_token_version(sender, instance, **kwargs):
+    forget_token_version(instance.pk)
+
+
+# 기록이 삭제되면 커밋 후 트랙 파일 삭제 (config/tracks.py)
+@receiver(post_delete, sender=Record)
+def delete_record_track(sender, instance, **kwargs):
+    if instance.track:
+        storage, name = instance.track.storage, instance.track.name
+        transaction.on_commit(lambda: storage.delete(name))
@@ -1,9 +1,54 @@
-from django.test import TestCase
+import shutil
+import tempfile
+import threading
+import zipfile
+from io import BytesIO, StringIO
+import numpy as np
+from unittest import mock
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 from rest_framework import status
-from accounts.models import CustomUser, Record, JoinedCrew, JoinedRace, LevelStep
-from crews.models import Crew, CrewFavorite
-from races.models import Race, RaceFavorite
+from datetime import datetime, timedelta
+from django.core.management import call_command
+from django.utils import timezone
+from accounts.models import (
+    CustomUser,
+    DistanceRollup,
+    Record,
+    JoinedCrew,
+    DistanceBucket,
+    JoinedRace,
+    LevelStep,
+    bucket_floor,
+    distance_bucket,
+    period_starts,
+)
+from crews.models import Crew, CrewFavorite, CrewReview
+from races.models import Race, RaceFavorite, RaceReview
+from boards.models import Post, Comment, Like
+from config import async_sections
+from config.query_budget import QueryBudgetTestMixin
+from config.tracks import (
+    Track,
+    decode_track,
+    encode_track,
+    load_track,
+    parse_track,
+)
+from .analysis import analyze_track
+from .leaderboards import Leaderboard
+from django.core.cache import cache
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework.exceptions import AuthenticationFailed
+from .authentication import (
+    ClaimsJWTAuthentication,
+    ClaimsTokenObtainPairSerializer,
+    revoke_tokens,
+)
+from .views import RecordViewSet
 
 
 class BaseTestCase(TestCase):
@@ -170,6 +215,122 @@ class MypageInfoTestCase(BaseTestCase):
         print("----------------------------------------------------- 완료")
 
 
+class ClaimsJWTAuthenticationTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.user.nickname = "러너1"
+        self.user.user_type = "crew"
+        self.user.save()
+
+    def login(self):
+        response = self.client.post(
+            "/accounts/login/", {"email": "test1@test.com", "password": "test1234!"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["access_token"], response.data["refresh_token"]
+
+    def authenticate(self, access_token):
+        authentication = ClaimsJWTAuthentication()
+        return authentication.get_user(
+            authentication.get_validated_token(access_token.encode())
+        )
+
+    # 클레임으로 유저를 만들고, 클레임 밖의 필드는 처음 접근할 때 한 번에 조회
+    def test_user_from_claims(self):
+        print("[클레임 기반 JWT 인증 테스트]")
+        access_token, _ = self.login()
+        with self.assertNumQueries(1):  # token_version 캐시 미스
+            user = self.authenticate(access_token)
+        with self.assertNumQueries(0):
+            user = self.authenticate(access_token)
+            self.assertEqual(user, self.user)
+            self.assertEqual(user.user_type, "crew")
+            self.assertEqual(user.nickname, "러너1")
+            self.assertFalse(user.is_staff)
+        with self.assertNumQueries(1):
+            self.assertEqual(user.email, "test1@test.com")
+            self.assertEqual(user.level_id, self.level1.id)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+        response = self.client.get("/accounts/mypage/info/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        print("----------------------------------------------------- 완료")
+
+    # 권한 필드가 바뀌면 이전 토큰 폐기, 닉네임은 갱신 시 반영
+    def test_revoke_and_refresh(self):
+        print("[JWT 폐기/갱신 테스트]")
+        access_token, refresh_token = self.login()
+        self.user.nickname = "새닉네임"
+        self.user.save()
+        response = self.client.post(
+            "/accounts/token/refresh/", {"refresh": refresh_token}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.authenticate(response.data["access"]).nickname, "새닉네임")
+        self.assertEqual(self.authenticate(access_token).nickname, "러너1")
+
+        self.user.user_type = "normal"
+        with self.captureOnCommitCallbacks(execute=True):  # 캐시된 버전은 커밋 후 삭제
+            self.user.save()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+        response = self.client.get("/accounts/mypage/info/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.credentials()
+        response = self.client.post(
+            "/accounts/token/refresh/", {"refresh": refresh_token}
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        access_token, _ = self.login()
+        self.assertEqual(self.authenticate(access_token).user_type, "normal")
+        print("----------------------------------------------------- 완료")
+
+    # 폐기 시 캐시된 버전은 커밋 후 삭제, 저장 시 폐기 필드는 읽은 값과 비교
+    def test_revoke_after_commit(self):
+        print("[JWT 폐기 커밋 후 반영 테스트]")
+        print(">> 커밋 전에는 캐시된 버전을 지우지 않고 커밋 후 지운다.")
+        access_token, _ = self.login()
+        self.authenticate(access_token)
+        key = f"auth:token_version:{self.user.pk}"
+        self.assertIsNotNone(cache.get(key))
+        with self.captureOnCommitCallbacks() as callbacks:
+            revoke_tokens(self.user.pk)
+            self.assertIsNotNone(cache.get(key))
+        for callback in callbacks:
+            callback()
+        self.assertIsNone(cache.get(key))
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(access_token)
+
+        print(">> DB 에서 읽은 유저를 저장할 때 폐기 필드를 다시 조회하지 않는다.")
+        user = CustomUser.objects.get(pk=self.user.pk)
+        user.nickname = "새닉네임"
+        with CaptureQueriesContext(connection) as context:
+            user.save()
+        self.assertFalse(
+            [
+                query
+                for query in context.captured_queries
+                if query["sql"].startswith('SELECT "accounts_customuser"."user_type"')
+            ]
+        )
+        user.is_staff = True
+        user.save()
+        self.assertEqual(
+            CustomUser.objects.get(pk=user.pk).token_version, user.token_version
+        )
+        self.assertEqual(user.token_version, self.user.token_version + 2)
+        print("----------------------------------------------------- 완료")
+
+    # 클레임이 없는 이전 토큰은 DB 에서 유저 조회
+    def test_token_without_claims(self):
+        access_token = str(RefreshToken.for_user(self.user).access_token)
+        with self.assertNumQueries(1):
+            user = self.authenticate(access_token)
+        self.assertEqual(user.email, "test1@test.com")
+
+
 class MypageRecordTestCase(BaseTestCase):
     def setUp(self):
         super().setUp()
@@ -250,6 +411,644 @@ class MypageRecordTestCase(BaseTestCase):
         print(response.data)
         print("----------------------------------------------------- 완료")
 
+    def test_record_updates_total_distance_and_level(self):
+        print("[기록 누적 거리/레벨 테스트]")
+        print(">> 기록 추가/수정/삭제 시 누적 거리와 레벨이 증감분만큼 갱신된다.")
+        self.client.force_authenticate(user=self.user)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.total_distance, 880)
+
+        response = self.client.post(
+            "/accounts/mypage/record/",
+            data={"description": "record 4", "distance": 200},
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.total_distance, 1080)
+        self.assertEqual(self.user.level, self.level2)
+
+        response = self.client.patch(
+            f"/accounts/mypage/record/{self.record1.id}/", data={"distance": 100}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.total_distance, 380)
+        self.assertEqual(self.user.level, self.level1)
+
+        self.client.delete(f"/accounts/mypage/record/{self.record2.id}/")
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.total_distance, 300)
+
+        response = self.client.get("/accounts/mypage/info/")
+        self.assertEqual(response.data["distance"], 300)
+        print("----------------------------------------------------- 완료")
+
+    def test_user_save_keeps_counters(self):
+        print("[유저 저장 시 누적 거리 보존 테스트]")
+        print(">> 기록 추가 전에 읽은 유저를 저장해도 누적 거리를 덮어쓰지 않는다.")
+        stale = CustomUser.objects.get(pk=self.user.pk)
+        Record.objects.create(user=self.user, distance=120)
+        stale.nickname = "오래된 인스턴스"
+        stale.save()
+        self.assertEqual(CustomUser.objects.get(pk=self.user.pk).total_distance, 1000)
+
+        print(">> 일부 필드만 읽은 유저는 지연 필드를 조회하지 않고 읽은 필드만 저장한다.")
+        # is_active 는 자동완성 인덱스 시그널(search/signals.py)이 읽으므로 함께 읽어 둠
+        partial = CustomUser.objects.only(
+            "nickname", "is_active", "total_distance"
+        ).get(pk=self.user.pk)
+        partial.nickname = "일부만"
+        with CaptureQueriesContext(connection) as context:
+            partial.save()
+        queries = [query["sql"] for query in context.captured_queries]
+        self.assertFalse([sql for sql in queries if sql.startswith("SELECT")])
+        self.assertTrue(queries[0].startswith('UPDATE "accounts_customuser"'))
+        self.assertNotIn("total_distance", queries[0])
+        self.assertNotIn("email", queries[0])
+        self.assertEqual(CustomUser.objects.get(pk=self.user.pk).nickname, "일부만")
+
+        print(">> 행이 없으면 Django 기본 동작대로 다시 INSERT 한다.")
+        CustomUser.objects.filter(pk=self.user2.pk).delete()
+        self.user2.save()
+        self.assertTrue(CustomUser.objects.filter(pk=self.user2.pk).exists())
+        print("----------------------------------------------------- 완료")
+
+
+class MypageRecordBulkTestCase(BaseTestCase):
+    def post_bulk(self, items):
+        return self.client.post("/accounts/mypage/record/bulk/", items, format="json")
+
+    def test_bulk_post_record(self):
+        print("[기록 일괄 POST 테스트]")
+        print(">> 유효한 기록만 한 번에 추가하고 누적 거리/레벨은 한 번만 갱신한다.")
+        response = self.post_bulk([{"distance": 100}])
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.client.force_authenticate(user=self.user)
+        items = [{"description": f"run {i}", "distance": 50} for i in range(4)]
+        response = self.post_bulk(items)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 4)
+        results = response.data["results"]
+        self.assertEqual([result["status"] for result in results], ["created"] * 4)
+        self.assertEqual(results[3]["record"]["description"], "run 3")
+        self.assertTrue(Record.objects.filter(pk=results[0]["record"]["id"]).exists())
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.total_distance, 1080)
+        self.assertEqual(self.user.level, self.level2)
+
+        print(">> 일부 항목이 잘못되면 나머지만 추가하고 207을 반환한다.")
+        response = self.post_bulk([{"distance": "far"}, {"distance": 20}, "run"])
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(
+            [result["status"] for result in response.data["results"]],
+            ["invalid", "created", "invalid"],
+        )
+        self.assertIn("distance", response.data["results"][0]["errors"])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.total_distance, 1100)
+
+        response = self.post_bulk([{"distance": "far"}])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.post_bulk({"distance": 10})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        print("----------------------------------------------------- 완료")
+
+    def test_bulk_post_many_periods(self):
+        print("[기록 일괄 POST 여러 기간 테스트]")
+        print(">> 서로 다른 주의 기록 1000개도 한 번에 추가하고 기간별 합계를 반영한다.")
+        self.client.force_authenticate(user=self.user)
+        first = timezone.now() - timedelta(weeks=1000)
+        items = [
+            {"distance": 1, "started_at": (first + timedelta(weeks=i)).isoformat()}
+            for i in range(1000)
+        ]
+        response = self.post_bulk(items)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 1000)
+        weeks = DistanceRollup.objects.filter(user=self.user, period="week")
+        self.assertEqual(weeks.filter(distance=1).count(), 1000)
+        self.assertEqual(
+            DistanceRollup.objects.get(user=self.user, period="all").distance, 1880
+        )
+        print("----------------------------------------------------- 완료")
+
+    def test_bulk_post_query_count(self):
+        print("[기록 일괄 POST 쿼리 수 테스트]")
+        print(">> 기록 수와 무관하게 쿼리 수가 일정하다.")
+        self.client.force_authenticate(user=self.user)
+        # 레벨 테이블 캐시(accounts/levels.py) 로드, 레벨도 미리 올려 둠
+        self.post_bulk([{"distance": 100000}])
+        counts = []
+        for size in (1, 50):
+            # 두 번 모두 합계가 다른 순위 구간(DistanceBucket)으로 옮겨 가도록 충분히 긴 거리
+            with CaptureQueriesContext(connection) as context:
+                response = self.post_bulk([{"distance": 100000}] * size)
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            counts.append(len(context.captured_queries))
+        self.assertEqual(counts[0], counts[1])
+        self.assertLessEqual(counts[1], RecordViewSet.bulk.query_budget)
+        print("----------------------------------------------------- 완료")
+
+
+def gpx_document(segments, name="아침 달리기"):
+    body = "".join(
+        "<trkseg>"
+        + "".join(
+            f'<trkpt lat="{lat}" lon="{lon}"><ele>{ele}</ele>'
+            f"<time>2024-05-01T06:{seconds // 60:02d}:{seconds % 60:02d}Z</time></trkpt>"
+            for lat, lon, ele, seconds in points
+        )
+        + "</trkseg>"
+        for points in segments
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<gpx version="1.1" xmlns="http://www.topografix.com/GPX/1/1">'
+        f"<trk><name>{name}</name>{body}</trk></gpx>"
+    ).encode()
+
+
+def tcx_document(points):
+    body = "".join(
+        f"<Trackpoint><Time>2024-05-02T07:00:{seconds:02d}Z</Time>"
+        + (
+            f"<Position><LatitudeDegrees>{lat}</LatitudeDegrees>"
+            f"<LongitudeDegrees>{lon}</LongitudeDegrees></Position>"
+            if lat is not None
+            else ""
+        )
+        + "<AltitudeMeters>20.5</AltitudeMeters></Trackpoint>"
+        for lat, lon, seconds in points
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<TrainingCenterDatabase xmlns="http://www.garmin.com/xmlschemas/'
+        'TrainingCenterDatabase/v2"><Activities><Activity Sport="Running">'
+        f"<Lap><Track>{body}</Track></Lap></Activity></Activities>"
+        "</TrainingCenterDatabase>"
+    ).encode()
+
+
+# 위도 0.001도(약 111m)씩 30초마다 이동, 중간에 60초 정지, 두 번째 구간은 멀리 떨어진 곳
+RUN_SEGMENTS = [
+    [(37.5 + i * 0.001, 127.0, 10 + i, i * 30) for i in range(6)]
+    + [(37.505, 127.0, 15, 210)]
+    + [(37.505 + i * 0.001, 127.0, 15 - i, 210 + i * 30) for i in range(1, 5)],
+    [(35.1 + i * 0.001, 129.0, 5, 400 + i * 30) for i in range(3)],
+]
+
+
+class TrackTestCase(TestCase):
+    def test_parse_and_encode_track(self):
+        print("[GPS 트랙 파싱/저장 테스트]")
+        print(">> 구간이 바뀌는 이동과 정지 시간은 거리/이동 시간에서 빠진다.")
+        track = parse_track(BytesIO(gpx_document(RUN_SEGMENTS)))
+        self.assertEqual(len(track), 14)
+        self.assertEqual(list(track.segments), [0, 11])
+        self.assertEqual(track.name, "아침 달리기")
+        summary = track.summary()
+        self.assertAlmostEqual(summary["distance"], 1223.1, delta=1)
+        self.assertEqual(summary["duration"], 460)
+        self.assertEqual(summary["moving_time"], 330)
+        self.assertEqual(summary["started_at"].isoformat(), "2024-05-01T06:00:00+00:00")
+
+        print(">> 델타 인코딩한 바이너리에서 같은 트랙을 복원한다.")
+        data = encode_track(track)
+        restored = decode_track(data)
+        self.assertLess(len(data), len(track) * 16)
+        self.assertTrue((abs(restored.latitudes - track.latitudes) < 1e-7).all())
+        self.assertTrue((abs(restored.elevations - track.elevations) < 0.01).all())
+        self.assertEqual(list(restored.times - track.times), [0] * 14)
+        self.assertEqual(list(restored.segments), [0, 11])
+        self.assertEqual(restored.summary()["moving_time"], 330)
+
+        print(">> 날짜변경선을 넘는 경도도 손실 없이 복원한다.")
+        track = parse_track(
+            BytesIO(gpx_document([[(0, 179.9999999, 0, 0), (0, -179.9999999, 0, 1)]]))
+        )
+        restored = decode_track(encode_track(track))
+        self.assertEqual(list(restored.longitudes), [179.9999999, -179.9999999])
+        self.assertLess(track.summary()["distance"], 1)
+
+        print(">> 없는 날짜(13월)나 inf 고도는 값이 없는 포인트로 보고 앞뒤 값으로 채운다.")
+        document = gpx_document([[(37.5, 127.0, 10, 0), (37.5001, 127.0, 20, 10)]])
+        document = document.replace(b"2024-05-01T06:00:10Z", b"2024-13-01T06:00:10Z")
+        document = document.replace(b"<ele>20</ele>", b"<ele>inf</ele>")
+        track = parse_track(BytesIO(document))
+        self.assertEqual(list(track.times - track.times[0]), [0, 0])
+        restored = decode_track(encode_track(track))
+        self.assertEqual(list(restored.elevations), [10, 10])
+        print("----------------------------------------------------- 완료")
+
+
+class MypageRecordUploadTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def upload(self, *files):
+        return self.client.post(
+            "/accounts/mypage/record/upload/", {"files": list(files)}, format="multipart"
+        )
+
+    def test_upload_gpx(self):
+        print("[GPX 업로드 테스트]")
+        print(">> GPX 파일 하나로 거리/시간이 계산된 기록을 추가한다.")
+        gpx = SimpleUploadedFile("run.gpx", gpx_document(RUN_SEGMENTS))
+        self.assertEqual(self.upload(gpx).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.client.force_authenticate(user=self.user)
+        gpx.seek(0)
+        response = self.upload(gpx)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        result = response.data["results"][0]
+        self.assertEqual((result["name"], result["status"]), ("run.gpx", "created"))
+        self.assertEqual(result["record"]["distance"], 1223)
+        self.assertEqual(result["record"]["duration"], 460)
+        self.assertEqual(result["record"]["moving_time"], 330)
+        self.assertEqual(result["record"]["description"], "아침 달리기")
+        self.assertTrue(result["record"]["has_track"])
+
+        record = Record.objects.get(pk=result["record"]["id"])
+        self.assertEqual(len(load_track(record.track)), 14)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.total_distance, 880 + 1223)
+        self.assertEqual(self.user.level, self.level2)
+
+        print(">> 기록을 삭제하면 트랙 파일도 삭제한다.")
+        storage, name = record.track.storage, record.track.name
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f"/accounts/mypage/record/{record.id}/")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(storage.exists(name))
+        print("----------------------------------------------------- 완료")
+
+    def test_upload_zip(self):
+        print("[트랙 zip 업로드 테스트]")
+        print(">> zip 안의 GPX/TCX 를 파일마다 기록으로 추가하고 읽을 수 없는 파일은 건너뛴다.")
+        self.client.force_authenticate(user=self.user)
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("runs/monday.gpx", gpx_document(RUN_SEGMENTS[1:], ""))
+            archive.writestr(
+                "runs/tuesday.TCX",
+                tcx_document([(37.5, 127.0, 0), (None, None, 5), (37.501, 127.0, 10)]),
+            )
+            archive.writestr("runs/broken.gpx", b"<gpx><trk>")
+            archive.writestr("runs/readme.txt", b"notes")
+            archive.writestr("__MACOSX/runs/._monday.gpx", b"")
+        archive = SimpleUploadedFile("runs.zip", buffer.getvalue())
+        response = self.upload(archive, SimpleUploadedFile("notes.txt", b"notes"))
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(response.data["created"], 2)
+        results = response.data["results"]
+        self.assertEqual(
+            [(result["name"], result["status"]) for result in results],
+            [
+                ("runs/monday.gpx", "created"),
+                ("runs/tuesday.TCX", "created"),
+                ("runs/broken.gpx", "invalid"),
+                ("notes.txt", "invalid"),
+            ],
+        )
+        self.assertEqual(results[0]["record"]["description"], "monday")
+        self.assertEqual(results[0]["record"]["distance"], 222)
+        self.assertEqual(results[1]["record"]["distance"], 111)
+        self.assertEqual(results[1]["record"]["moving_time"], 10)
+        self.assertIn("file", results[2]["errors"])
+
+        print(">> 추가할 기록이 없으면 400을 반환한다.")
+        response = self.upload(SimpleUploadedFile("broken.tcx", b"not xml"))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post("/accounts/mypage/record/upload/", {})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        print("----------------------------------------------------- 완료")
+
+    def test_upload_query_count(self):
+        print("[트랙 업로드 쿼리 수 테스트]")
+        print(">> 파일 수와 무관하게 쿼리 수가 일정하다.")
+        self.client.force_authenticate(user=self.user)
+        document = gpx_document(RUN_SEGMENTS)
+        self.upload(SimpleUploadedFile("run.gpx", document))  # 레벨 테이블 캐시 로드
+        counts = []
+        for size in (1, 5):
+            files = [SimpleUploadedFile(f"{i}.gpx", document) for i in range(size)]
+            with CaptureQueriesContext(connection) as context:
+                response = self.upload(*files)
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            counts.append(len(context.captured_queries))
+        self.assertEqual(counts[0], counts[1])
+        self.assertLessEqual(counts[1], RecordViewSet.upload.query_budget)
+        print("----------------------------------------------------- 완료")
+
+
+class TrackAnalysisTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    # 100m 마다 포인트, 12km 를 5:00/km 로 달리고 3번째 km 만 4:00/km, 처음 5km 는 1km 에 10m 오르막
+    def create_track(self):
+        steps = 120
+        step_seconds = [24 if 20 <= step < 30 else 30 for step in range(steps)]
+        return Track(
+            latitudes=37.5 + np.arange(steps + 1) * 100 / 111_195.08,
+            longitudes=np.full(steps + 1, 127.0),
+            elevations=np.minimum(np.arange(steps + 1), 50).astype(float),
+            times=np.concatenate(([0], np.cumsum(step_seconds))) + 1714521600,
+        )
+
+    def test_analyze_track(self):
+        print("[트랙 분석 테스트]")
+        print(">> 1km 구간 페이스, 최고 기록, 고도, 페이스 영역을 계산한다.")
+        analysis = analyze_track(self.create_track())
+        self.assertAlmostEqual(analysis["distance"], 12000, delta=1)
+        self.assertEqual(analysis["moving_time"], 3540)
+        splits = analysis["splits"]
+        self.assertEqual(len(splits), 12)
+        self.assertEqual([split["pace"] for split in splits[:4]], [300, 300, 240, 300])
+        self.assertEqual(splits[0]["elevation_change"], 10)
+        self.assertEqual(splits[6]["elevation_change"], 0)
+
+        efforts = {effort["distance"]: effort for effort in analysis["best_efforts"]}
+        self.assertEqual(efforts[1000]["seconds"], 240)
+        self.assertAlmostEqual(efforts[1000]["start_distance"], 2000, delta=1)
+        self.assertEqual(efforts[5000]["seconds"], 1440)
+        self.assertEqual(efforts[10000]["seconds"], 2940)
+
+        self.assertAlmostEqual(analysis["elevation"]["gain"], 50, delta=1)
+        self.assertEqual(analysis["elevation"]["loss"], 0)
+        zones = {zone["zone"]: zone["seconds"] for zone in analysis["pace_zones"]}
+        self.assertEqual(zones["fast"], 240)
+        self.assertEqual(zones["steady"], 3300)
+        self.assertEqual(sum(zones.values()), analysis["moving_time"])
+
+        print(">> 시간 정보가 없으면 시간 관련 항목은 null 이다.")
+        track = self.create_track()
+        track.times = None
+        analysis = analyze_track(track)
+        self.assertIsNone(analysis["splits"])
+        self.assertIsNone(analysis["best_efforts"])
+        self.assertIsNotNone(analysis["elevation"])
+        print("----------------------------------------------------- 완료")
+
+    def test_get_record_analysis(self):
+        print("[기록 트랙 분석 GET 테스트]")
+        print(">> 업로드한 트랙의 분석 결과를 반환하고 트랙 해시로 캐시한다.")
+        self.client.force_authenticate(user=self.user)
+        gpx = SimpleUploadedFile("run.gpx", gpx_document(RUN_SEGMENTS))
+        response = self.client.post(
+            "/accounts/mypage/record/upload/", {"files": [gpx]}, format="multipart"
+        )
+        record = Record.objects.get(pk=response.data["results"][0]["record"]["id"])
+        self.assertEqual(len(record.track_hash), 40)
+
+        url = f"/accounts/mypage/record/{record.id}/analysis/"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["record"], record.id)
+        self.assertEqual(response.data["moving_time"], 330)
+        self.assertEqual(len(response.data["splits"]), 2)
+        self.assertEqual(response.data["best_efforts"][0]["distance"], 1000)
+
+        record.track.storage.delete(record.track.name)  # 캐시에서만 읽는지 확인
+        cached = self.client.get(url)
+        self.assertEqual(cached.status_code, status.HTTP_200_OK)
+        self.assertEqual(cached.data, response.data)
+
+        print(">> 트랙이 없거나 다른 유저의 기록이면 404를 반환한다.")
+        response = self.client.get(f"/accounts/mypage/record/{self.record1.id}/analysis/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get(f"/accounts/mypage/record/{self.record3.id}/analysis/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        print("----------------------------------------------------- 완료")
+
+
+class LeaderboardTestCase(QueryBudgetTestMixin, BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.today = timezone.localdate()
+        self.user.location_city = "seoul"
+        self.user.nickname = "러너1"
+        self.user.save()
+        self.user2.location_city = "seoul"
+        self.user2.save()
+        self.user3 = CustomUser.objects.create_user(
+            email="test3@test.com", password="test1234!", location_city="jeju"
+        )
+        Record.objects.create(user=self.user3, distance=880)
+        JoinedCrew.objects.create(user=self.user3, crew=self.crew1, status="keeping")
+
+    def rollups(self, user):
+        return dict(
+            DistanceRollup.objects.filter(user=user).values_list("period", "distance")
+        )
+
+    def get(self, **params):
+        return self.client.get("/accounts/leaderboard/", params)
+
+    def test_rollups_follow_records(self):
+        print("[리더보드 합계 증감 테스트]")
+        print(">> 기록 추가/수정/삭제 시 주간/월간/전체 합계를 증감분만큼 갱신한다.")
+        self.assertEqual(
+            self.rollups(self.user), {"week": 880, "month": 880, "all": 880}
+        )
+        cities = DistanceRollup.objects.filter(user=self.user).values_list(
+            "location_city", flat=True
+        )
+        self.assertEqual(set(cities), {"seoul"})
+        self.record1.distance = 500
+        self.record1.save()
+        self.record2.delete()
+        self.assertEqual(
+            self.rollups(self.user), {"week": 500, "month": 500, "all": 500}
+        )
+
+        print(">> 운동 날짜를 옮기면 이전 기간에서 빼고 새 기간에 더한다.")
+        last_year = self.today.replace(year=self.today.year - 1, day=1)
+        record = Record.objects.get(pk=self.record1.pk)
+        record.started_at = timezone.make_aware(
+            datetime.combine(last_year, datetime.min.time())
+        )
+        record.save()
+        rows = dict(
+            DistanceRollup.objects.filter(user=self.user).values_list(
+                "period_start", "distance"
+            )
+        )
+        self.assertEqual(rows[period_starts(self.today)["week"]], 0)
+        self.assertEqual(rows[period_starts(last_year)["month"]], 500)
+        self.assertEqual(self.rollups(self.user)["all"], 500)
+
+        print(">> 지역을 바꾸면 합계 행의 지역도 바뀐다.")
+        self.user.location_city = "gyeonggi"
+        self.user.save()
+        self.assertFalse(
+            DistanceRollup.objects.filter(user=self.user)
+            .exclude(location_city="gyeonggi")
+            .exists()
+        )
+        print("----------------------------------------------------- 완료")
+
+    def test_get_leaderboard(self):
+        print("[리더보드 GET 테스트]")
+        print(">> 전체 순위는 거리 내림차순이고 같은 거리는 같은 순위다.")
+        response = self.get(period="week")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual(
+            [(row["rank"], row["user_id"], row["distance"]) for row in results],
+            [(1, self.user.id, 880), (1, self.user3.id, 880), (3, self.user2.id, 600)],
+        )
+        self.assertEqual(response.data["results"][0]["nickname"], "러너1")
+        self.assertIsNone(response.data["me"])
+
+        print(">> 로그인하면 내 순위를 함께 반환하고, 지역을 생략하면 내 지역 순위다.")
+        self.client.force_authenticate(user=self.user2)
+        response = self.get(scope="city")
+        self.assertEqual(response.data["city"], "seoul")
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertEqual(response.data["me"], {"rank": 2, "distance": 600})
+        board = Leaderboard(scope="city", city="seoul")
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(board.rank_of(self.user2.id)["rank"], 2)
+        self.assertEqual(context.captured_queries[-1]["sql"].count('"distance" >'), 1)
+        response = self.get(scope="city", city="jeju", size=1)
+        results = response.data["results"]
+        self.assertEqual([row["user_id"] for row in results], [self.user3.id])
+        self.assertIsNone(response.data["me"])
+
+        print(">> 크루 순위는 승인된 크루원만 포함한다.")
+        response = self.get(scope="crew", crew=self.crew1.id, period="all")
+        results = response.data["results"]
+        self.assertEqual([row["user_id"] for row in results], [self.user.id])
+
+        print(">> 지난 기간은 date 로 조회한다.")
+        last_month = self.today.replace(day=1) - timedelta(days=1)
+        response = self.get(period="month", date=last_month.isoformat())
+        self.assertEqual(response.data["period_start"], last_month.replace(day=1))
+        self.assertEqual(response.data["results"], [])
+
+        print(">> 잘못된 기간/범위/날짜는 400을 반환한다.")
+        for params in (
+            {"period": "year"},
+            {"scope": "crew"},
+            {"scope": "city", "city": "mars"},
+            {"date": "2024-13-01"},
+            {"size": "many"},
+        ):
+            response = self.get(**params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        print("----------------------------------------------------- 완료")
+
+    def buckets(self):
+        return set(
+            DistanceBucket.objects.filter(count__gt=0).values_list(
+                "period", "period_start", "location_city", "bucket", "count"
+            )
+        )
+
+    def test_rank_buckets(self):
+        print("[리더보드 순위 구간 테스트]")
+        print(">> 거리는 순서를 지키는 구간에 속하고 구간 폭은 거리의 1/32 이하다.")
+        previous = 0
+        for distance in [*range(1, 5000), 10**6, 10**6 + 1, 2**40 + 7]:
+            bucket = distance_bucket(distance)
+            self.assertGreaterEqual(bucket, previous)
+            self.assertLessEqual(bucket_floor(bucket), distance)
+            self.assertLess(distance, bucket_floor(bucket + 1))
+            previous = bucket
+
+        print(">> 구간 합으로 구한 순위는 나보다 긴 거리를 모두 센 순위와 같다.")
+        cities = ["seoul", "jeju", None]
+        for i, distance in enumerate([5000, 5001, 5001, 5100, 9000, 70000, 1]):
+            user = CustomUser.objects.create_user(
+                email=f"rank{i}@test.com",
+                password="test1234!",
+                location_city=cities[i % 3],
+            )
+            Record.objects.create(user=user, distance=distance)
+        rows = DistanceRollup.objects.filter(
+            period="week", period_start=period_starts(self.today)["week"]
+        )
+        for row in rows.filter(distance__gt=0):
+            boards = [Leaderboard()]
+            if row.location_city:
+                boards.append(Leaderboard(scope="city", city=row.location_city))
+            for board in boards:
+                above = board.queryset().filter(distance__gt=row.distance).count()
+                self.assertEqual(
+                    board.rank_of(row.user_id),
+                    {"rank": above + 1, "distance": row.distance},
+                )
+
+        print(">> 기록 수정/삭제, 지역 변경, 탈퇴 후에도 구간 개수는 다시 계산한 값과 같다.")
+        record = Record.objects.get(user__email="rank0@test.com")
+        record.distance = 80000
+        record.save()
+        Record.objects.get(user__email="rank1@test.com").delete()
+        self.user.location_city = "jeju"
+        self.user.save()
+        CustomUser.objects.get(email="rank4@test.com").delete()
+        incremental = self.buckets()
+        DistanceBucket.objects.rebuild()
+        self.assertEqual(incremental, self.buckets())
+        print("----------------------------------------------------- 완료")
+
+    def test_rebuild_leaderboards(self):
+        print("[리더보드 재계산 커맨드 테스트]")
+        print(">> 합계가 어긋나도 기록 기준으로 다시 만든다.")
+        Record.objects.create(
+            user=self.user2,
+            distance=300,
+            started_at=timezone.now() - timedelta(days=40),
+        )
+        expected = set(
+            DistanceRollup.objects.filter(distance__gt=0).values_list(
+                "user_id", "period", "period_start", "location_city", "distance"
+            )
+        )
+        DistanceRollup.objects.filter(user=self.user).update(distance=1)
+        DistanceRollup.objects.filter(user=self.user3).delete()
+        call_command("rebuild_leaderboards", stdout=StringIO())
+        self.assertEqual(
+            set(
+                DistanceRollup.objects.values_list(
+                    "user_id", "period", "period_start", "location_city", "distance"
+                )
+            ),
+            expected,
+        )
+        print("----------------------------------------------------- 완료")
+
+    def seed(self, n):
+        for _ in range(n):
+            user = CustomUser.objects.create_user(
+                email=f"seed{CustomUser.objects.count()}@test.com",
+                password="test1234!",
+                location_city="seoul",
+            )
+            Record.objects.create(user=user, distance=100)
+            JoinedCrew.objects.create(user=user, crew=self.crew1, status="member")
+
+    def test_leaderboard_query_budget(self):
+        self.client.force_authenticate(user=self.user)
+        self.assertQueryBudget("/accounts/leaderboard/", self.seed)
+        self.assertQueryBudget("/accounts/leaderboard/?scope=city", self.seed)
+        self.assertQueryBudget(
+            f"/accounts/leaderboard/?scope=crew&crew={self.crew1.id}", self.seed
+        )
+
 
 class MypageCrewTestCase(BaseTestCase):
     def setUp(self):
@@ -413,3 +1212,218 @@ class OpenProfileTestCase(BaseTestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn("likes", data)
         print("----------------------------------------------------- 완료")
+
+    def test_sections(self):
+        print("[공개 프로필 섹션 테스트]")
+        print(">> include 로 섹션 선택, 섹션별 커서 페이지네이션, 쿼리 수 일정")
+        posts = [
+            Post.objects.create(
+                author=self.user,
+                title=f"post {i}",
+                contents="contents",
+                post_classification="general",
+                category="general",
+            )
+            for i in range(12)
+        ]
+        for post in posts:
+            Comment.objects.create(author=self.user2, post=post, contents="comment")
+            Comment.objects.create(author=self.user, post=post, contents="comment")
+            Like.objects.create(author=self.user, post=post)
+
+        self.client.force_authenticate(user=self.user)
+        # 프로필 유저 1번 + 게시글 1번
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                f"/accounts/profile/{self.user.id}/?include=posts"
+            )
+        self.assertEqual(list(response.data), ["posts"])
+        posts_page = response.data["posts"]
+        self.assertEqual(len(posts_page["results"]), 10)
+        self.assertEqual(posts_page["results"][0]["title"], "post 11")
+        self.assertEqual(posts_page["results"][0]["comment_count"], 2)
+        self.assertIn("posts_cursor=", posts_page["next"])
+
+        response = self.client.get(posts_page["next"])
+        self.assertEqual(len(response.data["posts"]["results"]), 2)
+        self.assertIsNone(response.data["posts"]["next"])
+
+        # 전체 섹션도 목록 길이와 무관하게 섹션당 쿼리 수 일정
+        # 유저 + 가입 크루 + 목록 섹션 5개
+        with self.assertNumQueries(7):
+            response = self.client.get(f"/accounts/profile/{self.user.id}/")
+        self.assertEqual(response.data["likes"]["results"][0]["comment_count"], 2)
+        self.assertEqual(
+            response.data["comments"]["results"][0]["post"]["id"], posts[-1].id
+        )
+        self.assertEqual(response.data["user"]["crew"], ["crew1", "crew2"])
+        print("----------------------------------------------------- 완료")
+
+
+# 비동기 뷰 (config/async_sections.py), 테스트 트랜잭션의 데이터를 보도록 섹션을 순서대로 실행
+@override_settings(ASYNC_CONCURRENT_SECTIONS=False)
+class AsyncProfileTestCase(BaseTestCase):
+    def authorize(self, user):
+        token = ClaimsTokenObtainPairSerializer.get_token(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_profile_async(self):
+        print("[비동기 공개 프로필 GET 테스트]")
+        print(">> 동기 뷰와 같은 응답, 본인일 때에만 좋아요 리스트")
+        response = self.client.get(f"/accounts/async/profile/{self.user.id}/")
+        expected = self.client.get(f"/accounts/profile/{self.user.id}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), expected.json())
+        self.assertNotIn("likes", response.json())
+
+        self.authorize(self.user)
+        response = self.client.get(
+            f"/accounts/async/profile/{self.user.id}/?include=user,likes"
+        )
+        self.assertEqual(list(response.json()), ["user", "likes"])
+
+        response = self.client.get("/accounts/async/profile/0/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        print("----------------------------------------------------- 완료")
+
+    def test_favorites_async(self):
+        print("[비동기 즐겨찾기 GET 테스트]")
+        print(">> 토큰이 없거나 잘못되면 401, 동기 뷰와 같은 응답")
+        response = self.client.get("/accounts/async/mypage/favorites/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer invalid")
+        response = self.client.get("/accounts/async/mypage/favorites/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.authorize(self.user)
+        response = self.client.get("/accounts/async/mypage/favorites/")
+        expected = self.client.get("/accounts/mypage/favorites/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), expected.json())
+        self.assertTrue(response.json()["crew"][0]["is_favorite"])
+
+        response = self.client.post("/accounts/async/mypage/favorites/")
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+        print("----------------------------------------------------- 완료")
+
+
+# 비동기 뷰 섹션을 섹션 스레드 풀에서 동시에 조회 (다른 연결에서 보이도록 TransactionTestCase)
+@override_settings(ASYNC_CONCURRENT_SECTIONS=True)
+class AsyncProfileConcurrentTestCase(TransactionTestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(
+            email="test1@test.com", password="test1234!", nickname="러너1"
+        )
+        crew = Crew.objects.create(owner=self.user, name="crew1", is_opened=True)
+        CrewFavorite.objects.create(user=self.user, crew=crew)
+        post = Post.objects.create(
+            author=self.user,
+            title="post1",
+            contents="contents",
+            post_classification="general",
+            category="general",
+        )
+        Comment.objects.create(author=self.user, post=post, contents="comment")
+        Like.objects.create(author=self.user, post=post)
+        token = ClaimsTokenObtainPairSerializer.get_token(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        # 섹션이 실행된 스레드 이름 기록
+        self.section_threads = set()
+        run_section = async_sections._run_section
+
+        def record_thread(loader):
+            self.section_threads.add(threading.current_thread().name)
+            return run_section(loader)
+
+        patcher = mock.patch.object(async_sections, "_run_section", record_thread)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_profile_async_concurrent(self):
+        print("[비동기 공개 프로필 동시 조회 테스트]")
+        print(">> 섹션 스레드 풀에서 조회해도 동기 뷰와 같은 응답")
+        path = f"/accounts/async/profile/{self.user.id}/"
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        expected = self.client.get(f"/accounts/profile/{self.user.id}/")
+        self.assertEqual(response.json(), expected.json())
+        self.assertEqual(response.json()["likes"]["results"][0]["comment_count"], 1)
+
+        response = self.client.get("/accounts/async/mypage/favorites/")
+        self.assertEqual(
+            response.json(), self.client.get("/accounts/mypage/favorites/").json()
+        )
+        self.assertTrue(self.section_threads)
+        self.assertTrue(
+            all(name.startswith("async-section") for name in self.section_threads)
+        )
+        self.assertEqual(self.client.post(path).status_code, 405)
+        print("----------------------------------------------------- 완료")
+
+
+# 쿼리 예산 (config/query_budget.py)
+class AccountsQueryBudgetTestCase(QueryBudgetTestMixin, BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.seeded = 0
+
+    # 기록, 가입 크루/대회, 즐겨찾기, 게시글/댓글/좋아요, 리뷰를 n개씩 추가
+    def seed(self, n):
+        for _ in range(n):
+            self.seeded += 1
+            Record.objects.create(user=self.user, description="record", distance=1)
+            crew = Crew.objects.create(
+                owner=self.user2,
+                name=f"seed crew {self.seeded}",
+                location_city="seoul",
+                thumbnail_image="test.jpg",
+            )
+            JoinedCrew.objects.create(user=self.user, crew=crew, status="member")
+            CrewFavorite.objects.create(user=self.user, crew=crew)
+            CrewReview.objects.create(crew=crew, author=self.user, contents="review")
+            race = Race.objects.create(
+                title=f"seed race {self.seeded}",
+                start_date="2024-04-15",
+                end_date="2024-04-16",
+                reg_start_date="2024-04-08",
+                reg_end_date="2024-04-10",
+                author=self.user,
+                location="서울",
+                thumbnail_image="test.jpg",
+            )
+            JoinedRace.objects.create(user=self.user, race=race)
+            RaceFavorite.objects.create(user=self.user, race=race)
+            RaceReview.objects.create(race=race, author=self.user, contents="review")
+            post = Post.objects.create(
+                author=self.user,
+                title=f"seed post {self.seeded}",
+                contents="contents",
+                post_classification="general",
+                category="general",
+            )
+            Comment.objects.create(author=self.user, post=post, contents="comment")
+            Like.objects.create(author=self.user, post=post)
+
+    def test_mypage_query_budget(self):
+        self.client.force_authenticate(user=self.user)
+        self.assertQueryBudget("/accounts/mypage/info/", self.seed)
+        self.assertQueryBudget("/accounts/mypage/record/", self.seed)
+        self.assertQueryBudget("/accounts/mypage/crew/", self.seed)
+        self.assertQueryBudget("/accounts/mypage/race/", self.seed)
+        self.assertQueryBudget("/accounts/mypage/favorites/", self.seed)
+
+    def test_profile_query_budget(self):
+        for user in [None, self.user]:
+            self.client.force_authenticate(user=user)
+            self.assertQueryBudget(f"/accounts/profile/{self.user.id}/", self.seed)
+
+    @override_settings(ASYNC_CONCURRENT_SECTIONS=False)
+    def test_async_query_budget(self):
+        token = ClaimsTokenObtainPairSerializer.get_token(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        # 토큰 버전 캐시(accounts/authentication.py)를 채운 뒤 측정
+        self.client.get("/accounts/async/mypage/favorites/")
+        self.assertQueryBudget(f"/accounts/async/profile/{self.user.id}/", self.seed)
+        self.assertQueryBudget("/accounts/async/mypage/favorites/", self.seed)
@@ -1,6 +1,5 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from rest_framework_simplejwt.views import TokenRefreshView
 from dj_rest_auth.views import LoginView, LogoutView
 from . import views
 
@@ -23,5 +22,8 @@ urlpatterns = [
     path("login/", LoginView.as_view(), name="account_login"),
     path("logout/", LogoutView.as_view(), name="account_logout"),
     path("signup/", views.CustomRegisterView.as_view(), name="account_signup"),
-    path("token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path("token/refresh/", views.ClaimsTokenRefreshView.as_view(), name="token_refresh"),
+    path("leaderboard/", views.leaderboard, name="leaderboard"),
+    path("async/profile/<int:pk>/", views.profile_async, name="profile_async"),
+    path("async/mypage/favorites/", views.favorites_async, name="favorites_async"),
 ]
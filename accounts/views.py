@@ -1,30 +1,48 @@
 from rest_framework.response import Response
 from rest_framework import viewsets
-from rest_framework.exceptions import MethodNotAllowed, NotFound
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import MethodNotAllowed, NotAuthenticated, NotFound
+from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
-from drf_spectacular.utils import extend_schema, inline_serializer
+from drf_spectacular.utils import extend_schema, inline_serializer, OpenApiParameter
 from rest_framework import serializers
+from django.utils.dateparse import parse_date
 from dj_rest_auth.registration.views import RegisterView
+from rest_framework_simplejwt.views import TokenRefreshView
+from .analysis import get_record_analysis
+from .leaderboards import DEFAULT_SIZE, MAX_SIZE, Leaderboard, LeaderboardError
+from .authentication import ClaimsTokenRefreshSerializer
 from .models import CustomUser, Record, JoinedCrew, JoinedRace
-from crews.models import CrewReview
-from crews.serializers import CrewListSerializer, ProfileCrewReviewSerializer
-from races.models import Race, RaceReview
-from races.serializers import RaceListSerializer, ProfileRaceReviewSerializer
-from boards.models import Post, Comment, Like
-from boards.serializers import (
-    PostListSerializer,
-    ProfileCommentSerializer,
-    ProfileLikedPostSerializer,
+from .profile import (
+    build_profile_data,
+    get_list_section_loaders,
+    get_user_section,
+    parse_include,
 )
+from config.async_sections import (
+    as_drf_request,
+    authenticate,
+    gather_sections,
+    json_response,
+    require_GET,
+)
+from config.viewer_state import get_viewer_state
+from config.query_budget import query_budget
+from config.tracks import TrackError
+from crews.models import Crew
+from crews.serializers import CrewListSerializer
+from races.models import Race
+from races.serializers import RaceListSerializer
 from .serializers import (
+    MAX_BULK_RECORDS,
+    bulk_create_records,
+    create_records_from_tracks,
     CustomRegisterSerializer,
     ProfileSerializer,
     RecordSerialiser,
     JoinedCrewSerializer,
     JoinedRaceGetSerializer,
     JoinedRacePostSerializer,
-    OpenProfileSerializer,
+    LeaderboardEntrySerializer,
 )
 
 
@@ -32,6 +50,11 @@ class CustomRegisterView(RegisterView):
     serializer_class = CustomRegisterSerializer
 
 
+# token/refresh/ : 폐기 여부 확인 후 최신 클레임으로 access 토큰 재발급
+class ClaimsTokenRefreshView(TokenRefreshView):
+    serializer_class = ClaimsTokenRefreshSerializer
+
+
 # mypage/info/ : 유저 정보 CRUD
 class UserInfoViewSet(viewsets.GenericViewSet):
     permission_classes = [IsAuthenticated]
@@ -39,11 +62,14 @@ class UserInfoViewSet(viewsets.GenericViewSet):
 
     def get_object(self):
         try:
-            return CustomUser.objects.get(pk=self.request.user.pk)
+            return CustomUser.objects.select_related("level").get(
+                pk=self.request.user.pk
+            )
         except CustomUser.DoesNotExist:
             raise NotFound("User not found")
 
     @extend_schema(request=ProfileSerializer)
+    @query_budget(1)
     def list(self, request, *args, **kwargs):
         user = self.get_object()
         serializer = ProfileSerializer(user)
@@ -59,11 +85,19 @@ class UserInfoViewSet(viewsets.GenericViewSet):
         return Response(serializer.errors, status=400)
 
 
+# 일괄 추가 응답 코드: 전부 성공 201, 일부 실패 207, 전부 실패 400
+def bulk_status(created, total):
+    if created == total:
+        return 201
+    return 207 if created else 400
+
+
 # mypage/record/ : 달림 기록 CRUD
 @extend_schema(methods=["POST", "PATCH"], request=RecordSerialiser)
 class RecordViewSet(viewsets.ViewSet):
     permission_classes = [IsAuthenticated]
 
+    @query_budget(1)
     def list(self, request):
         queryset = Record.objects.filter(user=request.user)
         serializer = RecordSerialiser(queryset, many=True)
@@ -76,6 +110,66 @@ class RecordViewSet(viewsets.ViewSet):
             return Response(serializer.data, status=201)
         return Response(serializer.errors, status=400)
 
+    # /mypage/record/bulk/ : 기록 목록을 한 번에 추가
+    @extend_schema(request=RecordSerialiser(many=True))
+    @action(detail=False, methods=["post"])
+    @query_budget(10)
+    def bulk(self, request):
+        items = request.data
+        if not isinstance(items, list) or not items:
+            return Response({"error": "추가할 기록 목록이 필요합니다."}, status=400)
+        if len(items) > MAX_BULK_RECORDS:
+            return Response(
+                {"error": f"한 번에 최대 {MAX_BULK_RECORDS}개까지 추가할 수 있습니다."},
+                status=400,
+            )
+
+        results, created = bulk_create_records(request.user, items)
+        return Response(
+            {"created": created, "results": results},
+            status=bulk_status(created, len(items)),
+        )
+
+    # /mypage/record/upload/ : GPX/TCX(또는 zip) 파일로 기록 추가 (files 필드에 여러 개)
+    @extend_schema(
+        request=inline_serializer(
+            name="RecordUploadInlineSerializer",
+            fields={"files": serializers.ListField(child=serializers.FileField())},
+        )
+    )
+    @action(detail=False, methods=["post"])
+    @query_budget(10)
+    def upload(self, request):
+        uploads = request.FILES.getlist("files")
+        if not uploads:
+            return Response({"error": "GPX/TCX 파일이 필요합니다."}, status=400)
+        try:
+            results, created = create_records_from_tracks(request.user, uploads)
+        except TrackError as error:
+            return Response({"error": str(error)}, status=400)
+        if not results:
+            return Response({"error": "zip 안에 GPX/TCX 파일이 없습니다."}, status=400)
+        return Response(
+            {"created": created, "results": results},
+            status=bulk_status(created, len(results)),
+        )
+
+    # /mypage/record/<id>/analysis/ : GPS 트랙 분석 (구간별 페이스, 최고 기록, 고도, 페이스 영역)
+    @action(detail=True, methods=["get"])
+    @query_budget(1)
+    def analysis(self, request, pk=None):
+        record = (
+            Record.objects.filter(pk=pk, user=request.user)
+            .only("id", "track", "track_hash")
+            .first()
+        )
+        if record is None:
+            return Response({"error": "Record not found"}, status=404)
+        analysis = get_record_analysis(record)
+        if analysis is None:
+            return Response({"error": "GPS 트랙이 없는 기록입니다."}, status=404)
+        return Response({"record": record.id, **analysis})
+
     def partial_update(self, request, pk=None):
         try:
             record = Record.objects.get(pk=pk, user=request.user)
@@ -110,9 +204,10 @@ class MypageCrewViewSet(viewsets.ViewSet):
         except CustomUser.DoesNotExist:
             raise NotFound("User not found")
 
+    @query_budget(2)
     def list(self, request, *args, **kwargs):
         user = self.get_object()
-        joined_crews = JoinedCrew.objects.filter(user=user)
+        joined_crews = JoinedCrew.objects.filter(user=user).select_related("crew")
         serializer = JoinedCrewSerializer(
             joined_crews, many=True, context={"request": request}
         )
@@ -125,8 +220,9 @@ class MypageCrewViewSet(viewsets.ViewSet):
 class RaceViewSet(viewsets.ViewSet):
     permission_classes = [IsAuthenticated]
 
+    @query_budget(1)
     def list(self, request):
-        queryset = JoinedRace.objects.filter(user=request.user)
+        queryset = JoinedRace.objects.filter(user=request.user).select_related("race")
         serializer = JoinedRaceGetSerializer(
             queryset, many=True, context={"request": request}
         )
@@ -207,61 +303,178 @@ class MypageFavoritesViewSet(viewsets.ViewSet):
         except CustomUser.DoesNotExist:
             raise NotFound("사용자를 찾을 수 없습니다.")
 
+    @query_budget(3)
     def list(self, request, *args, **kwargs):
         user = self.get_object()
-        favorite_crews = [favorite.crew for favorite in user.favorite_crews.all()]
-        favorite_races = [favorite.race for favorite in user.favorite_races.all()]
+        response_data = {
+            "crew": get_favorite_crews_data(user.pk, request),
+            "race": get_favorite_races_data(user.pk, request),
+        }
+        return Response(response_data)
 
-        crew_serializer = CrewListSerializer(
-            favorite_crews, many=True, context={"request": request}
-        )
-        race_serializer = RaceListSerializer(
-            favorite_races, many=True, context={"request": request}
-        )
 
-        response_data = {"crew": crew_serializer.data, "race": race_serializer.data}
+# 즐겨찾기 목록에서 불러온 크루/대회는 is_favorite 를 다시 조회하지 않음
+def get_favorite_crews_data(user_id, request):
+    crews = list(
+        Crew.objects.filter(crewfavorite__user_id=user_id).order_by("crewfavorite__id")
+    )
+    context = {"request": request}
+    get_viewer_state(context).preload(
+        "crew_favorite", {crew.pk: True for crew in crews}
+    )
+    return CrewListSerializer(crews, many=True, context=context).data
 
-        return Response(response_data)
+
+def get_favorite_races_data(user_id, request):
+    races = list(
+        Race.objects.filter(racefavorite__user_id=user_id).order_by("racefavorite__id")
+    )
+    context = {"request": request}
+    get_viewer_state(context).preload(
+        "race_favorite", {race.pk: True for race in races}
+    )
+    return RaceListSerializer(races, many=True, context=context).data
 
 
 # /<int:pk>/profile/ : 유저 오픈프로필 조회
+# ?include= 로 섹션 선택, 목록 섹션은 섹션별 커서 페이지네이션 (accounts/profile.py)
+@extend_schema(
+    parameters=[
+        OpenApiParameter(
+            name="include",
+            description="user, posts, comments, reviews, likes 중 선택 (쉼표 구분, 생략 시 전체)",
+            type=str,
+        ),
+        OpenApiParameter(
+            name="size", description="섹션별 페이지 크기 (최대 50)", type=int
+        ),
+    ]
+)
 class ProfileViewSet(viewsets.ViewSet):
 
+    @query_budget(7)
     def retrieve(self, request, pk=None):
+        include = parse_include(request.GET.get("include", ""))
         try:
-            user = CustomUser.objects.get(pk=pk)
-        except CustomUser.DoesNotExist:
+            user_pk = int(pk)
+        except ValueError:
+            return Response({"error": "User not found"}, status=404)
+        user_data = get_user_section(user_pk, include, request)
+        if user_data is None:
             return Response({"error": "User not found"}, status=404)
 
-        user_serializer = OpenProfileSerializer(user)
-        post_serializer = PostListSerializer(
-            Post.objects.filter(author=user), many=True
-        )
-        comments_serializer = ProfileCommentSerializer(
-            Comment.objects.filter(author=user), many=True
-        )
-        crew_review_serializer = ProfileCrewReviewSerializer(
-            CrewReview.objects.filter(author=user), many=True
-        )
-        race_review_serializer = ProfileRaceReviewSerializer(
-            RaceReview.objects.filter(author=user), many=True
-        )
+        loaders = get_list_section_loaders(user_pk, include, request)
+        sections = {name: load() for name, load in loaders.items()}
+        return Response(build_profile_data(user_data, sections))
 
-        fin_data = {
-            "user": user_serializer.data,
-            "posts": post_serializer.data,
-            "comments": comments_serializer.data,
-            "reviews": {
-                "crew": crew_review_serializer.data,
-                "race": race_review_serializer.data,
-            },
-        }
 
-        # request.user와 pk가 일치하는 경우에만 'likes' 항목을 추가
-        if request.user.pk == user.pk:
-            liked_post_serializer = ProfileLikedPostSerializer(
-                Like.objects.filter(author=user), many=True
-            )
-            fin_data["likes"] = liked_post_serializer.data
+"""
+비동기 버전 (ASGI, config/async_sections.py)
+
+- async/profile/<pk>/ : 오픈프로필, 유저/목록 섹션을 동시에 조회
+- async/mypage/favorites/ : 찜한 크루/대회를 동시에 조회 (토큰의 유저 id 사용, 유저 행 조회 없음)
+"""
 
-        return Response(fin_data)
+
+@query_budget(7)
+@require_GET
+async def profile_async(request, pk):
+    error_response = await authenticate(request)
+    if error_response is not None:
+        return error_response
+    drf_request = as_drf_request(request)
+    include = parse_include(request.GET.get("include", ""))
+
+    sections = await gather_sections(
+        user=lambda: get_user_section(pk, include, drf_request),
+        **get_list_section_loaders(pk, include, drf_request),
+    )
+    user_data = sections.pop("user")
+    if user_data is None:
+        return json_response({"error": "User not found"}, status=404)
+    return json_response(build_profile_data(user_data, sections))
+
+
+@query_budget(2)
+@require_GET
+async def favorites_async(request):
+    error_response = await authenticate(request)
+    if error_response is not None:
+        return error_response
+    if not request.user.is_authenticated:
+        return json_response({"detail": NotAuthenticated.default_detail}, status=401)
+    drf_request = as_drf_request(request)
+    user_id = request.user.pk
+
+    sections = await gather_sections(
+        crew=lambda: get_favorite_crews_data(user_id, drf_request),
+        race=lambda: get_favorite_races_data(user_id, drf_request),
+    )
+    return json_response(sections)
+
+
+# /leaderboard/ : 주간/월간/전체 거리 리더보드 (전체, 지역별, 크루별) + 내 순위
+@extend_schema(
+    parameters=[
+        OpenApiParameter(name="period", description="week, month, all", type=str),
+        OpenApiParameter(name="scope", description="global, city, crew", type=str),
+        OpenApiParameter(
+            name="city", description="scope=city 일 때 지역 (생략 시 내 지역)", type=str
+        ),
+        OpenApiParameter(
+            name="crew", description="scope=crew 일 때 크루 id", type=int
+        ),
+        OpenApiParameter(
+            name="date", description="조회할 주/월에 속한 날짜 (YYYY-MM-DD)", type=str
+        ),
+        OpenApiParameter(
+            name="size", description="상위 몇 명 (최대 100)", type=int
+        ),
+    ]
+)
+@api_view(["GET"])
+@query_budget(4)
+def leaderboard(request):
+    user = request.user
+    city = request.GET.get("city")
+    if not city and user.is_authenticated:
+        city = user.location_city
+    try:
+        crew_id = request.GET.get("crew")
+        crew_id = int(crew_id) if crew_id else None
+        size = min(max(int(request.GET.get("size", DEFAULT_SIZE)), 1), MAX_SIZE)
+    except ValueError:
+        return Response({"error": "crew, size 는 숫자여야 합니다."}, status=400)
+    day = request.GET.get("date")
+    if day:
+        try:
+            day = parse_date(day)
+        except ValueError:
+            day = None
+        if day is None:
+            return Response({"error": "date 는 YYYY-MM-DD 형식이어야 합니다."}, status=400)
+    try:
+        board = Leaderboard(
+            period=request.GET.get("period", "week"),
+            scope=request.GET.get("scope", "global"),
+            day=day,
+            city=city,
+            crew_id=crew_id,
+        )
+    except LeaderboardError as error:
+        return Response({"error": str(error)}, status=400)
+
+    results = LeaderboardEntrySerializer(
+        board.top(size), many=True, context={"request": request}
+    ).data
+    return Response(
+        {
+            "period": board.period,
+            "period_start": board.period_start,
+            "scope": board.scope,
+            "city": board.city,
+            "crew": board.crew_id,
+            "results": results,
+            "me": board.rank_of(user.pk) if user.is_authenticated else None,
+        }
+    )
@@ -25,6 +25,12 @@ class PostAdmin(admin.ModelAdmin):
     )
     list_filter = ("post_classification", "category", "created_at", "updated_at")
     search_fields = ("title", "author__username", "contents")
+    readonly_fields = ("view_count", "like_count")
+
+    # 인라인에서 좋아요를 추가/삭제한 경우 좋아요 수 재계산
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        Post.objects.filter(pk=form.instance.pk).sync_like_counts()
 
 
 @admin.register(Comment)
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+from boards import search
+
+
+"""
+게시글 검색 색인 재생성 커맨드
+
+- FTS 테이블이 없으면 만들고 모든 게시글을 다시 색인
+- 사용법: python manage.py rebuild_post_search_index
+"""
+
+
+class Command(BaseCommand):
+    help = "게시글 전문 검색(FTS5) 색인을 다시 만듭니다."
+
+    def handle(self, *args, **options):
+        if not search.is_search_index_enabled():
+            raise CommandError("전문 검색 색인은 SQLite 에서만 지원합니다.")
+        search.create_search_index()
+        count = search.rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(f"{count}개 게시글을 색인했습니다."))
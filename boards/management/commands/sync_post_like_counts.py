@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from boards.models import Post
+
+
+"""
+게시글 좋아요 수 재계산 커맨드
+
+- like_count 를 Like 기준으로 다시 맞춤
+- 사용법: python manage.py sync_post_like_counts
+"""
+
+
+class Command(BaseCommand):
+    help = "게시글의 like_count 를 실제 좋아요 기준으로 재계산합니다."
+
+    def handle(self, *args, **options):
+        updated = Post.objects.all().sync_like_counts()
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated}개 게시글의 좋아요 수를 갱신했습니다.")
+        )
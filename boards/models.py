@@ -1,6 +1,9 @@
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.conf import settings
 from config.constants import CLASSIFICATION_CHOICES, CATEGORY_CHOICES
+from config.images import validate_image_pixels
 
 
 # 좋아요
@@ -32,6 +35,33 @@ class Comment(models.Model):
     contents = models.TextField()
 
 
+# 게시글별 댓글 수 (상관 서브쿼리, 페이지에 포함된 게시글만 comment(post_id) 인덱스로 계산)
+# GROUP BY 로 집계하면 LIMIT 전에 조건에 맞는 모든 게시글을 묶고 정렬하게 됨
+def comment_count_subquery(post_ref="pk"):
+    comment_count = (
+        Comment.objects.filter(post=OuterRef(post_ref))
+        .values("post")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(Subquery(comment_count), Value(0))
+
+
+class PostQuerySet(models.QuerySet):
+    def with_comment_count(self):
+        return self.annotate(annotated_comment_count=comment_count_subquery())
+
+    # 좋아요 수를 Like 기준으로 다시 계산
+    def sync_like_counts(self):
+        like_count = (
+            Like.objects.filter(post=OuterRef("pk"))
+            .values("post")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        return self.update(like_count=Coalesce(Subquery(like_count), Value(0)))
+
+
 # 게시물
 class Post(models.Model):
 
@@ -45,11 +75,25 @@ class Post(models.Model):
     category = models.CharField(max_length=50, choices=CATEGORY_CHOICES)
     contents = models.TextField()
     thumbnail_image = models.ImageField(
-        upload_to="thumbnail_images/%Y/%m/%d/", null=True
+        upload_to="thumbnail_images/%Y/%m/%d/",
+        null=True,
+        validators=[validate_image_pixels],
     )
     likes = models.ManyToManyField(
         settings.AUTH_USER_MODEL, through="Like", related_name="author_posts"
     )
     view_count = models.PositiveIntegerField(default=0)
+    like_count = models.PositiveIntegerField(default=0)  # 좋아요 수 (비정규화)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    objects = PostQuerySet.as_manager()
+
+    class Meta:
+        # 게시판 목록 커서 페이지네이션 정렬 (-created_at, -id) 용 인덱스
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="post_feed_idx"),
+            models.Index(
+                fields=["category", "-created_at", "-id"], name="post_category_feed_idx"
+            ),
+        ]
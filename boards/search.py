@@ -0,0 +1,217 @@
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.utils.html import escape
+from .models import Post
+
+
+"""
+게시글 전문 검색 (SQLite FTS5)
+
+- boards_post_fts 가상 테이블에 (title, contents, author_nickname) 를 rowid = post.id 로 저장
+- trigram 토크나이저 사용: 띄어쓰기/조사와 상관없이 한글 부분 문자열로 검색 가능
+    - 3글자 미만 검색어("러닝" 등)는 trigram 으로 찾을 수 없으므로 instr() 로 보완
+- 게시글 생성/수정/삭제, 닉네임 변경 시 시그널로 동기화 (boards/signals.py)
+- SQLite 가 아닌 DB 에서는 icontains 검색으로 동작
+"""
+
+FTS_TABLE = "boards_post_fts"
+MIN_TRIGRAM_LENGTH = 3
+
+# bm25 컬럼 가중치 (title, contents, author_nickname)
+RANK_WEIGHTS = (10.0, 1.0, 5.0)
+
+# 하이라이트 구분자. FTS 결과를 escape 한 뒤 <mark> 태그로 바꿈
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_END = "\x03"
+
+
+def is_search_index_enabled():
+    return connection.vendor == "sqlite"
+
+
+# FTS 테이블 생성. 새로 만든 경우 True 반환
+def create_search_index():
+    if FTS_TABLE in connection.introspection.table_names():
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+            "title, contents, author_nickname, tokenize='trigram')"
+        )
+    return True
+
+
+# 전체 재색인
+def rebuild_search_index():
+    user_table = Post._meta.get_field("author").related_model._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE}(rowid, title, contents, author_nickname) "
+            f"SELECT post.id, post.title, post.contents, author.nickname "
+            f"FROM {Post._meta.db_table} AS post "
+            f"JOIN {user_table} AS author ON author.id = post.author_id"
+        )
+        cursor.execute(f"SELECT count(*) FROM {FTS_TABLE}")
+        return cursor.fetchone()[0]
+
+
+def index_post(post):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT OR REPLACE INTO {FTS_TABLE}(rowid, title, contents, author_nickname) "
+            "VALUES (%s, %s, %s, %s)",
+            [post.pk, post.title, post.contents, post.author.nickname],
+        )
+
+
+def unindex_post(post_id):
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [post_id])
+
+
+# 닉네임이 바뀐 경우에만 해당 유저 게시글의 색인을 갱신
+def update_author_nickname(user):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {FTS_TABLE} SET author_nickname = %s "
+            f"WHERE rowid IN (SELECT id FROM {Post._meta.db_table} WHERE author_id = %s) "
+            "AND author_nickname <> %s",
+            [user.nickname, user.pk, user.nickname],
+        )
+
+
+# 검색어 → (WHERE 절, 파라미터, MATCH 사용 여부)
+def build_search_clause(keyword):
+    terms = keyword.split()
+    trigram_terms = [term for term in terms if len(term) >= MIN_TRIGRAM_LENGTH]
+    short_terms = [term for term in terms if len(term) < MIN_TRIGRAM_LENGTH]
+
+    clauses, params = [], []
+    if trigram_terms:
+        clauses.append(f"{FTS_TABLE} MATCH %s")
+        params.append(
+            " ".join('"' + term.replace('"', '""') + '"' for term in trigram_terms)
+        )
+    for term in short_terms:
+        clauses.append(
+            "(instr(lower(title), lower(%s)) > 0 "
+            "OR instr(lower(contents), lower(%s)) > 0 "
+            "OR instr(lower(author_nickname), lower(%s)) > 0)"
+        )
+        params += [term, term, term]
+    return " AND ".join(clauses), params, bool(trigram_terms)
+
+
+# 게시글 목록 queryset 에 검색 조건 적용
+def filter_posts(queryset, keyword):
+    if not keyword.split():
+        return queryset
+    if not is_search_index_enabled():
+        return queryset.filter(
+            Q(title__icontains=keyword)
+            | Q(contents__icontains=keyword)
+            | Q(author__nickname__icontains=keyword)
+        )
+    where, params, _ = build_search_clause(keyword)
+    return queryset.filter(
+        id__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {where}", params)
+    )
+
+
+def _mark(text):
+    return (
+        escape(text)
+        .replace(HIGHLIGHT_START, "<mark>")
+        .replace(HIGHLIGHT_END, "</mark>")
+    )
+
+
+def _strip_marks(text):
+    return text.replace(HIGHLIGHT_START, "").replace(HIGHLIGHT_END, "")
+
+
+# 짧은 검색어는 FTS 하이라이트가 되지 않으므로 직접 표시
+def _mark_terms(text, terms):
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        lowered = text
+    marks = [False] * len(text)
+    for term in terms:
+        start = lowered.find(term.lower())
+        while start != -1:
+            for i in range(start, start + len(term)):
+                marks[i] = True
+            start = lowered.find(term.lower(), start + 1)
+    result = []
+    for i, char in enumerate(text):
+        if marks[i] and (i == 0 or not marks[i - 1]):
+            result.append(HIGHLIGHT_START)
+        result.append(char)
+        if marks[i] and (i == len(text) - 1 or not marks[i + 1]):
+            result.append(HIGHLIGHT_END)
+    return _mark("".join(result))
+
+
+# 관련도순 검색 결과 (하이라이트 포함)
+def search_posts(keyword, limit=10, offset=0):
+    if not keyword.split() or not is_search_index_enabled():
+        return []
+
+    where, params, uses_match = build_search_clause(keyword)
+    if uses_match:
+        weights = ", ".join(str(weight) for weight in RANK_WEIGHTS)
+        columns = (
+            f"highlight({FTS_TABLE}, 0, %s, %s), "
+            f"snippet({FTS_TABLE}, 1, %s, %s, '…', 16), "
+            f"highlight({FTS_TABLE}, 2, %s, %s), "
+            f"bm25({FTS_TABLE}, {weights})"
+        )
+        column_params = [HIGHLIGHT_START, HIGHLIGHT_END] * 3
+        order_by = "5"
+    else:
+        columns = "title, substr(contents, 1, 100), author_nickname, 0"
+        column_params = []
+        order_by = "rowid DESC"
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT rowid, {columns} FROM {FTS_TABLE} WHERE {where} "
+            f"ORDER BY {order_by} LIMIT %s OFFSET %s",
+            column_params + params + [limit, offset],
+        )
+        rows = cursor.fetchall()
+
+    # 짧은 검색어가 섞이면 FTS 하이라이트 대신 전체 검색어를 직접 표시
+    terms = keyword.split()
+    mark_terms = not uses_match or any(len(term) < MIN_TRIGRAM_LENGTH for term in terms)
+    posts = Post.objects.in_bulk([row[0] for row in rows])
+    results = []
+    for post_id, title, snippet, author_nickname, rank in rows:
+        post = posts.get(post_id)
+        if post is None:
+            continue
+        if mark_terms:
+            title, snippet, author_nickname = (
+                _mark_terms(_strip_marks(text), terms)
+                for text in (title, snippet, author_nickname)
+            )
+        else:
+            title, snippet, author_nickname = (
+                _mark(text) for text in (title, snippet, author_nickname)
+            )
+        results.append(
+            {
+                "id": post_id,
+                "title": title,
+                "snippet": snippet,
+                "author_id": post.author_id,
+                "author_nickname": author_nickname,
+                "post_classification": post.post_classification,
+                "category": post.category,
+                "created_at": post.created_at,
+                "rank": rank,
+            }
+        )
+    return results
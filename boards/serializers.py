@@ -1,6 +1,8 @@
 from rest_framework import serializers
-from .models import Post, Comment, Like
+from .models import Post, Comment
 from config.constants import CLASSIFICATION_CHOICES, CATEGORY_CHOICES
+from config.images import ImageVariantsField, validate_image_pixels
+from config.viewer_state import ViewerStateListSerializer, get_viewer_state
 
 
 # 댓글 수정 및 작성
@@ -14,7 +16,10 @@ class CommentSerializer(serializers.ModelSerializer):
 class PostListSerializer(serializers.ModelSerializer):
     author_nickname = serializers.CharField(source="author.nickname")
     comment_count = serializers.SerializerMethodField()
-    thumbnail_image = serializers.ImageField(required=False, allow_null=True)
+    thumbnail_image = serializers.ImageField(
+        required=False, allow_null=True, validators=[validate_image_pixels]
+    )
+    thumbnail_image_variants = ImageVariantsField(source="thumbnail_image")
 
     class Meta:
         model = Post
@@ -24,6 +29,7 @@ class PostListSerializer(serializers.ModelSerializer):
             "author_nickname",
             "title",
             "thumbnail_image",
+            "thumbnail_image_variants",
             "post_classification",
             "category",
             "view_count",
@@ -32,9 +38,10 @@ class PostListSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
 
-        order_by = ["-created_at"]
-
+    # 댓글 수를 annotate 한 쿼리셋이면 추가 쿼리 없이 사용 (오픈프로필)
     def get_comment_count(self, obj):
+        if hasattr(obj, "annotated_comment_count"):
+            return obj.annotated_comment_count
         return obj.posted_comments.count()
 
     def get_delete_message(self, obj):
@@ -45,7 +52,10 @@ class PostListSerializer(serializers.ModelSerializer):
 class PostDetailSerializer(serializers.ModelSerializer):
     author_nickname = serializers.CharField(source="author.nickname", read_only=True)
     likes = serializers.SerializerMethodField()
-    thumbnail_image = serializers.ImageField(required=False, allow_null=True)
+    thumbnail_image = serializers.ImageField(
+        required=False, allow_null=True, validators=[validate_image_pixels]
+    )
+    thumbnail_image_variants = ImageVariantsField(source="thumbnail_image")
 
     class Meta:
         model = Post
@@ -56,6 +66,7 @@ class PostDetailSerializer(serializers.ModelSerializer):
             "title",
             "contents",
             "thumbnail_image",
+            "thumbnail_image_variants",
             "post_classification",
             "category",
             "view_count",
@@ -63,18 +74,18 @@ class PostDetailSerializer(serializers.ModelSerializer):
             "updated_at",
             "likes",
         ]
+        list_serializer_class = ViewerStateListSerializer
 
     def get_likes(self, obj):
-        user = self.context["request"].user
-        if user.is_authenticated:
-            is_liked = Like.objects.filter(post=obj, author=user).exists()
-            return {"count": obj.likes.count(), "is_liked": is_liked}
-        return {"count": obj.likes.count(), "is_liked": False}
+        is_liked = get_viewer_state(self.context).is_liked_post(obj)
+        return {"count": obj.like_count, "is_liked": is_liked}
 
 
 # 게시글 수정
 class PostUpdateSerializer(serializers.ModelSerializer):
-    thumbnail_image = serializers.ImageField(required=False, allow_null=True)
+    thumbnail_image = serializers.ImageField(
+        required=False, allow_null=True, validators=[validate_image_pixels]
+    )
 
     class Meta:
         model = Post
@@ -102,7 +113,9 @@ class PostUpdateSerializer(serializers.ModelSerializer):
 
 # 게시글 작성
 class PostCreateSerializer(serializers.ModelSerializer):
-    thumbnail_image = serializers.ImageField(required=False, allow_null=True)
+    thumbnail_image = serializers.ImageField(
+        required=False, allow_null=True, validators=[validate_image_pixels]
+    )
     post_classification = serializers.ChoiceField(
         required=True, choices=CLASSIFICATION_CHOICES
     )
@@ -195,10 +208,12 @@ class ProfileLikedPostSerializer(serializers.ModelSerializer):
     like_count = serializers.SerializerMethodField()
 
     def get_comment_count(self, obj):
+        if hasattr(obj, "annotated_comment_count"):
+            return obj.annotated_comment_count
         return Comment.objects.filter(post=obj.post).count()
 
     def get_like_count(self, obj):
-        return obj.post.likes.count()
+        return obj.post.like_count
 
     class Meta:
         model = Post
@@ -0,0 +1,55 @@
+from django.conf import settings
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+from config.images import build_variants_on_save
+from .models import Post
+from . import search
+
+
+"""
+게시글 검색 색인 동기화
+
+- 마이그레이션 후 FTS 테이블 생성 (비어 있으면 기존 게시글로 채움)
+- 게시글 생성/수정 시 색인 갱신, 삭제 시 제거
+- 유저 닉네임 변경 시 해당 유저 게시글의 author_nickname 갱신
+
+좋아요 수 유지
+
+- 좋아요 토글은 views.toggle_like 에서 like_count 를 직접 증감
+- 유저 삭제로 좋아요가 함께 지워질 때 해당 게시글의 like_count 차감
+
+썸네일 변형 생성 (config/images.py), 끝나면 홈 스냅샷의 최신 게시글 갱신
+"""
+
+build_variants_on_save(Post, "thumbnail_image", groups=["posts"])
+
+
+def create_search_index(sender, **kwargs):
+    if search.is_search_index_enabled() and search.create_search_index():
+        search.rebuild_search_index()
+
+
+@receiver(post_save, sender=Post)
+def index_post(sender, instance, **kwargs):
+    if search.is_search_index_enabled():
+        search.index_post(instance)
+
+
+@receiver(post_delete, sender=Post)
+def unindex_post(sender, instance, **kwargs):
+    if search.is_search_index_enabled():
+        search.unindex_post(instance.pk)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def update_author_nickname(sender, instance, created, **kwargs):
+    if not created and search.is_search_index_enabled():
+        search.update_author_nickname(instance)
+
+
+@receiver(pre_delete, sender=settings.AUTH_USER_MODEL)
+def decrease_like_counts(sender, instance, **kwargs):
+    Post.objects.filter(posted_likes__author=instance, like_count__gt=0).update(
+        like_count=F("like_count") - 1
+    )
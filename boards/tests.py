@@ -1,3 +1,474 @@
-from django.test import TestCase
+import shutil
+import tempfile
+from io import BytesIO
+from PIL import Image, ImageOps
+from rest_framework.test import APITestCase, APITransactionTestCase, APIClient
+from django.contrib.auth import get_user_model
+from unittest import mock
+from django.core.cache import caches
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import OperationalError, connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from config.db_router import PrimaryReplicaRouter, RequestState, _request_state
+from config.images import VARIANT_CACHE_ALIAS, strip_metadata, variant_name
+from config.query_budget import QueryBudgetTestMixin
+from config.testing import LOCMEM_SHARED_CACHES, SQLiteReplicaTestMixin
+from config.response_cache import get_cache
+from .models import Comment, Like, Post
+from .view_counter import view_count_buffer
 
-# Create your tests here.
+
+User = get_user_model()
+
+
+# 게시판 목록
+class PostListTestCase(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="testpassword", nickname="러너"
+        )
+        self.posts = [
+            Post.objects.create(
+                title=f"post {i}",
+                author=self.user,
+                post_classification="general",
+                category="general" if i % 2 else "training",
+                contents=f"contents {i}",
+            )
+            for i in range(5)
+        ]
+
+    # 페이지 번호 모드는 최신 글부터 정렬
+    def test_page_list_ordered_by_latest(self):
+        response = self.client.get("/boards/?size=2")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 5)
+        self.assertEqual(
+            [post["id"] for post in response.data["results"]],
+            [self.posts[4].id, self.posts[3].id],
+        )
+
+    # 커서 모드로 끝까지 넘기면 모든 글을 중복 없이 조회
+    def test_cursor_list_walks_all_posts(self):
+        url = "/boards/?cursor=&size=2"
+        post_ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            post_ids += [post["id"] for post in response.data["results"]]
+            url = response.data["next"]
+        self.assertEqual(post_ids, [post.id for post in reversed(self.posts)])
+
+    # 커서 모드에서 with_count=true 이면 전체 수 포함
+    def test_cursor_list_with_count(self):
+        response = self.client.get("/boards/?cursor=&category=training&with_count=true")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(len(response.data["results"]), 3)
+
+
+# 게시글 전문 검색
+class PostSearchTestCase(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="testpassword", nickname="한강러너"
+        )
+        self.post1 = Post.objects.create(
+            title="주말 한강 러닝 크루 모집합니다",
+            author=self.user,
+            post_classification="general",
+            category="general",
+            contents="토요일 아침에 함께 달리실 분을 찾습니다.",
+        )
+        self.post2 = Post.objects.create(
+            title="러닝화 추천 부탁드려요",
+            author=self.user,
+            post_classification="general",
+            category="running_gear",
+            contents="한강에서 주로 달리는데 쿠션 좋은 신발이 필요해요.",
+        )
+
+    # 목록 검색은 제목/내용/닉네임 중 하나라도 일치하면 조회
+    def test_list_search(self):
+        response = self.client.get("/boards/?search=러닝화")
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["id"], self.post2.id)
+
+        response = self.client.get("/boards/?search=한강")
+        self.assertEqual(response.data["count"], 2)
+
+    # 검색 API 는 관련도순 정렬 및 하이라이트 제공
+    def test_search_ranking_and_highlight(self):
+        response = self.client.get("/boards/search?q=크루 모집")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual([result["id"] for result in results], [self.post1.id])
+        self.assertIn("<mark>크루</mark>", results[0]["title"])
+
+        response = self.client.get("/boards/search?q=한강")
+        self.assertEqual(len(response.data["results"]), 2)
+
+    # 수정/삭제/닉네임 변경 시 색인 동기화
+    def test_search_index_follows_changes(self):
+        self.post1.title = "평일 저녁 트랙 훈련"
+        self.post1.save()
+        response = self.client.get("/boards/search?q=트랙 훈련")
+        self.assertEqual(len(response.data["results"]), 1)
+
+        self.user.nickname = "새벽달림이"
+        self.user.save()
+        response = self.client.get("/boards/search?q=새벽달림이")
+        self.assertEqual(len(response.data["results"]), 2)
+
+        self.post2.delete()
+        response = self.client.get("/boards/search?q=새벽달림이")
+        self.assertEqual(len(response.data["results"]), 1)
+
+
+# 게시글 조회수
+@override_settings(CACHES=LOCMEM_SHARED_CACHES, VIEW_COUNT_FLUSH_INTERVAL=0)
+class PostViewCountTestCase(APITestCase):
+    def setUp(self):
+        # 앞선 테스트에서 쌓인 증가분과 중복 확인 기록 정리
+        view_count_buffer.flush()
+        caches["shared"].clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="testpassword", nickname="러너"
+        )
+        self.post = Post.objects.create(
+            title="post",
+            author=self.user,
+            post_classification="general",
+            category="general",
+            contents="contents",
+        )
+
+    # 조회 시 DB 에 쓰지 않고, 같은 조회자의 반복 조회는 한 번만 셈
+    def test_view_count_is_buffered_and_deduplicated(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f"/boards/{self.post.id}/")
+        self.assertFalse(
+            [query for query in queries if not query["sql"].startswith("SELECT")]
+        )
+        self.assertEqual(response.data["view_count"], 1)
+        self.client.get(f"/boards/{self.post.id}/")
+        self.client.get(f"/boards/{self.post.id}/", REMOTE_ADDR="10.0.0.2")
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(f"/boards/{self.post.id}/")
+        self.assertEqual(response.data["view_count"], 3)
+
+        updated_at = Post.objects.get(pk=self.post.pk).updated_at
+        self.assertEqual(view_count_buffer.flush(), 3)
+        post = Post.objects.get(pk=self.post.pk)
+        self.assertEqual(post.view_count, 3)
+        self.assertEqual(post.updated_at, updated_at)
+
+    # X-Forwarded-For 는 신뢰하는 프록시에서 온 요청일 때만 사용
+    def test_forwarded_for_requires_trusted_proxy(self):
+        path = f"/boards/{self.post.id}/"
+        self.client.get(path, HTTP_X_FORWARDED_FOR="10.0.0.3")
+        response = self.client.get(path, HTTP_X_FORWARDED_FOR="10.0.0.4")
+        self.assertEqual(response.data["view_count"], 1)
+
+        with override_settings(TRUSTED_PROXIES=["127.0.0.1"]):
+            self.client.get(path, HTTP_X_FORWARDED_FOR="10.0.0.3, 127.0.0.1")
+            response = self.client.get(path, HTTP_X_FORWARDED_FOR="10.0.0.4")
+        self.assertEqual(response.data["view_count"], 3)
+
+    # 반영에 실패한 증가분은 버퍼에 남아 다음 반영 때 다시 시도
+    def test_failed_flush_keeps_pending_counts(self):
+        self.client.get(f"/boards/{self.post.id}/")
+        with mock.patch(
+            "django.db.models.QuerySet.update", side_effect=OperationalError
+        ):
+            with self.assertRaises(OperationalError):
+                view_count_buffer.flush()
+        self.assertEqual(view_count_buffer.pending(self.post.id), 1)
+        self.assertEqual(view_count_buffer.flush(), 1)
+        self.assertEqual(Post.objects.get(pk=self.post.pk).view_count, 1)
+
+
+# 게시글 좋아요
+class PostLikeTestCase(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="testpassword", nickname="러너"
+        )
+        self.other_user = User.objects.create_user(
+            email="otheruser@example.com", password="testpassword", nickname="러너2"
+        )
+        self.post1 = Post.objects.create(
+            title="post 1",
+            author=self.user,
+            post_classification="general",
+            category="general",
+            contents="contents",
+        )
+        self.post2 = Post.objects.create(
+            title="post 2",
+            author=self.user,
+            post_classification="general",
+            category="general",
+            contents="contents",
+        )
+
+    # 좋아요 토글 시 like_count 증감
+    def test_like_toggle(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(f"/boards/{self.post1.id}/like")
+        self.assertEqual(response.json(), {"count": 1, "is_liked": True})
+
+        self.client.force_authenticate(user=self.other_user)
+        response = self.client.post(f"/boards/{self.post1.id}/like")
+        self.assertEqual(response.json(), {"count": 2, "is_liked": True})
+        response = self.client.post(f"/boards/{self.post1.id}/like")
+        self.assertEqual(response.json(), {"count": 1, "is_liked": False})
+
+        response = self.client.get(f"/boards/{self.post1.id}/like")
+        self.assertEqual(response.json(), {"count": 1, "is_liked": False})
+
+        response = self.client.post("/boards/9999/like")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    # 여러 게시글의 좋아요 수/여부 일괄 조회
+    def test_like_status_list(self):
+        self.client.force_authenticate(user=self.user)
+        self.client.post(f"/boards/{self.post2.id}/like")
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                f"/boards/likes?ids={self.post1.id},{self.post2.id}"
+            )
+        self.assertEqual(
+            response.json(),
+            {
+                str(self.post1.id): {"count": 0, "is_liked": False},
+                str(self.post2.id): {"count": 1, "is_liked": True},
+            },
+        )
+
+    # 좋아요 누른 유저가 탈퇴하면 like_count 차감
+    def test_like_count_follows_user_delete(self):
+        self.client.force_authenticate(user=self.other_user)
+        self.client.post(f"/boards/{self.post1.id}/like")
+        self.other_user.delete()
+        self.assertEqual(Post.objects.get(pk=self.post1.pk).like_count, 0)
+
+
+# 썸네일 변형 생성 (config/images.py), 커밋 후 요청 스레드에서 바로 생성
+@override_settings(
+    CACHES=LOCMEM_SHARED_CACHES, IMAGE_VARIANT_THREADS=0, VIEW_COUNT_FLUSH_INTERVAL=0
+)
+class PostThumbnailVariantTestCase(APITestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="testpassword", nickname="러너"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.addCleanup(view_count_buffer.flush)
+        caches[VARIANT_CACHE_ALIAS].clear()
+
+    # 촬영 위치(GPS)와 회전 정보가 들어간 1600x1200 JPEG
+    def create_upload(self, size=(1600, 1200)):
+        exif = Image.Exif()
+        exif[0x0112] = 6  # 90도 회전
+        exif[0x8825] = {2: (37.0, 30.0, 0.0)}  # GPS 위도
+        buffer = BytesIO()
+        Image.new("RGB", size, "red").save(buffer, "JPEG", exif=exif.tobytes())
+        return SimpleUploadedFile("photo.jpg", buffer.getvalue(), "image/jpeg")
+
+    def create_post(self, upload):
+        return self.client.post(
+            "/boards/",
+            {
+                "title": "사진",
+                "contents": "내용",
+                "category": "general",
+                "post_classification": "general",
+                "thumbnail_image": upload,
+            },
+            format="multipart",
+        )
+
+    def test_upload_builds_variants(self):
+        upload = self.create_upload()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.create_post(upload)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        post = Post.objects.get()
+        name = post.thumbnail_image.name
+
+        # 원본은 방향 태그만 남기고 EXIF 제거, 이미지 데이터는 다시 인코딩하지 않음
+        with default_storage.open(name) as file:
+            data = file.read()
+        original = Image.open(BytesIO(data))
+        self.assertEqual(dict(original.getexif()), {0x0112: 6})
+        self.assertEqual(ImageOps.exif_transpose(original).size, (1200, 1600))
+        uploaded = upload.open().read()
+        scan = uploaded.index(b"\xff\xda")
+        self.assertTrue(data.endswith(uploaded[scan:]))
+        self.assertFalse(strip_metadata(default_storage, name))
+
+        for width in (200, 480, 1080):
+            for extension, image_format in (("webp", "WEBP"), ("jpeg", "JPEG")):
+                with default_storage.open(variant_name(name, width, extension)) as file:
+                    variant = Image.open(file)
+                    self.assertEqual(variant.format, image_format)
+                    self.assertEqual(variant.size, (width, round(width * 4 / 3)))
+
+        variants = self.client.get(f"/boards/{post.id}/").data["thumbnail_image_variants"]
+        self.assertEqual(list(variants), ["webp", "jpeg"])
+        self.assertTrue(variants["webp"]["200w"].endswith("/200w.webp"))
+        self.assertTrue(variants["jpeg"]["1080w"].startswith("http://testserver/media/"))
+
+    def test_variants_are_null_until_built(self):
+        self.create_post(self.create_upload())
+        data = self.client.get(f"/boards/{Post.objects.get().id}/").data
+        self.assertIsNotNone(data["thumbnail_image"])
+        self.assertIsNone(data["thumbnail_image_variants"])
+
+        # 준비 여부는 캐시되어 다음 응답에서는 저장소를 조회하지 않음
+        with mock.patch.object(FileSystemStorage, "exists") as exists:
+            self.client.get(f"/boards/{Post.objects.get().id}/")
+        exists.assert_not_called()
+
+    @override_settings(IMAGE_MAX_PIXELS=1000)
+    def test_rejects_too_large_image(self):
+        response = self.create_post(self.create_upload())
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("thumbnail_image", response.data)
+        self.assertFalse(Post.objects.exists())
+
+
+# 쿼리 예산 (config/query_budget.py)
+@override_settings(CACHES=LOCMEM_SHARED_CACHES, VIEW_COUNT_FLUSH_INTERVAL=0)
+class PostQueryBudgetTestCase(QueryBudgetTestMixin, APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="testpassword", nickname="러너"
+        )
+        self.post = Post.objects.create(
+            title="post",
+            author=self.user,
+            post_classification="general",
+            category="general",
+            contents="contents",
+        )
+        self.seeded = 0
+
+    # 다른 작성자의 게시글과 댓글/좋아요를 n개씩 추가
+    # (측정 중 조회수 버퍼의 주기적 반영이 끼어들지 않도록 먼저 비움)
+    def seed(self, n):
+        view_count_buffer.flush()
+        for _ in range(n):
+            self.seeded += 1
+            author = User.objects.create(
+                username=f"seed{self.seeded}",
+                email=f"seed{self.seeded}@example.com",
+                nickname=f"러너{self.seeded}",
+            )
+            post = Post.objects.create(
+                title=f"seed post {self.seeded}",
+                author=author,
+                post_classification="general",
+                category="general",
+                contents="contents",
+            )
+            Comment.objects.create(author=author, post=post, contents="comment")
+            Comment.objects.create(author=author, post=self.post, contents="comment")
+            Like.objects.create(author=author, post=self.post)
+
+    def test_post_query_budget(self):
+        for user in [None, self.user]:
+            self.client.force_authenticate(user=user)
+            self.assertQueryBudget("/boards/", self.seed)
+            self.assertQueryBudget("/boards/?cursor=", self.seed)
+            self.assertQueryBudget(f"/boards/{self.post.id}/", self.seed)
+            self.assertQueryBudget(f"/boards/{self.post.id}/comments/", self.seed)
+
+
+# 복제본 라우팅 (config/db_router.py), sync_replica() 전까지 복제본은 이전 상태
+class PostReplicaRoutingTestCase(SQLiteReplicaTestMixin, APITransactionTestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="testpassword", nickname="러너"
+        )
+        self.other_user = User.objects.create_user(
+            email="otheruser@example.com", password="testpassword", nickname="러너2"
+        )
+        self.post = Post.objects.create(
+            title="post 1",
+            author=self.user,
+            post_classification="general",
+            category="general",
+            contents="contents",
+        )
+        super().setUp()
+
+    # GET 요청의 읽기는 복제본, 동기화 후에 새 글이 보임
+    def test_get_reads_from_replica(self):
+        Post.objects.create(
+            title="post 2",
+            author=self.user,
+            post_classification="general",
+            category="general",
+            contents="contents",
+        )
+        self.assertEqual(self.client.get("/boards/").data["count"], 1)
+
+        self.sync_replica()
+        get_cache().clear()
+        self.assertEqual(self.client.get("/boards/").data["count"], 2)
+
+    # 쓰기를 한 유저는 잠시 primary 에서 읽고, 다른 유저는 복제본에서 읽음
+    def test_read_your_writes(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(f"/boards/{self.post.id}/like")
+        self.assertEqual(response.json(), {"count": 1, "is_liked": True})
+        response = self.client.get(f"/boards/{self.post.id}/like")
+        self.assertEqual(response.json(), {"count": 1, "is_liked": True})
+
+        self.client.force_authenticate(user=self.other_user)
+        response = self.client.get(f"/boards/{self.post.id}/like")
+        self.assertEqual(response.json(), {"count": 0, "is_liked": False})
+
+        with override_settings(READ_YOUR_WRITES_SECONDS=0):
+            self.client.post(f"/boards/{self.post.id}/like")
+            response = self.client.get(f"/boards/{self.post.id}/like")
+        self.assertEqual(response.json(), {"count": 0, "is_liked": False})
+
+    # 복제본이 여러 개여도 한 요청의 읽기는 같은 복제본
+    def test_request_reads_one_replica(self):
+        request = APIClient().get("/boards/").wsgi_request
+        router = PrimaryReplicaRouter()
+        with override_settings(DATABASE_REPLICAS=["replica1", "replica2", "replica3"]):
+            for _ in range(5):
+                token = _request_state.set(RequestState(request))
+                try:
+                    aliases = {router.db_for_read(Post) for _ in range(20)}
+                finally:
+                    _request_state.reset(token)
+                self.assertEqual(len(aliases), 1)
+
+    # @use_primary 뷰는 GET 이어도 primary 에서 읽음
+    def test_use_primary_view(self):
+        Like.objects.create(author=self.other_user, post=self.post)
+        Post.objects.filter(pk=self.post.pk).update(like_count=1)
+        response = self.client.get(f"/boards/likes?ids={self.post.id}")
+        self.assertEqual(response.json()[str(self.post.id)]["count"], 1)
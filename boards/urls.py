@@ -1,6 +1,13 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import like_post, PostViewSet, get_category_choices, CommentViewSet
+from .views import (
+    like_post,
+    like_status_list,
+    PostViewSet,
+    get_category_choices,
+    search_post_list,
+    CommentViewSet,
+)
 
 # router 객체 생성
 router = DefaultRouter()
@@ -16,4 +23,6 @@ urlpatterns = [
     # 좋아요 기능을 위한 URL 패턴
     path("<int:post_id>/like", like_post, name="like_post"),
     path("category", get_category_choices, name="category_choices"),
+    path("search", search_post_list, name="search_post_list"),
+    path("likes", like_status_list, name="like_status_list"),
 ]
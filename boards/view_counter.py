@@ -0,0 +1,146 @@
+import atexit
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DatabaseError, connection
+from django.db.models import F
+from .models import Post
+
+logger = logging.getLogger(__name__)
+
+
+"""
+게시글 조회수 write-behind 버퍼
+
+- 조회 시 DB 에 쓰지 않고 프로세스 메모리에 증가분만 쌓아둠
+- 같은 조회자(로그인 유저 id 또는 IP)가 DEDUP_WINDOW 초 안에 다시 보면 세지 않음
+    - CACHES[DEDUP_CACHE_ALIAS] 에 cache.add, 워커 프로세스끼리 공유하는 캐시라 다른 워커로 가도 중복 제외
+        - 기본값 locmem 은 프로세스 안에서만 공유, 워커가 여러 개면 SHARED_CACHE_BACKEND=redis/memcached
+    - X-Forwarded-For 는 TRUSTED_PROXIES 에서 온 요청일 때만 사용 (아니면 누구나 IP 를 바꿔 중복 확인을 피할 수 있음)
+- 요청 스레드에서는 반영하지 않고 백그라운드 스레드가 VIEW_COUNT_FLUSH_INTERVAL 초마다 반영
+    - MAX_PENDING 건이 쌓이면 주기를 기다리지 않고 바로 반영
+    - 증가분이 같은 게시글끼리 묶어 UPDATE ... SET view_count = view_count + n
+    - F() 로 더하므로 여러 워커 프로세스가 동시에 반영해도 유실 없음
+    - 반영에 실패한 증가분은 버퍼로 되돌려 다음 주기에 다시 반영
+- 프로세스 종료 시 남은 증가분 반영 (atexit)
+"""
+
+MAX_PENDING = 1000
+DEDUP_WINDOW = 60 * 30
+DEDUP_CACHE_ALIAS = "shared"
+
+
+def get_flush_interval():
+    return getattr(settings, "VIEW_COUNT_FLUSH_INTERVAL", 10)
+
+
+def get_trusted_proxies():
+    return getattr(settings, "TRUSTED_PROXIES", [])
+
+
+# 신뢰하는 프록시를 거쳐 온 요청이면 X-Forwarded-For 에서 프록시가 아닌 가장 가까운 주소
+def get_client_ip(request):
+    remote_addr = request.META.get("REMOTE_ADDR", "")
+    trusted = get_trusted_proxies()
+    if remote_addr not in trusted:
+        return remote_addr
+    forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR", "")
+    addresses = [ip.strip() for ip in forwarded_for.split(",") if ip.strip()]
+    for ip in reversed(addresses):
+        if ip not in trusted:
+            return ip
+    return addresses[0] if addresses else remote_addr
+
+
+def get_viewer_key(request):
+    if request.user.is_authenticated:
+        return f"user:{request.user.pk}"
+    return f"ip:{get_client_ip(request)}"
+
+
+class ViewCountBuffer:
+    def __init__(self):
+        self._pending = Counter()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    # 조회 기록. 새로 센 경우 True
+    def record(self, post_id, viewer_key):
+        cache = caches[DEDUP_CACHE_ALIAS]
+        if not cache.add(f"boards:viewed:{post_id}:{viewer_key}", 1, DEDUP_WINDOW):
+            return False
+        with self._lock:
+            self._pending[post_id] += 1
+            full = sum(self._pending.values()) >= MAX_PENDING
+        if get_flush_interval() > 0:
+            self._start_flusher()
+            if full:
+                self._wake.set()
+        return True
+
+    # 아직 DB 에 반영되지 않은 증가분
+    def pending(self, post_id):
+        with self._lock:
+            return self._pending[post_id]
+
+    # 반영한 조회수 합계, DatabaseError 면 반영하지 못한 증가분을 되돌린 뒤 다시 발생
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+        if not pending:
+            return 0
+
+        post_ids_by_count = defaultdict(list)
+        for post_id, count in pending.items():
+            post_ids_by_count[count].append(post_id)
+        flushed = 0
+        try:
+            for count, post_ids in post_ids_by_count.items():
+                Post.objects.filter(pk__in=post_ids).update(
+                    view_count=F("view_count") + count
+                )
+                for post_id in post_ids:
+                    del pending[post_id]
+                flushed += count * len(post_ids)
+        finally:
+            if pending:
+                with self._lock:
+                    self._pending.update(pending)
+        return flushed
+
+    # 프로세스마다 하나 (fork 된 워커에서는 처음 기록할 때 새로 시작)
+    def _start_flusher(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run_flusher, name="view-count-flusher", daemon=True
+            )
+            self._thread.start()
+
+    def _run_flusher(self):
+        while True:
+            self._wake.wait(get_flush_interval() or 1)
+            self._wake.clear()
+            if get_flush_interval() <= 0:
+                continue
+            try:
+                self.flush()
+            except DatabaseError:
+                logger.exception("게시글 조회수 반영에 실패했습니다.")
+                connection.close()
+
+
+view_count_buffer = ViewCountBuffer()
+
+
+@atexit.register
+def flush_on_exit():
+    try:
+        view_count_buffer.flush()
+    except DatabaseError:
+        logger.exception("게시글 조회수 반영에 실패했습니다.")
@@ -8,18 +8,38 @@ from .serializers import (
     PostCreateSerializer,
 )
 from .permissions import IsAuthorOrReadOnly, IsStaffOrGeneralClassification
-from django.http import JsonResponse
+from .search import filter_posts, search_posts
+from .view_counter import view_count_buffer, get_viewer_key
+from config.viewer_state import get_viewer_state
+from config.response_cache import cache_anonymous_response
+from config.query_budget import query_budget
+from config.db_router import use_primary
+from django.http import Http404, JsonResponse
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
 from django.shortcuts import get_object_or_404
-from django.db.models import Q
-from rest_framework.pagination import PageNumberPagination
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination, CursorPagination
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
 from rest_framework import viewsets, status
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
+import hashlib
+
+
+# 전체 개수는 pk 만 세어 댓글 수 서브쿼리를 모든 행에서 실행하지 않음
+class PostPaginator(Paginator):
+    @cached_property
+    def count(self):
+        return self.object_list.values("pk").count()
 
 
 # Pagination
 class CustomPagination(PageNumberPagination):
+    django_paginator_class = PostPaginator
     page_size = 10
     page_size_query_param = "size"
     max_page_size = 1000
@@ -28,6 +48,35 @@ class CustomPagination(PageNumberPagination):
         return Response({"count": self.page.paginator.count, "results": data})
 
 
+# 게시물 개수 캐싱 (필터 조건별, POST_COUNT_CACHE_TIMEOUT 초 동안 근사값 사용)
+POST_COUNT_CACHE_TIMEOUT = 60
+
+
+def get_cached_count(queryset, key):
+    key = hashlib.md5(key.encode()).hexdigest()
+    return cache.get_or_set(
+        f"boards:post_count:{key}", queryset.count, POST_COUNT_CACHE_TIMEOUT
+    )
+
+
+# Cursor Pagination (무한 스크롤용, OFFSET 없이 (-created_at, -id) 인덱스를 따라 조회)
+class PostCursorPagination(CursorPagination):
+    page_size = 10
+    page_size_query_param = "size"
+    max_page_size = 100
+    ordering = ("-created_at", "-id")
+
+    def get_paginated_response(self, data, count=None):
+        response_data = {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+        if count is not None:
+            response_data["count"] = count
+        return Response(response_data)
+
+
 # Post
 @extend_schema_view(
     list=extend_schema(
@@ -40,11 +89,21 @@ class CustomPagination(PageNumberPagination):
             OpenApiParameter(
                 name="post_classification", description="게시물 분류", type=str
             ),
+            OpenApiParameter(
+                name="cursor",
+                description="커서 페이지네이션 사용 (첫 페이지는 빈 값, 이후 next/previous 링크 사용)",
+                type=str,
+            ),
+            OpenApiParameter(
+                name="with_count",
+                description="커서 모드에서 캐시된 전체 게시물 수 포함 여부 (true/false)",
+                type=bool,
+            ),
         ]
     )
 )
 class PostViewSet(viewsets.ModelViewSet):
-    queryset = Post.objects.all()
+    queryset = Post.objects.select_related("author")
     serializer_class = PostListSerializer
     pagination_class = CustomPagination
     permission_classes = [IsAuthorOrReadOnly, IsStaffOrGeneralClassification]
@@ -55,18 +114,16 @@ class PostViewSet(viewsets.ModelViewSet):
         return context
 
     # 게시물 전체 보기 및 쿼리스트림
+    @query_budget(2)
     def list(self, request):
         queryset = super().get_queryset()
         search_keyword = self.request.GET.get("search", "")
         selected_category = self.request.GET.get("category", "")
         selected_post_classification = self.request.GET.get("post_classification", "")
 
+        # 제목/내용/작성자 닉네임 전문 검색 (boards/search.py)
         if search_keyword:
-            queryset = queryset.filter(
-                Q(title__icontains=search_keyword)
-                & Q(contents__icontains=search_keyword)
-                & Q(author__nickname__icontains=search_keyword)
-            )
+            queryset = filter_posts(queryset, search_keyword)
 
         if selected_category:
             queryset = queryset.filter(category=selected_category)
@@ -74,8 +131,26 @@ class PostViewSet(viewsets.ModelViewSet):
         if selected_post_classification:
             queryset = queryset.filter(post_classification=selected_post_classification)
 
+        # 댓글 수를 페이지 조회 쿼리에서 함께 계산 (작성자는 queryset 의 select_related)
+        # GROUP BY 대신 상관 서브쿼리라 페이지에 포함된 게시글만 계산 (boards/models.py)
+        page_queryset = queryset.with_comment_count()
+
+        # cursor 파라미터가 있으면 커서 모드 (전체 COUNT 없이 페이지 크기만큼만 조회)
+        if "cursor" in request.GET:
+            paginator = PostCursorPagination()
+            paginated_queryset = paginator.paginate_queryset(page_queryset, request)
+            serializer = self.get_serializer(paginated_queryset, many=True)
+            count = None
+            if request.GET.get("with_count") == "true":
+                count = get_cached_count(
+                    queryset,
+                    f"{search_keyword}:{selected_category}:{selected_post_classification}",
+                )
+            return paginator.get_paginated_response(serializer.data, count=count)
+
+        page_queryset = page_queryset.order_by("-created_at", "-id")
         paginator = self.pagination_class()
-        paginated_queryset = paginator.paginate_queryset(queryset, request)
+        paginated_queryset = paginator.paginate_queryset(page_queryset, request)
         serializer = self.get_serializer(paginated_queryset, many=True)
 
         return paginator.get_paginated_response(serializer.data)
@@ -90,11 +165,12 @@ class PostViewSet(viewsets.ModelViewSet):
             return PostUpdateSerializer
         return super().get_serializer_class()
 
-    # 조회수 증가
+    # 조회수 증가 (boards/view_counter.py 버퍼에 쌓았다가 주기적으로 반영)
+    @query_budget(2)
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
-        instance.view_count += 1
-        instance.save()
+        view_count_buffer.record(instance.pk, get_viewer_key(request))
+        instance.view_count += view_count_buffer.pending(instance.pk)
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
 
@@ -107,11 +183,33 @@ class PostViewSet(viewsets.ModelViewSet):
         return Response({"message": delete_message}, status=status.HTTP_200_OK)
 
 
+# 좋아요 토글. Like 삭제(없으면 추가)와 like_count 증감을 한 트랜잭션에서 처리
+# - Like 에는 시그널이 없어 filter().delete() 가 DELETE 한 번으로 끝남
+# - 게시글이 없으면 like_count UPDATE 가 0건이므로 롤백 후 404
+def toggle_like(author, post_id):
+    with transaction.atomic():
+        deleted, _ = Like.objects.filter(author=author, post_id=post_id).delete()
+        is_liked = not deleted
+        if is_liked:
+            try:
+                with transaction.atomic():
+                    Like.objects.create(author=author, post_id=post_id)
+            except IntegrityError:
+                # 동시에 들어온 요청이 먼저 추가한 경우
+                return True, Post.objects.values_list("like_count", flat=True).get(
+                    pk=post_id
+                )
+        delta = 1 if is_liked else -1
+        if not Post.objects.filter(pk=post_id).update(
+            like_count=Greatest(F("like_count") + delta, 0)
+        ):
+            raise Http404
+    return is_liked, Post.objects.values_list("like_count", flat=True).get(pk=post_id)
+
+
 # LIKE API /boards/{post_id}/like
 @api_view(["GET", "POST"])
 def like_post(request, post_id):
-
-    post = get_object_or_404(Post, pk=post_id)
     author = request.user
 
     # POST 접근
@@ -119,27 +217,78 @@ def like_post(request, post_id):
         if not author.is_authenticated:
             return JsonResponse({"error": "User is not authenticated"}, status=400)
 
-        like, created = Like.objects.get_or_create(author=author, post=post)
-        if not created:
-            like.delete()
-
-        like_count = Like.objects.filter(post=post).count()
-        is_liked = Like.objects.filter(author=author, post=post).exists()
-
+        is_liked, like_count = toggle_like(author, post_id)
         response_data = {"count": like_count, "is_liked": is_liked}
         return JsonResponse(response_data)
     else:
         # GET 요청 처리
-        like_count = Like.objects.filter(post=post).count()
+        post = get_object_or_404(Post.objects.only("id", "like_count"), pk=post_id)
         is_liked = False
         if author.is_authenticated:
             is_liked = Like.objects.filter(author=author, post=post).exists()
-        response_data = {"count": like_count, "is_liked": is_liked}
+        response_data = {"count": post.like_count, "is_liked": is_liked}
         return JsonResponse(response_data)
 
 
+# 여러 게시글의 좋아요 수/여부 조회 /boards/likes?ids=1,2,3
+# - 다른 유저의 좋아요가 바로 보이도록 복제본 대신 primary 에서 조회
+@extend_schema(
+    parameters=[
+        OpenApiParameter(
+            name="ids", description="게시글 id 목록 (쉼표 구분, 최대 100개)", type=str
+        ),
+    ]
+)
+@api_view(["GET"])
+@query_budget(2)
+@use_primary
+def like_status_list(request):
+    try:
+        post_ids = [
+            int(post_id) for post_id in request.GET.get("ids", "").split(",") if post_id
+        ][:100]
+    except ValueError:
+        return JsonResponse({"error": "ids 는 숫자여야 합니다."}, status=400)
+
+    posts = Post.objects.filter(pk__in=post_ids).only("id", "like_count")
+    viewer_state = get_viewer_state({"request": request})
+    viewer_state.add(posts)
+    response_data = {
+        str(post.pk): {
+            "count": post.like_count,
+            "is_liked": viewer_state.is_liked_post(post),
+        }
+        for post in posts
+    }
+    return JsonResponse(response_data)
+
+
+# 게시글 검색 API /boards/search?q=키워드 (관련도순, 하이라이트 포함)
+@extend_schema(
+    parameters=[
+        OpenApiParameter(name="q", description="검색 키워드", type=str),
+        OpenApiParameter(name="page", description="x번째 페이지", type=int),
+        OpenApiParameter(name="size", description="페이지당 게시물 수", type=int),
+    ]
+)
+@api_view(["GET"])
+def search_post_list(request):
+    keyword = request.GET.get("q", "")
+    try:
+        page = max(int(request.GET.get("page", 1)), 1)
+        size = min(max(int(request.GET.get("size", 10)), 1), 50)
+    except ValueError:
+        return Response(
+            {"error": "page, size 는 숫자여야 합니다."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    results = search_posts(keyword, limit=size, offset=(page - 1) * size)
+    return Response({"results": results})
+
+
 # Category, post_classification API
 @api_view(["GET"])
+@cache_anonymous_response()
 def get_category_choices(request):
     post_classification_choices = [
         {"value": choice[0], "label": choice[1]} for choice in CLASSIFICATION_CHOICES
@@ -163,7 +312,11 @@ class CommentViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         post_id = self.kwargs["post_id"]
-        return Comment.objects.filter(post_id=post_id)
+        return Comment.objects.filter(post_id=post_id).select_related("author")
+
+    @query_budget(1)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
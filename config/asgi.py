@@ -5,6 +5,8 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/4.0/howto/deployment/asgi/
+
+배포 설정은 config/gunicorn_asgi.py 참고 (비동기 뷰는 config/async_sections.py)
 """
 
 import os
@@ -0,0 +1,112 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.db import close_old_connections
+from django.http import HttpResponseNotAllowed, JsonResponse
+from django.utils.log import log_response
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+
+"""
+비동기 뷰 공통 (ASGI, config/asgi.py)
+
+- Django 4.0 에는 비동기 ORM(aget, afirst ...)이 없으므로 섹션 단위 동기 함수(쿼리 + 직렬화)를 sync_to_async 로 실행
+- 서로 독립적인 섹션은 gather_sections 로 동시에 실행
+    - ASYNC_CONCURRENT_SECTIONS=True: 섹션마다 전용 스레드 풀(ASYNC_SECTION_THREADS 개)의 별도 스레드(= 별도 DB 연결)에서 실행
+        - 풀 크기가 프로세스당 섹션용 DB 연결 수의 상한, 섹션이 끝나면 CONN_MAX_AGE 가 지난 연결 정리
+    - False: 요청 스레드에서 순서대로 실행 (테스트 트랜잭션 안의 데이터를 보려면 False)
+    - 복제본 라우터 상태(config/db_router.py)는 ContextVar 라 섹션 스레드에도 전달됨
+- DRF 뷰를 거치지 않으므로 인증은 authenticate() 로 DEFAULT_AUTHENTICATION_CLASSES 를 직접 실행
+- HTTP 메서드 제한은 require_GET (Django 4.0 의 django.views.decorators.http 는 비동기 뷰를 감싸지 못함)
+"""
+
+
+def is_concurrent():
+    return getattr(settings, "ASYNC_CONCURRENT_SECTIONS", True)
+
+
+@lru_cache(maxsize=None)
+def get_executor():
+    return ThreadPoolExecutor(
+        max_workers=getattr(settings, "ASYNC_SECTION_THREADS", 8),
+        thread_name_prefix="async-section",
+    )
+
+
+def _run_section(loader):
+    try:
+        return loader()
+    finally:
+        close_old_connections()
+
+
+# {이름: 동기 함수} 를 실행해 {이름: 결과} 반환
+async def gather_sections(**loaders):
+    if not is_concurrent():
+        return await sync_to_async(
+            lambda: {name: loader() for name, loader in loaders.items()}
+        )()
+    results = await asyncio.gather(
+        *(
+            sync_to_async(
+                _run_section, thread_sensitive=False, executor=get_executor()
+            )(loader)
+            for loader in loaders.values()
+        )
+    )
+    return dict(zip(loaders, results))
+
+
+# 비동기 뷰용 require_GET (GET 이 아니면 405)
+def require_GET(view_func):
+    @functools.wraps(view_func)
+    async def inner(request, *args, **kwargs):
+        if request.method != "GET":
+            response = HttpResponseNotAllowed(["GET"])
+            log_response(
+                "Method Not Allowed (%s): %s",
+                request.method,
+                request.path,
+                response=response,
+                request=request,
+            )
+            return response
+        return await view_func(request, *args, **kwargs)
+
+    return inner
+
+
+def _authenticate(request):
+    for authentication_class in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+        result = authentication_class().authenticate(request)
+        if result is not None:
+            return result[0]
+    return AnonymousUser()
+
+
+# request.user 설정, 토큰이 잘못되었으면 오류 응답 반환
+async def authenticate(request):
+    try:
+        request.user = await sync_to_async(_authenticate)(request)
+    except APIException as error:
+        return JsonResponse({"detail": error.detail}, status=error.status_code)
+    return None
+
+
+# 페이지네이션/시리얼라이저 context 용 DRF Request (인증은 authenticate() 결과 사용)
+def as_drf_request(request):
+    drf_request = Request(request, authenticators=())
+    drf_request.user = request.user
+    return drf_request
+
+
+def json_response(data, status=200):
+    return JsonResponse(
+        data, status=status, safe=False, json_dumps_params={"ensure_ascii": False}
+    )
@@ -27,6 +27,12 @@ LOCATION_CITY_CHOICES = (
     ("etc", "기타"),
 )
 
+LEADERBOARD_PERIOD_CHOICES = (
+    ("week", "주간"),
+    ("month", "월간"),
+    ("all", "전체"),
+)
+
 CATEGORY_CHOICES = (
     ("general", "일반"),
     ("training", "훈련"),
@@ -0,0 +1,162 @@
+import random
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.functional import LazyObject, empty
+from config.query_budget import get_handler_name
+
+
+"""
+읽기 전용 복제본(replica) 라우터
+
+- settings.DATABASE_REPLICAS 에 등록된 별칭이 있으면 안전한 메서드(GET/HEAD/OPTIONS) 요청의 읽기를 복제본 중 하나로 보냄
+    - 복제본은 요청마다 한 번 고르고 그 요청의 읽기는 모두 같은 복제본 (복제 지연이 다른 복제본을 섞어 읽지 않도록)
+    - 쓰기, 쓰기 요청(POST/PUT/PATCH/DELETE)의 읽기, 요청 밖(관리 커맨드, 셸)의 읽기는 모두 primary(default)
+    - 복제본이 없으면 항상 default
+- read-your-writes: 요청 안에서 쓰기가 일어나면
+    - 같은 요청의 이후 읽기는 primary
+    - 로그인 유저라면 READ_YOUR_WRITES_SECONDS 동안 그 유저의 읽기도 primary (CACHES["default"] 에 기록)
+    - 유저는 DRF 인증이 끝난 뒤 알 수 있으므로, JWT 인증 자체의 유저 조회는 복제본에서 읽음
+- 복제 지연을 허용할 수 없는 뷰는 @use_primary 로 제외 (함수형 뷰는 @api_view 아래, 뷰셋은 액션 메서드 위)
+- PrimaryReplicaMiddleware 가 요청마다 상태를 만들고 끝나면 정리 (ContextVar 라 스레드/비동기 요청 간 공유되지 않음)
+    - 동기/비동기 모두 지원해 ASGI 에서 비동기 뷰까지 스레드 전환 없이 전달
+"""
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+PIN_CACHE_ALIAS = "default"
+PRIMARY_VIEWS = set()
+
+_request_state = ContextVar("db_router_request_state", default=None)
+
+
+def use_primary(view_func):
+    PRIMARY_VIEWS.add(get_handler_name(view_func))
+    return view_func
+
+
+def get_replicas():
+    return getattr(settings, "DATABASE_REPLICAS", [])
+
+
+def get_pin_seconds():
+    return getattr(settings, "READ_YOUR_WRITES_SECONDS", 5)
+
+
+def _pin_key(user_id):
+    return f"db_router:pinned:{user_id}"
+
+
+# 인증이 끝난 유저 (아직 평가되지 않은 세션 유저는 조회 쿼리가 다시 라우터를 타므로 제외)
+def _get_authenticated_user(request):
+    user = getattr(request, "user", None)
+    if isinstance(user, LazyObject) and user._wrapped is empty:
+        return None
+    if user is None or not user.is_authenticated:
+        return None
+    return user
+
+
+class RequestState:
+    def __init__(self, request):
+        self.request = request
+        self.use_primary = request.method not in SAFE_METHODS
+        self.wrote = False
+        self.checked_view = False
+        self.checked_user_id = None
+        self.replica = None
+
+    # 이 요청이 읽을 복제본 (처음 읽을 때 고름)
+    def get_replica(self, replicas):
+        if self.replica not in replicas:
+            self.replica = random.choice(replicas)
+        return self.replica
+
+    # @use_primary 뷰인지 확인 (URL 이 resolve 된 뒤 한 번)
+    def is_primary_view(self):
+        match = getattr(self.request, "resolver_match", None)
+        if self.checked_view or match is None:
+            return False
+        self.checked_view = True
+        return get_handler_name(match.func, self.request.method.lower()) in PRIMARY_VIEWS
+
+    # @use_primary 뷰이거나 최근에 쓰기를 한 유저인지 확인 (유저별 캐시 조회 1번)
+    def should_use_primary(self):
+        if self.use_primary:
+            return True
+        if PRIMARY_VIEWS and self.is_primary_view():
+            self.use_primary = True
+            return True
+        user = _get_authenticated_user(self.request)
+        if user is not None and user.pk != self.checked_user_id:
+            self.checked_user_id = user.pk
+            self.use_primary = caches[PIN_CACHE_ALIAS].get(_pin_key(user.pk)) is not None
+        return self.use_primary
+
+    def record_write(self):
+        self.wrote = True
+        self.use_primary = True
+
+    # 쓰기를 한 로그인 유저를 일정 시간 primary 에 고정
+    def pin_user(self):
+        user = _get_authenticated_user(self.request)
+        seconds = get_pin_seconds()
+        if self.wrote and user is not None and seconds > 0:
+            caches[PIN_CACHE_ALIAS].set(_pin_key(user.pk), True, seconds)
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        replicas = get_replicas()
+        state = _request_state.get()
+        if not replicas or state is None or state.should_use_primary():
+            return DEFAULT_DB_ALIAS
+        return state.get_replica(replicas)
+
+    def db_for_write(self, model, **hints):
+        state = _request_state.get()
+        if state is not None:
+            state.record_write()
+        return DEFAULT_DB_ALIAS
+
+    # primary 와 복제본은 같은 데이터이므로 서로 관계 허용
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *get_replicas()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+
+class PrimaryReplicaMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        state = RequestState(request)
+        token = _request_state.set(state)
+        try:
+            response = self.get_response(request)
+            state.pin_user()
+            return response
+        finally:
+            _request_state.reset(token)
+
+    async def __acall__(self, request):
+        state = RequestState(request)
+        token = _request_state.set(state)
+        try:
+            response = await self.get_response(request)
+            state.pin_user()
+            return response
+        finally:
+            _request_state.reset(token)
+
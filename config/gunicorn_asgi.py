@@ -0,0 +1,24 @@
+import multiprocessing
+import os
+
+
+"""
+ASGI 배포 설정 (gunicorn + uvicorn 워커)
+
+- 비동기 뷰(/accounts/async/..., /races/async/..., /crews/async/...)의 섹션 동시 조회는 ASGI 에서 실행해야 효과가 있음
+    - 동기 뷰도 그대로 동작 (요청마다 스레드에서 실행)
+- 사용법: pip install gunicorn uvicorn
+          gunicorn -c config/gunicorn_asgi.py config.asgi:application
+- 환경 변수
+    - GUNICORN_BIND: 바인드 주소 (기본 127.0.0.1:8000, nginx 뒤에서 실행)
+    - WEB_CONCURRENCY: 워커 프로세스 수 (기본 CPU 코어 수 * 2 + 1)
+    - ASYNC_SECTION_THREADS: 워커당 섹션 조회 스레드 수 (config/settings.py)
+"""
+
+bind = os.environ.get("GUNICORN_BIND", "127.0.0.1:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+timeout = 30
+graceful_timeout = 30
+keepalive = 5
+accesslog = "-"
@@ -0,0 +1,363 @@
+import hashlib
+import json
+import logging
+import os
+import struct
+import tempfile
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models.fields.files import FieldFile
+from django.db.models.signals import post_save
+from PIL import Image, ImageOps
+from rest_framework import serializers
+from config.response_cache import invalidate
+
+logger = logging.getLogger(__name__)
+
+
+"""
+업로드 이미지 썸네일 변형(variant) 생성
+
+- 이미지 필드가 저장되면 커밋 후 전용 스레드 풀(IMAGE_VARIANT_THREADS 개)에서 폭별 WebP/JPEG 변형 생성
+    - variants/<원본 경로(확장자 제외)>/<폭>w.<webp|jpeg> 에 저장, 원본보다 크게 늘리지 않음
+        - 폭은 VARIANT_WIDTHS 를 원본 폭으로 자른 값 (원본 300px 이면 200w, 300w)
+    - JPEG 는 draft 로 필요한 크기에 가깝게만 디코딩하고, 큰 폭부터 줄여 가며 생성
+    - 원본에 EXIF/XMP(촬영 위치 등)가 있으면 제거한 사본을 같은 디렉터리에 쓴 뒤 os.replace 로 교체
+        - JPEG 는 다시 인코딩하지 않고 메타데이터 세그먼트만 제거 (방향 태그만 남김, 무손실)
+        - PNG/WebP 는 방향을 반영해 무손실로 다시 저장
+        - 파일 경로가 없는 저장소(원격)는 원본을 그대로 두고 변형만 메타데이터 없이 생성
+    - 해상도가 IMAGE_MAX_PIXELS 를 넘으면 디코딩하지 않고 건너뜀 (압축 폭탄 방지, 업로드 시에도 validate_image_pixels 로 거부)
+    - IMAGE_VARIANT_THREADS=0 이면 커밋 후 요청 스레드에서 바로 생성 (테스트용)
+- 모델별 연결은 각 앱 signals.py 에서 build_variants_on_save(모델, 필드, groups=응답 캐시 그룹)
+    - 생성이 끝나면 응답 캐시 그룹을 무효화해 변형 URL 이 들어간 응답으로 교체
+- 시리얼라이저는 ImageVariantsField 로 {"webp": {"200w": url, ...}, "jpeg": {...}} 반환 (srcset 용)
+    - 키는 변형의 실제 폭, 변형이 아직 없으면 null (원본 필드 사용)
+    - 준비 여부와 폭 목록은 마지막에 쓰는 VARIANT_MANIFEST(폭 목록 JSON)로 확인
+    - 확인 결과는 CACHES[VARIANT_CACHE_ALIAS] 에 캐시 (준비됨은 계속, 없음은 VARIANT_MISSING_SECONDS 초)
+        - 목록 응답마다 행별로 저장소를 조회(stat, 원격이면 HEAD)하지 않음
+- 기존 이미지는 python manage.py build_image_variants 로 생성
+"""
+
+VARIANT_WIDTHS = (200, 480, 1080)
+VARIANT_FORMATS = {
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+VARIANT_DIRECTORY = "variants"
+VARIANT_MANIFEST = "widths.json"
+STRIPPED_FORMATS = {"PNG": {}, "WEBP": {"lossless": True}}  # JPEG 는 세그먼트만 제거
+STRIPPED_JPEG_MARKERS = {0xE1, 0xED}  # APP1 (EXIF, XMP), APP13 (IPTC)
+ORIENTATION = 0x0112
+XMP_KEYS = {"xmp", "XML:com.adobe.xmp"}  # WebP, PNG
+VARIANT_CACHE_ALIAS = "default"
+VARIANT_MISSING_SECONDS = 60
+IMAGE_FIELDS = []  # build_variants_on_save 로 연결된 (모델, 필드 이름, 그룹)
+
+
+class ImageTooLarge(ValueError):
+    pass
+
+
+def get_max_pixels():
+    return getattr(settings, "IMAGE_MAX_PIXELS", 40_000_000)
+
+
+def get_thread_count():
+    return getattr(settings, "IMAGE_VARIANT_THREADS", 2)
+
+
+@lru_cache(maxsize=None)
+def get_executor():
+    return ThreadPoolExecutor(
+        max_workers=get_thread_count(), thread_name_prefix="image-variants"
+    )
+
+
+def variant_name(name, width, extension):
+    base, _ = os.path.splitext(name)
+    return f"{VARIANT_DIRECTORY}/{base}/{width}w.{extension}"
+
+
+# 가장 마지막에 저장하는 변형 폭 목록 (있으면 모든 변형이 준비된 것)
+def manifest_name(name):
+    base, _ = os.path.splitext(name)
+    return f"{VARIANT_DIRECTORY}/{base}/{VARIANT_MANIFEST}"
+
+
+# 원본 폭(방향 반영)에 맞춘 변형 폭, 원본보다 넓은 폭은 원본 폭 하나로 합침
+def fit_widths(image_width):
+    return sorted({min(width, image_width) for width in VARIANT_WIDTHS})
+
+
+def _ready_key(name):
+    return f"images:variants:{hashlib.md5(name.encode()).hexdigest()}"
+
+
+def mark_variants_ready(name, widths):
+    caches[VARIANT_CACHE_ALIAS].set(_ready_key(name), list(widths), None)
+
+
+# 준비된 변형의 폭 목록 (아직 없으면 빈 목록)
+def get_variant_widths(field_file):
+    if not field_file:
+        return []
+    cache = caches[VARIANT_CACHE_ALIAS]
+    key = _ready_key(field_file.name)
+    widths = cache.get(key)
+    if widths is None:
+        widths = _read_manifest(field_file.storage, field_file.name)
+        cache.set(key, widths, None if widths else VARIANT_MISSING_SECONDS)
+    return widths
+
+
+def has_variants(field_file):
+    return bool(get_variant_widths(field_file))
+
+
+def _read_manifest(storage, name):
+    manifest = manifest_name(name)
+    if not storage.exists(manifest):
+        return []
+    with storage.open(manifest, "rb") as file:
+        return json.load(file)
+
+
+# 헤더만 읽어 해상도 확인 (픽셀 디코딩 전)
+def open_image(file):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", Image.DecompressionBombWarning)
+        try:
+            image = Image.open(file)
+        except (Image.DecompressionBombWarning, Image.DecompressionBombError) as error:
+            raise ImageTooLarge(str(error))
+    if image.width * image.height > get_max_pixels():
+        raise ImageTooLarge(f"{image.width}x{image.height}")
+    return image
+
+
+# 업로드 검증 (이미 저장된 파일은 건너뜀)
+def validate_image_pixels(file):
+    if not file or (isinstance(file, FieldFile) and file._committed):
+        return
+    position = file.tell()
+    try:
+        open_image(file)
+    except ImageTooLarge:
+        raise ValidationError("이미지 해상도가 너무 큽니다.")
+    except OSError:
+        return  # 이미지 형식 검사는 ImageField 가 처리
+    finally:
+        file.seek(position)
+
+
+def _encode(image, image_format, options):
+    buffer = BytesIO()
+    image.save(buffer, image_format, **options)
+    return buffer.getvalue()
+
+
+def _replace(storage, name, data):
+    if storage.exists(name):
+        storage.delete(name)
+    saved_name = storage.save(name, ContentFile(data))
+    if saved_name != name:
+        logger.warning("이미지가 다른 이름으로 저장되었습니다: %s -> %s", name, saved_name)
+
+
+# JPEG 에서 메타데이터 세그먼트만 제거 (압축된 이미지 데이터는 그대로, 방향 태그는 다시 넣음)
+def _strip_jpeg(data, orientation):
+    if data[:2] != b"\xff\xd8":
+        raise ValueError("JPEG 형식이 아닙니다.")
+    orientation_segment = b""
+    if orientation not in (None, 1):
+        exif = Image.Exif()
+        exif[ORIENTATION] = orientation
+        payload = exif.tobytes()
+        size = struct.pack(">H", len(payload) + 2)
+        orientation_segment = b"\xff\xe1" + size + payload
+
+    parts, position = [data[:2]], 2
+    while position < len(data) - 1:
+        if data[position] != 0xFF:
+            raise ValueError("JPEG 세그먼트가 올바르지 않습니다.")
+        marker = data[position + 1]
+        if marker == 0xFF:  # 채움 바이트
+            position += 1
+            continue
+        # 방향 태그는 JFIF(APP0) 다음, 나머지 세그먼트 앞에
+        if marker != 0xE0 and orientation_segment:
+            parts.append(orientation_segment)
+            orientation_segment = b""
+        if marker == 0xDA:  # 스캔 시작부터는 압축된 이미지 데이터
+            parts.append(data[position:])
+            break
+        (length,) = struct.unpack(">H", data[position + 2 : position + 4])
+        end = position + 2 + length
+        if marker not in STRIPPED_JPEG_MARKERS:
+            parts.append(data[position:end])
+        position = end
+    return b"".join(parts)
+
+
+# 같은 디렉터리에 임시 파일로 쓴 뒤 교체 (교체 중에도 원본 URL 은 항상 완전한 파일)
+def _write_atomic(path, data, permissions):
+    descriptor, temporary = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix=".strip-"
+    )
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(data)
+        os.chmod(temporary, permissions)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+# 원본의 EXIF/XMP 제거, 바꾼 경우 True
+def strip_metadata(storage, name):
+    try:
+        path = storage.path(name)
+    except NotImplementedError:
+        return False
+    with storage.open(name, "rb") as file:
+        data = file.read()
+    image = open_image(BytesIO(data))
+    image_format = image.format
+    exif = image.getexif()
+    if image_format == "JPEG":
+        stripped = _strip_jpeg(data, exif.get(ORIENTATION))
+    elif image_format in STRIPPED_FORMATS and (exif or XMP_KEYS & set(image.info)):
+        # Pillow 는 save 시 exif/xmp 인자를 주지 않으면 쓰지 않음
+        buffer = BytesIO()
+        ImageOps.exif_transpose(image).save(
+            buffer, image_format, **STRIPPED_FORMATS[image_format]
+        )
+        stripped = buffer.getvalue()
+    else:
+        return False
+    if stripped == data:
+        return False
+    permissions = getattr(storage, "file_permissions_mode", None) or 0o644
+    _write_atomic(path, stripped, permissions)
+    return True
+
+
+def _flatten(image):
+    if image.mode in ("RGBA", "LA", "P"):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, "white")
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+def build_variants(storage, name):
+    strip_metadata(storage, name)
+    largest = max(VARIANT_WIDTHS)
+    with storage.open(name, "rb") as file:
+        image = open_image(file)
+        image.draft("RGB", (largest, largest))
+        image = _flatten(ImageOps.exif_transpose(image))
+
+    # 큰 폭부터 줄여 가며 생성, 폭 목록은 모든 변형을 저장한 뒤 마지막에 저장
+    widths = fit_widths(image.width)
+    for width in reversed(widths):
+        if image.width > width:
+            height = max(round(image.height * width / image.width), 1)
+            image = image.resize((width, height), Image.LANCZOS)
+        for extension, (image_format, options) in VARIANT_FORMATS.items():
+            _replace(
+                storage,
+                variant_name(name, width, extension),
+                _encode(image, image_format, options),
+            )
+    _replace(storage, manifest_name(name), json.dumps(widths).encode())
+    mark_variants_ready(name, widths)
+
+
+def _build_and_invalidate(storage, name, groups):
+    try:
+        build_variants(storage, name)
+    except ImageTooLarge:
+        logger.warning("해상도가 너무 커서 변형을 만들지 않았습니다: %s", name)
+        return
+    except Exception:
+        logger.exception("이미지 변형 생성에 실패했습니다: %s", name)
+        return
+    if groups:
+        invalidate(*groups)
+
+
+def schedule_variants(storage, name, groups=()):
+    def submit():
+        if get_thread_count() == 0:
+            _build_and_invalidate(storage, name, groups)
+        else:
+            get_executor().submit(_build_and_invalidate, storage, name, groups)
+
+    transaction.on_commit(submit)
+
+
+# 모델 저장 시 변형이 없는 이미지 필드의 변형 생성 예약 (각 앱 signals.py 에서 호출)
+def build_variants_on_save(model, *field_names, groups=()):
+    def receiver(sender, instance, raw=False, update_fields=None, **kwargs):
+        if raw:
+            return
+        deferred = instance.get_deferred_fields()
+        for field_name in field_names:
+            if field_name in deferred or (
+                update_fields is not None and field_name not in update_fields
+            ):
+                continue
+            field_file = getattr(instance, field_name)
+            if field_file and not has_variants(field_file):
+                schedule_variants(field_file.storage, field_file.name, groups)
+
+    for field_name in field_names:
+        IMAGE_FIELDS.append((model, field_name, groups))
+    post_save.connect(
+        receiver,
+        sender=model,
+        weak=False,
+        dispatch_uid=f"images:{model._meta.label}",
+    )
+
+
+def absolute_url(request, url):
+    if request is None:
+        return url
+    return request.build_absolute_uri(url)
+
+
+# 이미지 필드의 URL (파일이 없으면 None)
+def build_image_url(request, field_file):
+    if not field_file:
+        return None
+    return absolute_url(request, field_file.url)
+
+
+# 변형 URL 맵 (source 에 이미지 필드 지정)
+class ImageVariantsField(serializers.ReadOnlyField):
+    def to_representation(self, value):
+        widths = get_variant_widths(value)
+        if not widths:
+            return None
+        request = self.context.get("request")
+        return {
+            extension: {
+                f"{width}w": absolute_url(
+                    request, value.storage.url(variant_name(value.name, width, extension))
+                )
+                for width in widths
+            }
+            for extension in VARIANT_FORMATS
+        }
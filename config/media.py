@@ -0,0 +1,219 @@
+import hashlib
+import mimetypes
+import os
+import posixpath
+import re
+from urllib.parse import quote
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpResponse,
+    HttpResponseNotAllowed,
+    HttpResponseNotModified,
+)
+from django.urls import re_path
+from django.utils._os import safe_join
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from django.views.static import was_modified_since
+
+
+"""
+업로드 파일(MEDIA_ROOT) 서빙 뷰
+
+- ETag 는 파일 내용의 md5 (strong), CACHES["default"] 에 (경로, 수정 시각, 크기) 키로 저장해 파일당 한 번만 계산
+    - If-None-Match / If-Modified-Since 가 맞으면 본문 없이 304
+    - Cache-Control: public, max-age=MEDIA_CACHE_SECONDS (이후에는 ETag 로 재검증)
+- Range: bytes=a-b, a-, -n 한 구간만 지원 (여러 구간은 전체 응답), If-Range 가 다르면 전체 응답
+    - 범위를 벗어나면 416 + Content-Range: bytes */크기
+- 본문은 FileResponse 로 전달해 gunicorn 등 WSGI 서버가 sendfile 로 보냄 (부분 응답도 시작 위치/길이만 지정)
+- MEDIA_ACCEL 을 지정하면 파일은 앞단 프록시가 보내고 여기서는 헤더만 응답
+    - "x-accel-redirect": nginx internal location (MEDIA_ACCEL_PREFIX + 경로)
+    - "x-sendfile": Apache mod_xsendfile / lighttpd (파일의 절대 경로)
+    - 조건부 요청(304)은 여기서 처리, Range 는 프록시가 처리
+- config/urls.py 에서 media_urlpatterns() 로 MEDIA_URL 아래에 연결
+"""
+
+ETAG_CACHE_ALIAS = "default"
+HASH_CHUNK_SIZE = 1024 * 1024
+STREAM_BLOCK_SIZE = 64 * 1024
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+ACCEL_HEADERS = {"x-accel-redirect": "X-Accel-Redirect", "x-sendfile": "X-Sendfile"}
+
+
+class RangeNotSatisfiable(ValueError):
+    pass
+
+
+def get_cache_seconds():
+    return getattr(settings, "MEDIA_CACHE_SECONDS", 60 * 60 * 24)
+
+
+def get_accel():
+    return getattr(settings, "MEDIA_ACCEL", "")
+
+
+def get_accel_prefix():
+    return getattr(settings, "MEDIA_ACCEL_PREFIX", "/protected-media/")
+
+
+# URL 경로를 MEDIA_ROOT 안의 파일 경로로 변환 (없거나 밖이면 404)
+def resolve_media_path(path):
+    path = posixpath.normpath(path).lstrip("/")
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404("파일이 없습니다.")
+    if not os.path.isfile(full_path):
+        raise Http404("파일이 없습니다.")
+    return path, full_path
+
+
+def get_etag(full_path, stat):
+    source = f"{full_path}:{stat.st_mtime_ns}:{stat.st_size}"
+    key = f"media:etag:{hashlib.md5(source.encode()).hexdigest()}"
+    cache = caches[ETAG_CACHE_ALIAS]
+    etag = cache.get(key)
+    if etag is None:
+        digest = hashlib.md5()
+        with open(full_path, "rb") as file:
+            for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        etag = f'"{digest.hexdigest()}"'
+        cache.set(key, etag, None)
+    return etag
+
+
+def _strip_weak(etag):
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+# If-None-Match (약한 비교) 우선, 없으면 If-Modified-Since
+def is_not_modified(request, etag, stat):
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if if_none_match:
+        etags = parse_etags(if_none_match)
+        return "*" in etags or etag in [_strip_weak(value) for value in etags]
+    if_modified_since = request.META.get("HTTP_IF_MODIFIED_SINCE")
+    if if_modified_since:
+        return not was_modified_since(if_modified_since, stat.st_mtime)
+    return False
+
+
+# If-Range 가 없거나 현재 파일과 같을 때만 Range 적용 (ETag 는 강한 비교)
+def if_range_matches(request, etag, stat):
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if not if_range:
+        return True
+    if if_range.startswith('"'):
+        return if_range == etag
+    return parse_http_date_safe(if_range) == int(stat.st_mtime)
+
+
+# (시작, 끝) 바이트 위치, 처리할 수 없는 형식이면 None
+def parse_range(header, size):
+    match = RANGE_RE.match(header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first:
+        if not last:
+            return None
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable
+        return max(size - length, 0), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable
+    end = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+
+# 파일의 일부만 읽는 파일 객체 (fileno 가 있어 WSGI 서버가 sendfile 사용 가능)
+class FileRange:
+    def __init__(self, file, start, length):
+        self.file = file
+        self.remaining = length
+        file.seek(start)
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+def _set_headers(response, etag, stat):
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(stat.st_mtime)
+    response["Cache-Control"] = f"public, max-age={get_cache_seconds()}"
+    response["Accept-Ranges"] = "bytes"
+    return response
+
+
+def serve_media(request, path):
+    if request.method not in ("GET", "HEAD"):
+        return HttpResponseNotAllowed(["GET", "HEAD"])
+    path, full_path = resolve_media_path(path)
+    stat = os.stat(full_path)
+    etag = get_etag(full_path, stat)
+    if is_not_modified(request, etag, stat):
+        return _set_headers(HttpResponseNotModified(), etag, stat)
+
+    content_type, encoding = mimetypes.guess_type(full_path)
+    if encoding or content_type is None:
+        content_type = "application/octet-stream"
+
+    accel = get_accel()
+    if accel:
+        response = HttpResponse(content_type=content_type)
+        if accel == "x-sendfile":
+            response[ACCEL_HEADERS[accel]] = full_path
+        else:
+            response[ACCEL_HEADERS[accel]] = quote(get_accel_prefix() + path)
+        return _set_headers(response, etag, stat)
+
+    size = stat.st_size
+    start, end, status = 0, size - 1, 200
+    range_header = request.META.get("HTTP_RANGE")
+    if range_header and if_range_matches(request, etag, stat):
+        try:
+            byte_range = parse_range(range_header, size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return _set_headers(response, etag, stat)
+        if byte_range is not None:
+            (start, end), status = byte_range, 206
+
+    length = max(end - start + 1, 0)
+    if request.method == "HEAD":
+        response = HttpResponse(status=status, content_type=content_type)
+    else:
+        body = FileRange(open(full_path, "rb"), start, length)
+        response = FileResponse(body, status=status, content_type=content_type)
+        response.block_size = STREAM_BLOCK_SIZE
+    response["Content-Length"] = length
+    if status == 206:
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return _set_headers(response, etag, stat)
+
+
+# MEDIA_URL 이 외부 주소(CDN, 오브젝트 스토리지)면 연결하지 않음
+def media_urlpatterns():
+    if not settings.MEDIA_URL.startswith("/"):
+        return []
+    prefix = re.escape(settings.MEDIA_URL.lstrip("/"))
+    return [re_path(rf"^{prefix}(?P<path>.*)$", serve_media, name="media")]
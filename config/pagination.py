@@ -0,0 +1,97 @@
+import json
+import operator
+from functools import reduce
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, _reverse_ordering
+
+
+"""
+키셋(keyset) 커서 페이지네이션
+
+- DRF CursorPagination 은 ordering 의 첫 필드 값만 커서에 담고, 같은 값이 이어지면 OFFSET 으로 건너뜀
+    - 값이 많이 겹치는 정렬(접수 상태, 날짜)은 페이지마다 OFFSET 이 커지고 offset_cutoff(1000)를 넘으면 깨짐
+- 여기서는 마지막 행의 ordering 전체 값을 커서에 담고 (a, b, id) > (x, y, z) 조건으로 다음 페이지 조회
+    - ordering 은 마지막에 id 같은 유일한 필드를 포함해야 함, OFFSET 은 항상 0
+    - 첫 필드에 a >= x 조건을 함께 걸어 (a, ...) 인덱스 범위 검색이 되도록 함
+- 응답 형식과 이전/다음 링크는 CursorPagination 과 같음
+"""
+
+
+class KeysetCursorPagination(CursorPagination):
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            reverse, current_position = False, None
+        else:
+            _, reverse, current_position = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by(*_reverse_ordering(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        if current_position is not None:
+            queryset = queryset.filter(self.after(current_position, reverse))
+
+        results = list(queryset[: self.page_size + 1])
+        self.page = results[: self.page_size]
+        following_position = None
+        if len(results) > len(self.page):
+            following_position = self._get_position_from_instance(
+                results[-1], self.ordering
+            )
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = current_position is not None
+            self.has_previous = following_position is not None
+            self.next_position = current_position
+            self.previous_position = following_position
+        else:
+            self.has_next = following_position is not None
+            self.has_previous = current_position is not None
+            self.next_position = following_position
+            self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    # 커서 위치 다음(reverse 면 이전) 행 조건
+    def after(self, position, reverse=False):
+        try:
+            values = json.loads(position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        conditions, equal = [], {}
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") != reverse else "gt"
+            conditions.append(Q(**equal, **{f"{name}__{lookup}": value}))
+            equal[name] = value
+        first = self.ordering[0]
+        lookup = "lte" if first.startswith("-") != reverse else "gte"
+        return Q(**{f"{first.lstrip('-')}__{lookup}": values[0]}) & reduce(
+            operator.or_, conditions
+        )
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = []
+        for field in ordering:
+            name = field.lstrip("-")
+            if isinstance(instance, dict):
+                values.append(instance[name])
+            else:
+                values.append(getattr(instance, name))
+        return json.dumps(values, cls=DjangoJSONEncoder, separators=(",", ":"))
+
@@ -0,0 +1,97 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+from config.response_cache import get_cache
+
+
+"""
+API 별 SQL 쿼리 예산
+
+- @query_budget(n) 으로 뷰 함수/뷰셋 액션의 최대 쿼리 수를 선언 (결과 개수와 무관해야 함)
+    - 함수형 뷰는 @api_view 아래, 뷰셋은 액션 메서드 위에 사용
+        @api_view(["GET"])
+        @query_budget(3)
+        def race_list(request): ...
+- 선언된 예산은 QUERY_BUDGETS 에 "모듈.이름" 키로 등록되고, 함수에도 query_budget 속성으로 남음
+- 테스트에서는 QueryBudgetTestMixin.assertQueryBudget 으로 데이터 양을 바꿔 가며 확인
+- 전체 라우트의 현재 쿼리 수는 python manage.py query_report 로 확인 (ops/management/commands)
+"""
+
+QUERY_BUDGETS = {}
+
+
+def get_view_name(view_func):
+    return f"{view_func.__module__}.{view_func.__qualname__}"
+
+
+def query_budget(max_queries):
+    def decorator(view_func):
+        view_func.query_budget = max_queries
+        QUERY_BUDGETS[get_view_name(view_func)] = max_queries
+        return view_func
+
+    return decorator
+
+
+# URL 에 연결된 뷰 함수와 HTTP 메서드로 처리할 뷰 이름 찾기 (처리하지 않는 메서드면 None)
+# - @api_view 는 함수 이름/모듈을 그대로 가진 WrappedAPIView 를 만들므로 클래스 이름 사용
+# - 뷰셋은 actions 로 연결된 메서드, 그 외 APIView 는 HTTP 메서드 이름의 메서드
+def get_handler_name(view_func, method="get"):
+    view_class = getattr(view_func, "cls", None)
+    if view_class is None:
+        return get_view_name(view_func)
+    if view_class.__qualname__ == "WrappedAPIView":
+        if not hasattr(view_class, method):
+            return None
+        return f"{view_class.__module__}.{view_class.__name__}"
+    actions = getattr(view_func, "actions", None) or {}
+    handler = getattr(view_class, actions.get(method, method), None)
+    return get_view_name(handler) if handler else None
+
+
+def resolve_view_name(path, method="get"):
+    return get_handler_name(resolve(path.split("?")[0]).func, method)
+
+
+def get_budget(path, method="get"):
+    return QUERY_BUDGETS.get(resolve_view_name(path, method))
+
+
+"""
+데이터 양에 따라 쿼리 수가 늘지 않는지 확인하는 테스트 헬퍼
+
+- seed(n): 엔드포인트가 반환할 데이터를 n개 더 만드는 함수
+- query_budget_sizes 의 각 크기만큼 데이터를 늘린 뒤 요청해 쿼리 수를 비교
+- 쿼리 수가 늘거나, 뷰에 선언된 예산을 넘으면 실패
+"""
+
+
+class QueryBudgetTestMixin:
+    query_budget_sizes = (1, 10)
+
+    def count_queries(self, path, method="get", data=None):
+        # 응답 캐시(config/response_cache.py)에 걸리면 쿼리가 0 이므로 비우고 측정
+        get_cache().clear()
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method)(path, data)
+        self.assertLess(response.status_code, 400, f"{method.upper()} {path}")
+        return len(context.captured_queries)
+
+    def assertQueryBudget(self, path, seed, method="get", data=None):
+        counts = []
+        for size in self.query_budget_sizes:
+            seed(size)
+            counts.append(self.count_queries(path, method, data))
+        self.assertEqual(
+            min(counts),
+            max(counts),
+            f"{method.upper()} {path}: 데이터가 늘자 쿼리 수가 변함 {counts}",
+        )
+        budget = get_budget(path, method)
+        self.assertIsNotNone(budget, f"{method.upper()} {path}: 쿼리 예산 미선언")
+        self.assertLessEqual(
+            counts[-1],
+            budget,
+            f"{method.upper()} {path}: 쿼리 {counts[-1]}개, 예산 {budget}개",
+        )
+        return counts[-1]
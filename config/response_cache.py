@@ -0,0 +1,176 @@
+import functools
+import hashlib
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.http import urlencode
+from rest_framework.request import Request
+
+
+"""
+비회원 공개 조회 API 응답 캐시
+
+- 비회원 GET 요청의 JSON 응답을 (호스트 + 경로 + 정렬된 쿼리 + 오늘 날짜) 키로 CACHES["response"] 에 저장
+    - D-day/접수 상태처럼 날짜에 따라 바뀌는 값이 있으므로 Asia/Seoul 기준 날짜를 키에 포함
+- 무효화는 그룹 버전으로 처리
+    - 각 엔드포인트는 의존하는 그룹(races, crews, promotions ...)을 선언
+    - 그룹에 속한 모델이 post_save/post_delete 되면 그룹 버전을 올려 이전 키를 더 이상 사용하지 않음
+    - 커밋 전 다른 요청이 이전 데이터를 새 버전으로 캐싱하지 않도록 커밋 후 한 번 더 올림
+- 히트/미스 수는 캐시에 누적 (get_stats() 로 확인), 응답 헤더 X-Cache 로도 표시
+"""
+
+CACHE_ALIAS = "response"
+KEY_PREFIX = "response_cache"
+STATS_KEYS = ("hit", "miss")
+
+
+def get_cache():
+    return caches[CACHE_ALIAS]
+
+
+def get_timeout():
+    return getattr(settings, "RESPONSE_CACHE_TIMEOUT", 300)
+
+
+def _version_key(group):
+    return f"{KEY_PREFIX}:version:{group}"
+
+
+def _stats_key(name):
+    return f"{KEY_PREFIX}:stats:{name}"
+
+
+def _incr(key):
+    cache = get_cache()
+    if cache.add(key, 1, timeout=None):
+        return
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, timeout=None)
+
+
+def _bump_versions(groups):
+    for group in groups:
+        _incr(_version_key(group))
+
+
+# 그룹 캐시 무효화 (지금 한 번, 커밋 후 한 번)
+def invalidate(*groups):
+    _bump_versions(groups)
+    transaction.on_commit(functools.partial(_bump_versions, groups))
+
+
+def get_stats():
+    cache = get_cache()
+    return {name: cache.get(_stats_key(name), 0) for name in STATS_KEYS}
+
+
+def reset_stats():
+    get_cache().delete_many([_stats_key(name) for name in STATS_KEYS])
+
+
+def record_stat(name):
+    _incr(_stats_key(name))
+
+
+# 그룹 버전 문자열 (예: "races3.crews7"), 그룹이 무효화되면 바뀜
+def get_version(groups):
+    versions = get_cache().get_many([_version_key(group) for group in groups])
+    return ".".join(
+        f"{group}{versions.get(_version_key(group), 0)}" for group in groups
+    )
+
+
+def build_cache_key(request, groups):
+    version = get_version(groups)
+    query = urlencode(sorted(request.GET.lists()), doseq=True)
+    source = ":".join(
+        [
+            request.get_host(),
+            request.path,
+            query,
+            request.accepted_media_type,
+            timezone.localdate().isoformat(),
+        ]
+    )
+    return f"{KEY_PREFIX}:{version}:{hashlib.md5(source.encode()).hexdigest()}"
+
+
+def _is_cacheable_request(request):
+    return (
+        request.method == "GET"
+        and not request.user.is_authenticated
+        and getattr(request.accepted_renderer, "format", None) == "json"
+    )
+
+
+"""
+응답 캐시 데코레이터
+
+- 함수형 뷰는 @api_view 아래, 뷰셋은 액션 메서드 위에 사용
+    @api_view(["GET"])
+    @cache_anonymous_response("races")
+    def race_list(request): ...
+- 캐시 히트 시 DB 조회/직렬화/렌더링 없이 저장된 JSON 을 그대로 반환
+"""
+
+
+def cache_anonymous_response(*groups):
+    def decorator(view_func):
+        @functools.wraps(view_func)
+        def wrapper(*args, **kwargs):
+            # 함수형 뷰는 (request, ...), 뷰셋 액션은 (self, request, ...)
+            request = args[0] if isinstance(args[0], Request) else args[1]
+            if not _is_cacheable_request(request):
+                return view_func(*args, **kwargs)
+
+            cache = get_cache()
+            key = build_cache_key(request, groups)
+            cached = cache.get(key)
+            if cached is not None:
+                record_stat("hit")
+                content, content_type = cached
+                response = HttpResponse(content, content_type=content_type)
+                response["X-Cache"] = "HIT"
+                return response
+
+            record_stat("miss")
+            response = view_func(*args, **kwargs)
+            if response.status_code != 200 or not hasattr(response, "data"):
+                return response
+            # 여기서 한 번 렌더링해 저장 (이미 렌더링된 응답은 DRF 가 다시 렌더링하지 않음)
+            response.accepted_renderer = request.accepted_renderer
+            response.accepted_media_type = request.accepted_media_type
+            response.renderer_context = {"request": request, "response": response}
+            response.render()
+            cache.set(key, (response.content, response["Content-Type"]), get_timeout())
+            response["X-Cache"] = "MISS"
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+# 모델 저장/삭제 시 그룹 캐시 무효화 연결 (각 앱 signals.py 에서 호출)
+def invalidate_on_change(group, *models):
+    def receiver(sender, **kwargs):
+        invalidate(group)
+
+    for model in models:
+        post_save.connect(
+            receiver,
+            sender=model,
+            weak=False,
+            dispatch_uid=f"response_cache:{group}:{model._meta.label}",
+        )
+        post_delete.connect(
+            receiver,
+            sender=model,
+            weak=False,
+            dispatch_uid=f"response_cache:{group}:{model._meta.label}",
+        )
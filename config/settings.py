@@ -37,6 +37,9 @@ INSTALLED_APPS = [
     "crews",
     "promotions",
     "races",
+    "search",
+    "home",
+    "ops",  # 관리 커맨드 (데이터 생성, 벤치마크, 쿼리 리포트, 이미지 변형)
     # install app
     "rest_framework",
     "rest_framework.authtoken",  # 토큰 인증
@@ -58,6 +61,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "config.db_router.PrimaryReplicaMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -96,6 +100,90 @@ DATABASES = {
     }
 }
 
+# Read replica (config/db_router.py)
+# - DATABASE_REPLICAS=경로1,경로2 이면 replica1, replica2 ... 별칭으로 추가하고 GET 요청의 읽기를 분산
+# - 테스트에서는 default 테스트 DB 를 그대로 사용 (MIRROR)
+# - READ_YOUR_WRITES_SECONDS: 쓰기 후 같은 유저의 읽기를 primary 로 보내는 시간(초)
+DATABASE_REPLICAS = []
+for number, replica_path in enumerate(
+    filter(None, os.environ.get("DATABASE_REPLICAS", "").split(",")), start=1
+):
+    DATABASES[f"replica{number}"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": replica_path,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica{number}")
+DATABASE_ROUTERS = ["config.db_router.PrimaryReplicaRouter"]
+READ_YOUR_WRITES_SECONDS = int(os.environ.get("READ_YOUR_WRITES_SECONDS", 5))
+
+
+# Cache
+# - default: 로컬 메모리 캐시
+# - response: 비회원 공개 조회 API 응답 캐시 (config/response_cache.py)
+#   RESPONSE_CACHE_BACKEND=file 이면 RESPONSE_CACHE_LOCATION 디렉터리에 파일로 저장 (프로세스 간 공유)
+# - shared: 워커 프로세스끼리 공유해야 하는 짧은 상태 (게시글 조회 중복 확인 등)
+#   SHARED_CACHE_BACKEND 기본값은 locmem (프로세스 안에서만 공유)
+#   워커가 여러 개면 SHARED_CACHE_BACKEND=redis(또는 memcached) 와 SHARED_CACHE_LOCATION 지정
+#   file 은 쓸 때마다 디렉터리 전체를 훑어 항목 수를 세므로(_cull) shared 에는 쓰지 않음
+# - MAX_ENTRIES 는 locmem/file 에만 넘김 (redis/memcached 클라이언트는 모르는 옵션이라 오류)
+CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+    "memcached": "django.core.cache.backends.memcached.PyMemcacheCache",
+}
+LOCAL_CACHE_BACKENDS = ("locmem", "file")
+RESPONSE_CACHE_BACKEND = os.environ.get("RESPONSE_CACHE_BACKEND", "locmem")
+SHARED_CACHE_BACKEND = os.environ.get("SHARED_CACHE_BACKEND", "locmem")
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "response": {
+        "BACKEND": CACHE_BACKENDS[RESPONSE_CACHE_BACKEND],
+        "LOCATION": os.environ.get(
+            "RESPONSE_CACHE_LOCATION",
+            (
+                os.path.join(BASE_DIR, ".cache", "responses")
+                if RESPONSE_CACHE_BACKEND == "file"
+                else "response"
+            ),
+        ),
+        "OPTIONS": (
+            {"MAX_ENTRIES": 5000}
+            if RESPONSE_CACHE_BACKEND in LOCAL_CACHE_BACKENDS
+            else {}
+        ),
+    },
+    "shared": {
+        "BACKEND": CACHE_BACKENDS[SHARED_CACHE_BACKEND],
+        "LOCATION": os.environ.get("SHARED_CACHE_LOCATION", "shared"),
+        "OPTIONS": (
+            {"MAX_ENTRIES": 100000}
+            if SHARED_CACHE_BACKEND in LOCAL_CACHE_BACKENDS
+            else {}
+        ),
+    },
+}
+RESPONSE_CACHE_TIMEOUT = int(os.environ.get("RESPONSE_CACHE_TIMEOUT", 300))
+
+
+# 게시글 조회수 (boards/view_counter.py)
+# - VIEW_COUNT_FLUSH_INTERVAL: 쌓인 조회수를 백그라운드 스레드에서 DB 에 반영하는 주기(초)
+#   0 이면 백그라운드 반영 없이 flush() 를 직접 호출할 때만 반영 (테스트용)
+# - TRUSTED_PROXIES: X-Forwarded-For 를 믿을 앞단 프록시 IP (쉼표 구분), 비어 있으면 REMOTE_ADDR 만 사용
+VIEW_COUNT_FLUSH_INTERVAL = int(os.environ.get("VIEW_COUNT_FLUSH_INTERVAL", 10))
+TRUSTED_PROXIES = list(filter(None, os.environ.get("TRUSTED_PROXIES", "").split(",")))
+
+
+# 비동기 뷰 섹션 동시 조회 (config/async_sections.py)
+# - ASYNC_CONCURRENT_SECTIONS=false 이면 요청 스레드에서 순서대로 조회
+# - ASYNC_SECTION_THREADS: 섹션 조회 스레드 수 (프로세스당 섹션용 DB 연결 수 상한)
+ASYNC_CONCURRENT_SECTIONS = os.environ.get("ASYNC_CONCURRENT_SECTIONS", "true") == "true"
+ASYNC_SECTION_THREADS = int(os.environ.get("ASYNC_SECTION_THREADS", 8))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
@@ -137,6 +225,31 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# 업로드 파일 서빙 (config/media.py)
+# - MEDIA_CACHE_SECONDS: 브라우저/CDN 캐시 시간, 이후에는 ETag 로 재검증
+# - MEDIA_ACCEL: x-accel-redirect(nginx) 또는 x-sendfile 이면 파일 전송을 앞단 프록시에 맡김
+# - MEDIA_ACCEL_PREFIX: nginx internal location 경로 (x-accel-redirect)
+MEDIA_CACHE_SECONDS = int(os.environ.get("MEDIA_CACHE_SECONDS", 60 * 60 * 24))
+MEDIA_ACCEL = os.environ.get("MEDIA_ACCEL", "")
+MEDIA_ACCEL_PREFIX = os.environ.get("MEDIA_ACCEL_PREFIX", "/protected-media/")
+
+# 업로드 이미지 변형 생성 (config/images.py)
+# - IMAGE_VARIANT_THREADS: 변형 생성 스레드 수 (0 이면 커밋 후 요청 스레드에서 생성)
+# - IMAGE_MAX_PIXELS: 허용하는 최대 해상도 (가로 x 세로, 압축 폭탄 방지)
+IMAGE_VARIANT_THREADS = int(os.environ.get("IMAGE_VARIANT_THREADS", 2))
+IMAGE_MAX_PIXELS = int(os.environ.get("IMAGE_MAX_PIXELS", 40_000_000))
+
+# GPS 트랙 업로드 (config/tracks.py)
+# - TRACK_MAX_POINTS: 파일 하나에서 읽는 최대 포인트 수
+# - TRACK_MAX_FILE_SIZE: 파일(zip 이면 압축을 푼 파일 하나) 최대 크기 (바이트)
+TRACK_MAX_POINTS = int(os.environ.get("TRACK_MAX_POINTS", 1_000_000))
+TRACK_MAX_FILE_SIZE = int(os.environ.get("TRACK_MAX_FILE_SIZE", 100 * 1024 * 1024))
+
+# 기록 트랙 분석 결과 캐시 시간 (accounts/analysis.py, 트랙 해시가 키라 길게 둬도 됨)
+TRACK_ANALYSIS_CACHE_SECONDS = int(
+    os.environ.get("TRACK_ANALYSIS_CACHE_SECONDS", 60 * 60 * 24 * 7)
+)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.0/ref/settings/#default-auto-field
 
@@ -147,7 +260,7 @@ AUTH_USER_MODEL = "accounts.CustomUser"
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.ClaimsJWTAuthentication",
     ],
 }
 
@@ -157,7 +270,11 @@ JWT_AUTH_COOKIE = "my-app-auth"  # 호출할 Cookie Key 값
 JWT_AUTH_REFRESH_COOKIE = "my-refresh-token"  # Refresh Token Cookie Key 값
 REST_AUTH_SERIALIZERS = {
     "USER_DETAILS_SERIALIZER": "accounts.serializers.CustomUserSerializer",
+    "JWT_TOKEN_CLAIMS_SERIALIZER": "accounts.authentication.ClaimsTokenObtainPairSerializer",
 }
+TOKEN_VERSION_CACHE_SECONDS = int(
+    os.environ.get("TOKEN_VERSION_CACHE_SECONDS", 60)
+)  # JWT 폐기 확인용 token_version 캐시 시간 (accounts/authentication.py)
 
 # django-allauth
 SITE_ID = 1  # 해당 도메인 id
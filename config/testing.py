@@ -0,0 +1,60 @@
+import os
+import shutil
+import tempfile
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import override_settings
+from config.db_router import PIN_CACHE_ALIAS
+
+
+"""
+테스트 전용 도우미 (운영 코드에서 import 하지 않음)
+
+- LOCMEM_SHARED_CACHES: shared 캐시를 실행 환경 설정과 무관하게 테스트용 locmem 으로 바꾼 CACHES
+    - @override_settings(CACHES=LOCMEM_SHARED_CACHES)
+- SQLiteReplicaTestMixin: 복제본 라우터(config/db_router.py) 테스트용 SQLite 복제본
+    - 테스트마다 임시 SQLite 파일을 "replica" 별칭으로 추가하고 DATABASE_REPLICAS 로 지정
+    - sync_replica() 를 호출할 때만 default 의 내용을 복제본 파일로 복사 (sqlite3 backup)
+        - 호출 전까지는 복제가 지연된 상태를 재현
+    - 복사하려면 default 에 열린 쓰기 트랜잭션이 없어야 하므로 TransactionTestCase 와 함께 사용
+"""
+
+LOCMEM_SHARED_CACHES = {
+    **settings.CACHES,
+    "shared": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "test-shared",
+    },
+}
+
+
+class SQLiteReplicaTestMixin:
+    replica_alias = "replica"
+
+    def setUp(self):
+        super().setUp()
+        self.replica_directory = tempfile.mkdtemp()
+        replica_settings = dict(connections.settings[DEFAULT_DB_ALIAS])
+        replica_settings["NAME"] = os.path.join(self.replica_directory, "replica.sqlite3")
+        connections.settings[self.replica_alias] = replica_settings
+        self.addCleanup(self.remove_replica)
+
+        override = override_settings(DATABASE_REPLICAS=[self.replica_alias])
+        override.enable()
+        self.addCleanup(override.disable)
+        caches[PIN_CACHE_ALIAS].clear()
+        self.sync_replica()
+
+    def sync_replica(self):
+        source = connections[DEFAULT_DB_ALIAS]
+        target = connections[self.replica_alias]
+        source.ensure_connection()
+        target.ensure_connection()
+        source.connection.backup(target.connection)
+
+    def remove_replica(self):
+        connections[self.replica_alias].close()
+        del connections[self.replica_alias]
+        del connections.settings[self.replica_alias]
+        shutil.rmtree(self.replica_directory, ignore_errors=True)
@@ -0,0 +1,398 @@
+import hashlib
+import os
+import struct
+import uuid
+import zipfile
+import zlib
+from array import array
+from datetime import datetime, timezone
+from functools import lru_cache
+from xml.etree.ElementTree import ParseError
+import numpy as np
+from defusedxml import DefusedXmlException
+from defusedxml.ElementTree import iterparse
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.utils.dateparse import parse_datetime
+
+
+"""
+GPS 트랙(GPX/TCX) 파싱, 거리 계산, 바이너리 저장
+
+- parse_track: defusedxml iterparse 로 한 포인트씩 읽고 처리한 요소는 바로 트리에서 제거 (큰 파일도 전체를 메모리에 올리지 않음)
+    - GPX: trk/trkseg/trkpt (lat, lon, ele, time), TCX: Activity/Lap/Track/Trackpoint (Position, AltitudeMeters, Time)
+    - trkseg / Track 이 바뀌는 구간(일시정지 등)은 거리에 넣지 않음, 위치가 없는 포인트(실내 기록)는 건너뜀
+    - 포인트 수는 TRACK_MAX_POINTS 까지
+- Track.summary: 포인트 배열 전체에 NumPy haversine 을 한 번에 적용해 거리, 경과 시간, 이동 시간 계산
+    - 이동 시간: 구간 속도가 MOVING_SPEED(m/s) 이상인 구간의 시간 합
+- encode_track / decode_track: Record.track 에 저장하는 바이너리 (DB 행 대신 파일 하나)
+    - 헤더 + zlib(int32 델타 배열), 좌표 1e-7도, 고도 cm, 시간 ms(시작 시각 기준) 고정소수점
+    - 델타는 int32 로 감싸서(wrap) 저장하고 복원 시 다시 감싸므로 경도 ±180 을 넘나들어도 손실 없음
+- track_file: 저장할 파일과 내용 해시(Record.track_hash, 분석 결과 캐시 키)
+- iter_track_files: 업로드 파일이 zip 이면 안의 .gpx/.tcx 를 하나씩, 아니면 파일 자체
+"""
+
+TRACK_EXTENSIONS = (".gpx", ".tcx")
+EARTH_RADIUS = 6_371_008.8  # m (평균 반지름)
+MOVING_SPEED = 0.5  # m/s, 이보다 느린 구간은 멈춘 것으로 봄
+
+TRACK_MAGIC = b"DTRK"
+TRACK_VERSION = 1
+# magic, version, flags, 포인트 수, 구간 수, 시작 시각(ms)
+TRACK_HEADER = struct.Struct("<4sBBIIq")
+HAS_ELEVATION = 1
+HAS_TIME = 2
+COORDINATE_SCALE = 10_000_000
+ELEVATION_SCALE = 100
+TIME_SCALE = 1000
+INT32_MAX = 2**31 - 1
+MAX_ELEVATION = 100_000  # m
+
+GPX_POINT_TAGS = {"trkpt", "rtept"}
+GPX_SEGMENT_TAGS = {"trkseg", "rte"}
+TCX_POINT_TAGS = {"Trackpoint"}
+TCX_SEGMENT_TAGS = {"Track"}
+
+
+# 파일이 XML 이 아니거나 zip 안의 파일이 깨진 경우
+READ_ERRORS = (
+    ParseError,
+    DefusedXmlException,
+    zipfile.BadZipFile,
+    zlib.error,
+    EOFError,
+)
+
+
+class TrackError(ValueError):
+    pass
+
+
+def get_max_points():
+    return getattr(settings, "TRACK_MAX_POINTS", 1_000_000)
+
+
+def get_max_file_size():
+    return getattr(settings, "TRACK_MAX_FILE_SIZE", 100 * 1024 * 1024)
+
+
+class Track:
+    def __init__(
+        self,
+        latitudes,
+        longitudes,
+        elevations=None,
+        times=None,
+        segments=None,
+        name="",
+    ):
+        self.latitudes = np.asarray(latitudes, dtype=np.float64)
+        self.longitudes = np.asarray(longitudes, dtype=np.float64)
+        self.elevations = _as_array(elevations)
+        self.times = _as_array(times)  # epoch 초
+        if segments is None or len(segments) == 0:
+            segments = [0]
+        self.segments = np.asarray(segments, dtype=np.int64)  # 구간 시작 인덱스
+        self.name = name
+
+    def __len__(self):
+        return len(self.latitudes)
+
+    # 구간 시작 포인트로 들어가는 이동(i-1 → i)은 거리/시간 계산에서 제외
+    def step_mask(self):
+        mask = np.ones(max(len(self) - 1, 0), dtype=bool)
+        starts = self.segments[(self.segments > 0) & (self.segments < len(self))]
+        mask[starts - 1] = False
+        return mask
+
+    # 포인트 i → i+1 이동 거리 (m)
+    def step_distances(self):
+        latitudes, longitudes = self.latitudes, self.longitudes
+        distances = haversine(
+            latitudes[:-1], longitudes[:-1], latitudes[1:], longitudes[1:]
+        )
+        return np.where(self.step_mask(), distances, 0.0)
+
+    def step_seconds(self):
+        if self.times is None:
+            return None
+        return np.where(self.step_mask(), np.diff(self.times), 0.0)
+
+    # 구간 속도가 MOVING_SPEED 이상인 이동
+    def moving_mask(self, distances, seconds):
+        return (seconds > 0) & (distances >= MOVING_SPEED * seconds)
+
+    def started_at(self):
+        if self.times is None or not len(self):
+            return None
+        return datetime.fromtimestamp(self.times[0], tz=timezone.utc)
+
+    def summary(self):
+        distances = self.step_distances()
+        summary = {
+            "distance": float(distances.sum()),
+            "duration": None,
+            "moving_time": None,
+            "started_at": self.started_at(),
+        }
+        seconds = self.step_seconds()
+        if seconds is not None:
+            moving = self.moving_mask(distances, seconds)
+            summary["duration"] = float(self.times[-1] - self.times[0])
+            summary["moving_time"] = float(seconds[moving].sum())
+        return summary
+
+
+# 위경도(도) 배열 사이의 대원 거리 (m)
+def haversine(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _as_array(values):
+    return None if values is None else np.asarray(values, dtype=np.float64)
+
+
+# "{네임스페이스}태그" → "태그" (태그 종류가 적으므로 캐시)
+@lru_cache(maxsize=256)
+def _local(tag):
+    return tag.rpartition("}")[2]
+
+
+# GPX 트랙/메타데이터의 name 요소인지 (부모 요소 스택으로 확인)
+def _is_track_name_element(stack):
+    return bool(stack) and _local(stack[-1].tag) in ("trk", "metadata")
+
+
+# 형식은 맞지만 없는 날짜(13월 등)도 시각이 없는 포인트로 처리
+def _parse_time(text):
+    try:
+        value = parse_datetime(text.strip()) if text else None
+    except ValueError:
+        return np.nan
+    if value is None:
+        return np.nan
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+# inf, nan 도 값이 없는 것으로 처리 (고정소수점 정수로 바꿀 수 없음)
+def _parse_float(text):
+    try:
+        value = float(text)
+    except (TypeError, ValueError):
+        return np.nan
+    return value if np.isfinite(value) else np.nan
+
+
+# 범위를 벗어난 고도는 값이 없는 것으로 처리 (int32 고정소수점 범위 보호)
+def _parse_elevation(text):
+    value = _parse_float(text)
+    return value if abs(value) <= MAX_ELEVATION else np.nan
+
+
+# 포인트 요소 → (위도, 경도, 고도, 시각), 위치가 없으면 None
+def _read_point(element, is_gpx):
+    if is_gpx:
+        latitude = _parse_float(element.get("lat"))
+        longitude = _parse_float(element.get("lon"))
+        elevation, time = np.nan, np.nan
+        for child in element:
+            tag = _local(child.tag)
+            if tag == "ele":
+                elevation = _parse_elevation(child.text)
+            elif tag == "time":
+                time = _parse_time(child.text)
+    else:
+        latitude = longitude = elevation = time = np.nan
+        for child in element.iter():
+            tag = _local(child.tag)
+            if tag == "LatitudeDegrees":
+                latitude = _parse_float(child.text)
+            elif tag == "LongitudeDegrees":
+                longitude = _parse_float(child.text)
+            elif tag == "AltitudeMeters":
+                elevation = _parse_elevation(child.text)
+            elif tag == "Time":
+                time = _parse_time(child.text)
+    if np.isnan(latitude) or np.isnan(longitude):
+        return None
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        return None
+    return latitude, longitude, elevation, time
+
+
+# 일부 포인트에만 값이 없으면 앞뒤 값으로 보간, 전부 없으면 None
+def _fill_missing(values):
+    values = np.frombuffer(values, dtype=np.float64) if len(values) else np.empty(0)
+    missing = np.isnan(values)
+    if missing.all():
+        return None
+    if missing.any():
+        index = np.arange(len(values))
+        values = values.copy()
+        values[missing] = np.interp(index[missing], index[~missing], values[~missing])
+    return values
+
+
+def parse_track(file):
+    columns = [array("d") for _ in range(4)]  # 위도, 경도, 고도, 시각
+    segments = array("q")
+    stack, is_gpx, name, max_points = [], None, "", get_max_points()
+    try:
+        for event, element in iterparse(file, events=("start", "end")):
+            tag = _local(element.tag)
+            if event == "start":
+                if is_gpx is None:
+                    if tag not in ("gpx", "TrainingCenterDatabase"):
+                        raise TrackError("GPX 또는 TCX 파일이 아닙니다.")
+                    is_gpx = tag == "gpx"
+                if tag in (GPX_SEGMENT_TAGS if is_gpx else TCX_SEGMENT_TAGS):
+                    segments.append(len(columns[0]))
+                stack.append(element)
+                continue
+
+            stack.pop()
+            if tag in (GPX_POINT_TAGS if is_gpx else TCX_POINT_TAGS):
+                point = _read_point(element, is_gpx)
+                if point is not None:
+                    if len(columns[0]) >= max_points:
+                        raise TrackError(
+                            f"포인트는 최대 {max_points}개까지 읽을 수 있습니다."
+                        )
+                    for column, value in zip(columns, point):
+                        column.append(value)
+            elif tag == "name" and not name and _is_track_name_element(stack):
+                name = (element.text or "").strip()
+            else:
+                continue
+            # 처리한 포인트는 부모에서 떼어내 메모리에 쌓이지 않게 함
+            if stack:
+                stack[-1].remove(element)
+    except READ_ERRORS:
+        raise TrackError("GPX/TCX 파일을 읽을 수 없습니다.")
+
+    if not len(columns[0]):
+        raise TrackError("위치가 기록된 포인트가 없습니다.")
+    starts = sorted({start for start in segments if start < len(columns[0])} | {0})
+    return Track(
+        np.frombuffer(columns[0], dtype=np.float64),
+        np.frombuffer(columns[1], dtype=np.float64),
+        elevations=_fill_missing(columns[2]),
+        times=_fill_missing(columns[3]),
+        segments=starts,
+        name=name,
+    )
+
+
+# 고정소수점 정수 → 델타 (int32 로 감싸서 저장)
+def _delta_encode(values, scale):
+    fixed = np.round(values * scale).astype(np.int64)
+    return np.diff(fixed, prepend=0).astype("<i4")
+
+
+def _delta_decode(deltas, scale):
+    return np.cumsum(deltas, dtype=np.int64).astype(np.int32) / scale
+
+
+def encode_track(track):
+    flags, start_ms, parts = 0, 0, [track.segments.astype("<i4")]
+    parts.append(_delta_encode(track.latitudes, COORDINATE_SCALE))
+    parts.append(_delta_encode(track.longitudes, COORDINATE_SCALE))
+    if track.elevations is not None:
+        flags |= HAS_ELEVATION
+        parts.append(_delta_encode(track.elevations, ELEVATION_SCALE))
+    if track.times is not None:
+        flags |= HAS_TIME
+        start_ms = int(round(track.times[0] * TIME_SCALE))
+        offsets = track.times - track.times[0]
+        if np.abs(offsets).max() * TIME_SCALE > INT32_MAX:
+            raise TrackError("기록 시간이 너무 깁니다.")
+        parts.append(_delta_encode(offsets, TIME_SCALE))
+    header = TRACK_HEADER.pack(
+        TRACK_MAGIC, TRACK_VERSION, flags, len(track), len(track.segments), start_ms
+    )
+    return header + zlib.compress(b"".join(part.tobytes() for part in parts))
+
+
+def decode_track(data):
+    header = TRACK_HEADER.unpack_from(data)
+    magic, version, flags, count, segment_count, start_ms = header
+    if magic != TRACK_MAGIC or version != TRACK_VERSION:
+        raise TrackError("트랙 파일 형식이 아닙니다.")
+    values = np.frombuffer(zlib.decompress(data[TRACK_HEADER.size :]), dtype="<i4")
+    segments, values = values[:segment_count], values[segment_count:]
+    columns = [
+        values[start : start + count] for start in range(0, len(values), max(count, 1))
+    ]
+    latitudes = _delta_decode(columns.pop(0), COORDINATE_SCALE)
+    longitudes = _delta_decode(columns.pop(0), COORDINATE_SCALE)
+    elevations = times = None
+    if flags & HAS_ELEVATION:
+        elevations = _delta_decode(columns.pop(0), ELEVATION_SCALE)
+    if flags & HAS_TIME:
+        times = _delta_decode(columns.pop(0), TIME_SCALE) + start_ms / TIME_SCALE
+    return Track(latitudes, longitudes, elevations, times, segments)
+
+
+def track_hash(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+# (저장할 파일, 내용 해시)
+def track_file(track):
+    data = encode_track(track)
+    return ContentFile(data, name=f"{uuid.uuid4().hex}.trk"), track_hash(data)
+
+
+def load_track(field_file):
+    with field_file.open("rb") as file:
+        return decode_track(file.read())
+
+
+def _is_track_name(name):
+    return name.lower().endswith(TRACK_EXTENSIONS)
+
+
+# (파일 이름, 파일 객체 또는 TrackError) 를 차례로 반환
+def iter_track_files(upload):
+    max_size = get_max_file_size()
+    name = getattr(upload, "name", "") or ""
+    if zipfile.is_zipfile(upload):
+        upload.seek(0)
+        try:
+            archive = zipfile.ZipFile(upload)
+        except zipfile.BadZipFile:
+            yield name, TrackError("zip 파일을 읽을 수 없습니다.")
+            return
+        with archive:
+            for info in archive.infolist():
+                base_name = os.path.basename(info.filename)
+                if info.is_dir() or base_name.startswith("."):
+                    continue
+                if not _is_track_name(base_name):
+                    continue
+                if info.file_size > max_size:
+                    yield info.filename, TrackError("파일이 너무 큽니다.")
+                    continue
+                try:
+                    file = archive.open(info)
+                except (RuntimeError, NotImplementedError):  # 암호화, 미지원 압축
+                    error = TrackError("zip 안의 파일을 열 수 없습니다.")
+                    yield info.filename, error
+                    continue
+                with file:
+                    yield info.filename, file
+        return
+    upload.seek(0)
+    if not _is_track_name(name):
+        yield name, TrackError("GPX, TCX 또는 zip 파일만 올릴 수 있습니다.")
+    elif getattr(upload, "size", 0) > max_size:
+        yield name, TrackError("파일이 너무 큽니다.")
+    else:
+        yield name, upload
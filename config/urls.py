@@ -1,7 +1,6 @@
 from django.contrib import admin
 from django.urls import path, include
-from django.conf.urls.static import static
-from django.conf import settings
+from config.media import media_urlpatterns
 from drf_spectacular.views import (
     SpectacularAPIView,
     SpectacularRedocView,
@@ -15,6 +14,8 @@ urlpatterns = [
     path("crews/", include("crews.urls")),
     path("promotions/", include("promotions.urls")),
     path("races/", include("races.urls")),
+    path("search/", include("search.urls")),
+    path("home/", include("home.urls")),
     path(
         "api/schema/", SpectacularAPIView.as_view(), name="schema"
     ),  # API 스키마 제공(yaml파일)
@@ -30,4 +31,5 @@ urlpatterns = [
     ),  # API 문서화를 위한 UI
 ]
 
-urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# 업로드 파일 (ETag/Range 지원, config/media.py)
+urlpatterns += media_urlpatterns()
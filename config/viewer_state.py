@@ -0,0 +1,120 @@
+from collections import defaultdict
+from django.contrib.auth.models import AnonymousUser
+from django.db import models
+from rest_framework import serializers
+from accounts.models import JoinedCrew
+from boards.models import Like, Post
+from crews.models import Crew, CrewFavorite
+from races.models import Race, RaceFavorite
+
+
+"""
+요청 단위 viewer state (현재 유저 기준 즐겨찾기/좋아요/가입상태) 일괄 조회
+
+- 리스트 시리얼라이저가 렌더링할 객체들을 먼저 등록(add)해 두면
+  관계별로 처음 질의될 때 페이지 전체를 쿼리 1번으로 조회해 캐싱
+- 비회원은 쿼리 없이 기본값 반환
+- serializer context["viewer_state"] 에 저장되어 같은 요청 안에서 공유됨
+"""
+
+
+def _load_crew_favorites(user, pks):
+    crew_ids = CrewFavorite.objects.filter(user=user, crew_id__in=pks).values_list(
+        "crew_id", flat=True
+    )
+    return {crew_id: True for crew_id in crew_ids}
+
+
+def _load_race_favorites(user, pks):
+    race_ids = RaceFavorite.objects.filter(user=user, race_id__in=pks).values_list(
+        "race_id", flat=True
+    )
+    return {race_id: True for race_id in race_ids}
+
+
+def _load_post_likes(user, pks):
+    post_ids = Like.objects.filter(author=user, post_id__in=pks).values_list(
+        "post_id", flat=True
+    )
+    return {post_id: True for post_id in post_ids}
+
+
+def _load_crew_statuses(user, pks):
+    return dict(
+        JoinedCrew.objects.filter(user=user, crew_id__in=pks).values_list(
+            "crew_id", "status"
+        )
+    )
+
+
+# 관계 이름: (대상 종류, 조회 함수, 기본값)
+RELATIONS = {
+    "crew_favorite": ("crew", _load_crew_favorites, False),
+    "crew_status": ("crew", _load_crew_statuses, None),
+    "race_favorite": ("race", _load_race_favorites, False),
+    "post_like": ("post", _load_post_likes, False),
+}
+
+TARGET_KINDS = {Crew: "crew", Race: "race", Post: "post"}
+
+
+class ViewerState:
+    def __init__(self, user):
+        self.user = user
+        self._targets = defaultdict(set)  # 종류별 렌더링 대상 pk
+        self._resolved = defaultdict(dict)  # 관계별 {pk: 값}
+
+    # 렌더링할 객체 등록 (Crew / Race / Post)
+    def add(self, objects):
+        for obj in objects:
+            kind = TARGET_KINDS.get(type(obj))
+            if kind is not None:
+                self._targets[kind].add(obj.pk)
+
+    # pk 만 알고 있는 대상 등록 (예: 캐시된 홈 화면 스냅샷)
+    def add_pks(self, kind, pks):
+        self._targets[kind].update(pks)
+
+    # 이미 알고 있는 값 미리 채우기 (예: 즐겨찾기 목록에서 불러온 크루는 모두 True)
+    def preload(self, relation, values):
+        self._resolved[relation].update(values)
+
+    def get(self, relation, pk):
+        kind, loader, default = RELATIONS[relation]
+        resolved = self._resolved[relation]
+        if pk not in resolved:
+            pks = (self._targets[kind] | {pk}) - resolved.keys()
+            values = loader(self.user, pks) if self.user.is_authenticated else {}
+            for target in pks:
+                resolved[target] = values.get(target, default)
+        return resolved[pk]
+
+    def is_favorite_crew(self, crew):
+        return self.get("crew_favorite", crew.pk)
+
+    def crew_status(self, crew):
+        return self.get("crew_status", crew.pk)
+
+    def is_favorite_race(self, race):
+        return self.get("race_favorite", race.pk)
+
+    def is_liked_post(self, post):
+        return self.get("post_like", post.pk)
+
+
+# serializer context 에서 viewer state 가져오기 (없으면 생성)
+def get_viewer_state(context):
+    if "viewer_state" not in context:
+        request = context.get("request")
+        user = getattr(request, "user", None) or AnonymousUser()
+        context["viewer_state"] = ViewerState(user)
+    return context["viewer_state"]
+
+
+# many=True 직렬화 시 페이지 전체를 viewer state 에 등록한 뒤 직렬화
+class ViewerStateListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        items = list(iterable)
+        get_viewer_state(self.context).add(items)
+        return super().to_representation(items)
@@ -1,7 +1,8 @@
 from django.contrib import admin
-from django.db import models
+from django.db import models, transaction
 from .models import Crew, CrewFavorite, CrewReview
 from accounts.models import CustomUser, JoinedCrew
+from config.response_cache import invalidate
 
 
 """
@@ -15,6 +16,7 @@ JoinedCrewInline 클래스
 - 유저 이름, 이메일로 검색 가능
 - 상태 필드 편집 가능
 - 멤버 승인, 거절, 탈퇴 액션 제공
+    - queryset.update()는 시그널을 보내지 않으므로 처리 후 크루 카운터 재계산 및 응답 캐시 무효화
 """
 
 
@@ -30,18 +32,25 @@ class JoinedCrewInline(admin.TabularInline):
 
     actions = ["approve_members", "disapprove_members", "quit_members"]
 
+    def _update_status(self, queryset, status):
+        crew_ids = list(queryset.values_list("crew_id", flat=True).distinct())
+        with transaction.atomic():
+            queryset.update(status=status)
+            Crew.objects.filter(pk__in=crew_ids).sync_counts()
+        invalidate("crews")
+
     def approve_members(self, request, queryset):
-        queryset.update(status="member")
+        self._update_status(queryset, "member")
 
     approve_members.short_description = "선택된 멤버 승인"
 
     def disapprove_members(self, request, queryset):
-        queryset.update(status="non_keeping")
+        self._update_status(queryset, "non_keeping")
 
     disapprove_members.short_description = "선택된 멤버 거절"
 
     def quit_members(self, request, queryset):
-        queryset.update(status="quit")
+        self._update_status(queryset, "quit")
 
     quit_members.short_description = "선택된 멤버 탈퇴 처리"
 
@@ -54,7 +63,7 @@ CrewAdmin 클래스
 - JoinedCrewInline을 인라인으로 표시
 - 이름, 지역으로 검색 가능
 - 지역, 모집여부로 필터링 가능
-- 멤버 수 필드는 읽기 전용
+- 멤버 수, 즐겨찾기 수 필드는 읽기 전용 (JoinedCrew / CrewFavorite 변경 시 자동 갱신)
 - 크루 소유자 필드에서 크루 관리자 또는 스탭만 선택 가능
 - 모집여부 필드 레이블 변경
 """
@@ -71,7 +80,8 @@ class CrewAdmin(admin.ModelAdmin):
     inlines = [JoinedCrewInline]
     search_fields = ("name", "location_city", "location_district")
     list_filter = ("location_city", "is_opened")
-    readonly_fields = ("get_member_count",)
+    readonly_fields = ("get_member_count", "favorite_count")
+    exclude = ("member_count",)
 
     def formfield_for_foreignkey(self, db_field, request, **kwargs):
         if db_field.name == "owner":
@@ -81,7 +91,7 @@ class CrewAdmin(admin.ModelAdmin):
         return super().formfield_for_foreignkey(db_field, request, **kwargs)
 
     def get_member_count(self, obj):
-        return obj.members.filter(status="member").count()
+        return obj.member_count
 
     get_member_count.short_description = "멤버 수"
 
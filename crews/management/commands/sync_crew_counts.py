@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from crews.models import Crew
+
+
+"""
+크루 카운터 재계산 커맨드
+
+- member_count, favorite_count 를 JoinedCrew / CrewFavorite 기준으로 다시 맞춤
+- 사용법: python manage.py sync_crew_counts [--crew-id 1 --crew-id 2]
+"""
+
+
+class Command(BaseCommand):
+    help = "크루의 member_count / favorite_count 를 실제 데이터 기준으로 재계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--crew-id",
+            action="append",
+            type=int,
+            dest="crew_ids",
+            help="재계산할 크루 id (생략 시 전체)",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Crew.objects.all()
+        if options["crew_ids"]:
+            queryset = queryset.filter(pk__in=options["crew_ids"])
+        updated = queryset.sync_counts()
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated}개 크루의 카운터를 갱신했습니다.")
+        )
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from crews.models import Crew
+
+
+"""
+크루 일정 비트맵 재계산 커맨드
+
+- meet_days / meet_time 으로부터 meet_day_mask, meet_time_mask 를 다시 계산
+- 컬럼 추가 후 기존 크루 데이터를 채울 때 사용
+- 사용법: python manage.py sync_crew_schedules
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "크루의 meet_day_mask / meet_time_mask 를 모임 요일/시간 기준으로 재계산합니다."
+    )
+
+    def handle(self, *args, **options):
+        updated = Crew.objects.all().sync_schedules()
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated}개 크루의 일정을 갱신했습니다.")
+        )
@@ -1,7 +1,42 @@
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.conf import settings
 from multiselectfield import MultiSelectField
 from config.constants import LOCATION_CITY_CHOICES, MEET_DAY_CHOICES, TIME_CHOICES
+from config.images import validate_image_pixels
+from .schedule import day_mask, time_mask
+
+
+class CrewQuerySet(models.QuerySet):
+    # 멤버 수/즐겨찾기 수를 실제 데이터 기준으로 다시 계산 (크루 수와 무관하게 UPDATE 1회)
+    def sync_counts(self):
+        joined_crew_model = self.model._meta.get_field("members").related_model
+        member_count = (
+            joined_crew_model.objects.filter(crew=OuterRef("pk"), status="member")
+            .values("crew")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        favorite_count = (
+            CrewFavorite.objects.filter(crew=OuterRef("pk"))
+            .values("crew")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        return self.update(
+            member_count=Coalesce(Subquery(member_count), Value(0)),
+            favorite_count=Coalesce(Subquery(favorite_count), Value(0)),
+        )
+
+    # meet_days / meet_time 으로부터 일정 비트맵 재계산
+    def sync_schedules(self):
+        crews = list(self.only("id", "meet_days", "meet_time"))
+        for crew in crews:
+            crew.set_schedule_masks()
+        return self.model.objects.bulk_update(
+            crews, ["meet_day_mask", "meet_time_mask"], batch_size=500
+        )
 
 
 class Crew(models.Model):
@@ -15,14 +50,51 @@ class Crew(models.Model):
     meet_time = models.CharField(max_length=10, choices=TIME_CHOICES)
     description = models.TextField("")
     thumbnail_image = models.ImageField(
-        upload_to="crews/thumbnail/%Y/%m/%d/", null=True
+        upload_to="crews/thumbnail/%Y/%m/%d/",
+        null=True,
+        validators=[validate_image_pixels],
     )
     sns_link = models.URLField(null=True)
     is_opened = models.BooleanField(default=True)
+    member_count = models.PositiveIntegerField(default=0)  # 승인된 멤버 수 (비정규화)
+    favorite_count = models.PositiveIntegerField(default=0)  # 즐겨찾기 수 (비정규화)
+    meet_day_mask = models.PositiveSmallIntegerField(default=0)  # 모임 요일 비트
+    meet_time_mask = models.BigIntegerField(default=0)  # 모임 시간 30분 슬롯 비트
+
+    objects = CrewQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["is_opened", "-favorite_count"], name="crew_open_fav_idx"
+            ),
+            models.Index(
+                fields=["is_opened", "meet_time_mask", "meet_day_mask"],
+                name="crew_open_schedule_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        self.set_schedule_masks()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"meet_days", "meet_time"} & set(
+            update_fields
+        ):
+            kwargs["update_fields"] = {
+                *update_fields,
+                "meet_day_mask",
+                "meet_time_mask",
+            }
+        super().save(*args, **kwargs)
+
+    # crews/schedule.py 참고
+    def set_schedule_masks(self):
+        self.meet_day_mask = day_mask(self.meet_days or [])
+        self.meet_time_mask = time_mask(self.meet_time)
+
     def is_favorite(self, user):
         return CrewFavorite.objects.filter(user=user, crew=self).exists()
 
@@ -0,0 +1,57 @@
+import re
+from config.constants import MEET_DAY_CHOICES, TIME_CHOICES
+
+
+"""
+크루 모임 일정 비트맵
+
+- 요일 × 30분 슬롯(7 × 48) 비트맵을 두 개의 정수로 나누어 저장
+    - meet_day_mask: MEET_DAY_CHOICES 순서대로 요일 비트 (월=1, 화=2, ... 일=64)
+    - meet_time_mask: TIME_CHOICES 순서대로 30분 슬롯 비트 (00:00=1, 00:30=2, ... 23:30=2**47)
+    - 크루는 모든 모임 요일에 같은 시간에 만나므로 (요일 비트 × 시간 비트) 가 전체 비트맵
+- 시간 비트는 하나만 켜지므로 meet_time_mask 로 정렬하면 시간순 정렬이 됨
+- "월/수 중 하루라도, 06:00~08:00 사이" 같은 조건을 문자열 LIKE 대신 비트 연산으로 처리
+"""
+
+DAY_BITS = {day: 1 << i for i, (day, _) in enumerate(MEET_DAY_CHOICES)}
+SLOT_COUNT = len(TIME_CHOICES)  # 48
+
+TIME_PATTERN = re.compile(r"^\s*(\d{1,2}):(\d{2})(?::\d{2})?\s*(AM|PM)?\s*$", re.I)
+
+
+def day_mask(days):
+    if isinstance(days, str):
+        days = days.split(",")
+    mask = 0
+    for day in days:
+        mask |= DAY_BITS.get(day, 0)
+    return mask
+
+
+# "07:00 AM", "19:30 PM"(TIME_CHOICES 형식), "07:00 PM", "10:00:00" → 30분 슬롯 번호
+def time_slot(value):
+    match = TIME_PATTERN.match(value or "")
+    if not match:
+        return None
+    hour, minute, meridiem = int(match[1]), int(match[2]), (match[3] or "").upper()
+    if meridiem == "PM" and hour < 12:
+        hour += 12
+    elif meridiem == "AM" and hour == 12:
+        hour = 0
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        return None
+    return hour * 2 + minute // 30
+
+
+def time_mask(value):
+    slot = time_slot(value)
+    return 0 if slot is None else 1 << slot
+
+
+# 시작~종료 시각(포함) 사이의 슬롯 비트 범위
+def time_range_mask(start, end):
+    start_slot = time_slot(start) if start else 0
+    end_slot = time_slot(end) if end else SLOT_COUNT - 1
+    if start_slot is None or end_slot is None or start_slot > end_slot:
+        return None
+    return ((1 << (end_slot + 1)) - 1) ^ ((1 << start_slot) - 1)
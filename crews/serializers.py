@@ -2,21 +2,15 @@ from rest_framework import serializers
 from .models import Crew, CrewReview
 from accounts.models import JoinedCrew
 from config.constants import MEET_DAY_CHOICES, TIME_CHOICES
-
-
-# 즐겨찾기 여부 체크
-def check_is_favorite(user, crew):
-    if user.is_authenticated:
-        return crew.is_favorite(user)
-    return False
+from config.images import ImageVariantsField
+from config.viewer_state import ViewerStateListSerializer, get_viewer_state
 
 
 """
 크루 시리얼라이저에서 공통으로 사용되는 메서드 정의
 
 - get_meet_days: 모임 요일을 반환. `["mon", "tue"]`의 형태로 제공.
-- get_is_favorite: 크루의 즐겨찾기 여부 반환
-- get_member_count: 크루의 멤버 수를 반환
+- get_is_favorite: 크루의 즐겨찾기 여부 반환 (viewer state 로 페이지 단위 일괄 조회)
 """
 
 
@@ -25,11 +19,7 @@ class CrewSerializerMixin:
         return obj.meet_days
 
     def get_is_favorite(self, obj):
-        user = self.context["request"].user
-        return check_is_favorite(user, obj)
-
-    def get_member_count(self, obj):
-        return JoinedCrew.objects.filter(crew=obj, status="member").count()
+        return get_viewer_state(self.context).is_favorite_crew(obj)
 
 
 """
@@ -38,8 +28,9 @@ class CrewSerializerMixin:
 - is_opened: 모집여부
 - meet_days: 만나는 요일
 - is_favorite: 해당 크루에 대한 즐겨찾기 여부
-- member_count: 해당 크루의 총 멤버 수
-- favorite_count: 해당 크루의 총 즐겨찾기 수 (top6에 사용됨)
+- member_count: 해당 크루의 총 멤버 수 (Crew.member_count 컬럼)
+- favorite_count: 해당 크루의 총 즐겨찾기 수 (Crew.favorite_count 컬럼, top6에 사용됨)
+- thumbnail_image_variants: 썸네일 폭별 WebP/JPEG URL (config/images.py, 생성 전이면 null)
 """
 
 
@@ -47,8 +38,9 @@ class CrewListSerializer(CrewSerializerMixin, serializers.ModelSerializer):
     is_opened = serializers.CharField(source="get_status_display")
     meet_days = serializers.SerializerMethodField()
     is_favorite = serializers.SerializerMethodField()
-    member_count = serializers.SerializerMethodField()
+    member_count = serializers.IntegerField(read_only=True)
     favorite_count = serializers.IntegerField(read_only=True)
+    thumbnail_image_variants = ImageVariantsField(source="thumbnail_image")
 
     class Meta:
         model = Crew
@@ -56,6 +48,7 @@ class CrewListSerializer(CrewSerializerMixin, serializers.ModelSerializer):
             "id",
             "name",
             "thumbnail_image",
+            "thumbnail_image_variants",
             "member_count",
             "is_favorite",
             "location_city",
@@ -65,6 +58,7 @@ class CrewListSerializer(CrewSerializerMixin, serializers.ModelSerializer):
             "is_opened",
             "favorite_count",
         ]
+        list_serializer_class = ViewerStateListSerializer
 
 
 """
@@ -73,7 +67,9 @@ class CrewListSerializer(CrewSerializerMixin, serializers.ModelSerializer):
 - is_opened: 모집여부
 - meet_days: 만나는 요일
 - is_favorite: 해당 크루에 대한 즐겨찾기 여부
-- member_count: 해당 크루의 총 멤버 수
+- member_count: 해당 크루의 총 멤버 수 (Crew.member_count 컬럼)
+- joined_status: 현재 유저의 가입 상태 (keeping/member/not_member/quit, 미가입 및 비회원은 null)
+- thumbnail_image_variants: 썸네일 폭별 WebP/JPEG URL
 """
 
 
@@ -81,7 +77,9 @@ class CrewDetailSerializer(CrewSerializerMixin, serializers.ModelSerializer):
     is_opened = serializers.CharField(source="get_status_display")
     meet_days = serializers.SerializerMethodField()
     is_favorite = serializers.SerializerMethodField()
-    member_count = serializers.SerializerMethodField()
+    member_count = serializers.IntegerField(read_only=True)
+    joined_status = serializers.SerializerMethodField()
+    thumbnail_image_variants = ImageVariantsField(source="thumbnail_image")
 
     class Meta:
         model = Crew
@@ -94,11 +92,17 @@ class CrewDetailSerializer(CrewSerializerMixin, serializers.ModelSerializer):
             "meet_time",
             "description",
             "thumbnail_image",
+            "thumbnail_image_variants",
             "sns_link",
             "is_favorite",
             "is_opened",
             "member_count",
+            "joined_status",
         ]
+        list_serializer_class = ViewerStateListSerializer
+
+    def get_joined_status(self, obj):
+        return get_viewer_state(self.context).crew_status(obj)
 
 
 """
@@ -0,0 +1,42 @@
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from accounts.models import JoinedCrew
+from config.images import build_variants_on_save
+from config.response_cache import invalidate_on_change
+from .models import Crew, CrewFavorite
+
+
+"""
+크루 비정규화 카운터 유지
+
+- member_count: JoinedCrew 저장/삭제 시 해당 크루의 멤버 수를 다시 계산
+    - 상태 변경(keeping → member, member → quit 등)을 모두 반영하기 위해 증감 대신 재계산
+- favorite_count: CrewFavorite 생성/삭제 시 F() 표현식으로 증감
+- 크루 목록/top6 비회원 응답 캐시 무효화 (config/response_cache.py)
+- 썸네일 변형 생성 (config/images.py)
+"""
+
+invalidate_on_change("crews", Crew, CrewFavorite, JoinedCrew)
+build_variants_on_save(Crew, "thumbnail_image", groups=["crews"])
+
+
+@receiver(post_save, sender=JoinedCrew)
+@receiver(post_delete, sender=JoinedCrew)
+def sync_member_count(sender, instance, **kwargs):
+    Crew.objects.filter(pk=instance.crew_id).sync_counts()
+
+
+@receiver(post_save, sender=CrewFavorite)
+def increase_favorite_count(sender, instance, created, **kwargs):
+    if created:
+        Crew.objects.filter(pk=instance.crew_id).update(
+            favorite_count=F("favorite_count") + 1
+        )
+
+
+@receiver(post_delete, sender=CrewFavorite)
+def decrease_favorite_count(sender, instance, **kwargs):
+    Crew.objects.filter(pk=instance.crew_id, favorite_count__gt=0).update(
+        favorite_count=F("favorite_count") - 1
+    )
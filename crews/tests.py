@@ -2,8 +2,10 @@ from rest_framework.test import APITestCase, APIClient
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework import status
+from django.test import override_settings
 from .models import Crew, CrewReview, CrewFavorite
 from accounts.models import JoinedCrew
+from config.query_budget import QueryBudgetTestMixin
 
 
 User = get_user_model()
@@ -89,6 +91,50 @@ class PublicCrewViewSetTestCase(APITestCase):
         crew_names = [crew["name"] for crew in response.data]
         self.assertIn(self.opened_crew1.name, crew_names)
 
+    # 로그인 유저의 즐겨찾기 여부는 크루 수와 무관하게 쿼리 1번으로 조회
+    def test_crew_list_is_favorite_resolved_in_bulk(self):
+        other_user = User.objects.create_user(
+            email="otheruser@example.com", password="testpassword"
+        )
+        CrewFavorite.objects.create(user=other_user, crew=self.opened_crew2)
+        self.client.force_authenticate(user=other_user)
+        url = reverse("crews:public_crew-list")
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        is_favorite = {crew["id"]: crew["is_favorite"] for crew in response.data}
+        self.assertEqual(
+            is_favorite, {self.opened_crew1.id: False, self.opened_crew2.id: True}
+        )
+
+    # 요일 중 하나라도 + 모임 시간대 필터링, 시간순 정렬
+    def test_filter_by_any_meet_day_and_time_range(self):
+        self.opened_crew1.meet_time = "07:00 AM"
+        self.opened_crew1.save()
+        self.opened_crew2.meet_time = "19:30 PM"
+        self.opened_crew2.save()
+
+        url = reverse("crews:public_crew-list") + "?meet_days=mon,wed&day_match=any"
+        response = self.client.get(url)
+        self.assertEqual(len(response.data), 2)
+
+        url = (
+            reverse("crews:public_crew-list")
+            + "?meet_time_from=06:00&meet_time_to=08:00"
+        )
+        response = self.client.get(url)
+        self.assertEqual([crew["id"] for crew in response.data], [self.opened_crew1.id])
+
+        url = reverse("crews:public_crew-list") + "?meet_time_from=19:30"
+        response = self.client.get(url)
+        self.assertEqual([crew["id"] for crew in response.data], [self.opened_crew2.id])
+
+        url = reverse("crews:public_crew-list") + "?ordering=meet_time"
+        response = self.client.get(url)
+        self.assertEqual(
+            [crew["id"] for crew in response.data],
+            [self.opened_crew1.id, self.opened_crew2.id],
+        )
+
     # 크루 상세정보
     def test_crew_detail(self):
         self.client.force_authenticate(user=self.user)
@@ -131,6 +177,39 @@ class PublicCrewViewSetTestCase(APITestCase):
         self.assertEqual(response.data[1]["id"], self.opened_crew2.id)
         self.assertEqual(response.data[1]["favorite_count"], 1)
 
+    # 가입 승인/탈퇴, 즐겨찾기 추가/해제 시 크루 카운터 갱신
+    def test_crew_counters_follow_join_and_favorite(self):
+        self.assertEqual(Crew.objects.get(pk=self.opened_crew1.pk).favorite_count, 6)
+
+        joined_crew = JoinedCrew.objects.create(
+            user=self.user, crew=self.opened_crew1, status="keeping"
+        )
+        self.assertEqual(Crew.objects.get(pk=self.opened_crew1.pk).member_count, 0)
+        joined_crew.status = "member"
+        joined_crew.save()
+        self.assertEqual(Crew.objects.get(pk=self.opened_crew1.pk).member_count, 1)
+        joined_crew.status = "quit"
+        joined_crew.save()
+        self.assertEqual(Crew.objects.get(pk=self.opened_crew1.pk).member_count, 0)
+
+        self.client.force_authenticate(user=self.user)
+        url = reverse("crews:public_crew-favorite", kwargs={"pk": self.opened_crew1.pk})
+        self.client.post(url)
+        self.assertEqual(Crew.objects.get(pk=self.opened_crew1.pk).favorite_count, 5)
+        self.client.post(url)
+        self.assertEqual(Crew.objects.get(pk=self.opened_crew1.pk).favorite_count, 6)
+
+    # 카운터가 어긋난 경우 재계산
+    def test_crew_counters_sync(self):
+        JoinedCrew.objects.create(
+            user=self.user, crew=self.opened_crew1, status="member"
+        )
+        Crew.objects.update(member_count=0, favorite_count=0)
+        Crew.objects.all().sync_counts()
+        crew = Crew.objects.get(pk=self.opened_crew1.pk)
+        self.assertEqual(crew.member_count, 1)
+        self.assertEqual(crew.favorite_count, 6)
+
     # 크루 리뷰 작성
     def test_crew_review_list_create(self):
         self.client.force_authenticate(user=self.user)
@@ -335,3 +414,66 @@ class CrewMemberViewSetTestCase(APITestCase):
         data = {"status": "quit"}
         response = self.client.patch(url, data)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+# 쿼리 예산 (config/query_budget.py)
+class CrewQueryBudgetTestCase(QueryBudgetTestMixin, APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.crew_user = User.objects.create_user(
+            email="crewuser@example.com", password="testpassword", user_type="crew"
+        )
+        self.crew = Crew.objects.create(
+            name="Test Crew", location_city="seoul", is_opened=True, owner=self.crew_user
+        )
+        self.seeded = 0
+
+    # 크루, 즐겨찾기, 가입 신청, 리뷰를 n개씩 추가
+    def seed(self, n):
+        for _ in range(n):
+            self.seeded += 1
+            user = User.objects.create(
+                username=f"seed{self.seeded}", email=f"seed{self.seeded}@example.com"
+            )
+            crew = Crew.objects.create(
+                name=f"Seed Crew {self.seeded}",
+                location_city="seoul",
+                is_opened=True,
+                owner=self.crew_user,
+            )
+            CrewFavorite.objects.create(user=self.crew_user, crew=crew)
+            JoinedCrew.objects.create(user=user, crew=self.crew, status="member")
+            CrewReview.objects.create(crew=self.crew, author=user, contents="review")
+
+    def test_public_crew_query_budget(self):
+        for user in [None, self.crew_user]:
+            self.client.force_authenticate(user=user)
+            self.assertQueryBudget("/crews/", self.seed)
+            self.assertQueryBudget("/crews/top6/", self.seed)
+            self.assertQueryBudget(f"/crews/{self.crew.pk}/", self.seed)
+            self.assertQueryBudget(f"/crews/{self.crew.pk}/reviews/", self.seed)
+
+    # 비동기 상세 (config/async_sections.py), 테스트 트랜잭션의 데이터를 보도록 섹션을 순서대로 실행
+    @override_settings(ASYNC_CONCURRENT_SECTIONS=False)
+    def test_crew_detail_async(self):
+        self.seed(2)
+        path = f"/crews/async/{self.crew.pk}/"
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            {
+                "crew": self.client.get(f"/crews/{self.crew.pk}/").json(),
+                "reviews": self.client.get(f"/crews/{self.crew.pk}/reviews/").json(),
+            },
+        )
+        response = self.client.get("/crews/async/0/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.post(path)
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+        self.assertQueryBudget(path, self.seed)
+
+    def test_manager_crew_query_budget(self):
+        self.client.force_authenticate(user=self.crew_user)
+        self.assertQueryBudget("/crews/manage/", self.seed)
+        self.assertQueryBudget(f"/crews/manage/{self.crew.pk}/members/", self.seed)
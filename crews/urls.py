@@ -26,6 +26,7 @@ router.register("manage", views.ManagerCrewViewSet, basename="manage_crew")
 router.register("", views.PublicCrewViewSet, basename="public_crew")
 
 urlpatterns = [
+    path("async/<int:crew_id>/", views.crew_detail_async, name="crew_detail_async"),
     path("", include(router.urls)),
     path("top6/", views.PublicCrewViewSet.as_view({"get": "top6"}), name="crew_top6"),
 ]
@@ -1,4 +1,5 @@
-from django.db.models import Q, Count
+from django.db import transaction
+from django.db.models import F, Q
 from accounts.models import JoinedCrew
 from .models import Crew, CrewReview, CrewFavorite
 from rest_framework import viewsets, status, mixins
@@ -6,6 +7,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from .permissions import IsCrewOwner, IsCrewAdmin, IsCrewMemberOrQuit
+from .schedule import day_mask, time_range_mask
 from .serializers import (
     CrewListSerializer,
     CrewDetailSerializer,
@@ -16,10 +18,24 @@ from .serializers import (
     JoinedCrewSerializer,
     CrewUpdateSerializer,
 )
-from config.constants import MEET_DAY_CHOICES, LOCATION_CITY_CHOICES
+from config.constants import LOCATION_CITY_CHOICES
+from config.response_cache import cache_anonymous_response
+from config.query_budget import query_budget
+from config.async_sections import (
+    as_drf_request,
+    authenticate,
+    gather_sections,
+    json_response,
+    require_GET,
+)
+from rest_framework.exceptions import NotFound
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
-import functools, operator
+
+
+# 모집중인 크루 중 즐겨찾기 수 상위 6개 (top6, 홈 화면에서 공통 사용)
+def get_top6_crews(queryset):
+    return queryset.filter(is_opened=True).order_by("-favorite_count")[:6]
 
 
 """
@@ -48,6 +64,30 @@ import functools, operator
             OpenApiParameter(
                 name="meet_days", description="요일 선택", required=False, type=str
             ),
+            OpenApiParameter(
+                name="day_match",
+                description="all: 선택한 요일에 모두 모임(기본값), any: 하루라도 모임",
+                required=False,
+                type=str,
+            ),
+            OpenApiParameter(
+                name="meet_time_from",
+                description="모임 시작 시각 이후 (HH:MM)",
+                required=False,
+                type=str,
+            ),
+            OpenApiParameter(
+                name="meet_time_to",
+                description="모임 시작 시각 이전 (HH:MM, 포함)",
+                required=False,
+                type=str,
+            ),
+            OpenApiParameter(
+                name="ordering",
+                description="meet_time: 모임 시간순 정렬",
+                required=False,
+                type=str,
+            ),
         ]
     )
 )
@@ -72,6 +112,16 @@ class PublicCrewViewSet(viewsets.ReadOnlyModelViewSet):
         context.update({"request": self.request})
         return context
 
+    # 크루 목록 (비회원 응답 캐시, config/response_cache.py)
+    @query_budget(2)
+    @cache_anonymous_response("crews")
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @query_budget(3)
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     # 크루 검색 및 필터링 기능
     def filter_queryset(self, queryset):
         search_keyword = self.request.GET.get("search", "")
@@ -95,23 +145,41 @@ class PublicCrewViewSet(viewsets.ReadOnlyModelViewSet):
             if selected_location_city:
                 queryset = queryset.filter(location_city=selected_location_city[0])
 
-        # 요일 필터링
+        # 요일 필터링 (모임 요일 비트맵, crews/schedule.py)
         if selected_meet_days:
-            selected_meet_days = selected_meet_days.split(",")
-            valid_meet_days = [day[0] for day in MEET_DAY_CHOICES]
-            selected_meet_days = [
-                day for day in selected_meet_days if day in valid_meet_days
-            ]
-            queryset = queryset.filter(
-                functools.reduce(
-                    operator.and_,
-                    (Q(meet_days__contains=day) for day in selected_meet_days),
+            selected_mask = day_mask(selected_meet_days.split(","))
+            queryset = queryset.alias(
+                matched_days=F("meet_day_mask").bitand(selected_mask)
+            )
+            if self.request.GET.get("day_match") == "any":
+                queryset = queryset.filter(matched_days__gt=0)
+            else:
+                queryset = queryset.filter(matched_days=selected_mask)
+
+        # 모임 시간대 필터링 (30분 슬롯 비트맵)
+        meet_time_from = self.request.GET.get("meet_time_from", "")
+        meet_time_to = self.request.GET.get("meet_time_to", "")
+        if meet_time_from or meet_time_to:
+            range_mask = time_range_mask(meet_time_from, meet_time_to)
+            if range_mask is None:
+                return queryset.none()
+            # 시간 비트는 하나만 켜지므로 범위 조건을 함께 걸어 인덱스를 탈 수 있게 함
+            queryset = (
+                queryset.filter(
+                    meet_time_mask__gte=range_mask & -range_mask,
+                    meet_time_mask__lte=1 << (range_mask.bit_length() - 1),
                 )
+                .alias(matched_time=F("meet_time_mask").bitand(range_mask))
+                .filter(matched_time__gt=0)
             )
+
+        if self.request.GET.get("ordering") == "meet_time":
+            queryset = queryset.order_by("meet_time_mask", "id")
         return queryset
 
     # 크루 가입 신청 기능
     @action(detail=True, methods=["post"], permission_classes=[IsAuthenticated])
+    @transaction.atomic
     def join(self, request, pk=None):
         crew = self.get_object()
         user = request.user
@@ -145,8 +213,9 @@ class PublicCrewViewSet(viewsets.ReadOnlyModelViewSet):
             {"message": "가입 신청이 완료되었습니다."}, status=status.HTTP_200_OK
         )
 
-    # 크루 즐겨찾기 추가/제거 기능
+    # 크루 즐겨찾기 추가/제거 기능 (favorite_count 는 시그널에서 같은 트랜잭션으로 갱신)
     @action(detail=True, methods=["post"], permission_classes=[IsAuthenticated])
+    @transaction.atomic
     def favorite(self, request, pk=None):
         crew = self.get_object()
         user = request.user
@@ -159,13 +228,10 @@ class PublicCrewViewSet(viewsets.ReadOnlyModelViewSet):
 
     # 즐겨찾기 수 기준 상위 6개 크루 조회
     @action(detail=False, methods=["get"])
+    @query_budget(2)
+    @cache_anonymous_response("crews")
     def top6(self, request):
-        queryset = self.filter_queryset(self.get_queryset())
-        queryset = (
-            queryset.filter(is_opened=True)
-            .annotate(favorite_count=Count("crewfavorite"))
-            .order_by("-favorite_count")[:6]
-        )
+        queryset = get_top6_crews(self.filter_queryset(self.get_queryset()))
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
@@ -212,6 +278,10 @@ class ManagerCrewViewSet(viewsets.ModelViewSet):
         queryset = queryset.filter(owner=self.request.user).order_by("-id")
         return queryset
 
+    @query_budget(2)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
     # 크루 생성 시 owner 설정
     def perform_create(self, serializer):
         serializer.save(owner=self.request.user, is_opened=True)
@@ -267,6 +337,10 @@ class CrewReviewViewSet(CrewReviewPermissionMixin, viewsets.ModelViewSet):
     def get_queryset(self):
         return super().get_queryset().filter(crew_id=self.kwargs.get("crew_id"))
 
+    @query_budget(1)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
     # 리뷰 작성 기능
     def create(self, request, *args, **kwargs):
         crew = get_object_or_404(Crew, id=self.kwargs.get("crew_id"))
@@ -325,4 +399,40 @@ class CrewMemberViewSet(
     # 현재 사용자가 소유한 크루의 회원만 조회
     def get_queryset(self):
         crew_id = self.kwargs.get("crew_id")
-        return JoinedCrew.objects.filter(crew_id=crew_id, crew__owner=self.request.user)
+        return JoinedCrew.objects.filter(
+            crew_id=crew_id, crew__owner=self.request.user
+        ).select_related("user")
+
+    @query_budget(1)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+
+# 크루 상세 + 리뷰 비동기 조회 (ASGI, 두 섹션을 동시에 조회, config/async_sections.py)
+@query_budget(4)
+@require_GET
+async def crew_detail_async(request, crew_id):
+    error_response = await authenticate(request)
+    if error_response is not None:
+        return error_response
+    drf_request = as_drf_request(request)
+
+    sections = await gather_sections(
+        crew=lambda: get_crew_detail_data(crew_id, drf_request),
+        reviews=lambda: get_crew_reviews_data(crew_id),
+    )
+    if sections["crew"] is None:
+        return json_response({"detail": NotFound.default_detail}, status=404)
+    return json_response(sections)
+
+
+def get_crew_detail_data(crew_id, request):
+    crew = Crew.objects.filter(pk=crew_id).first()
+    if crew is None:
+        return None
+    return CrewDetailSerializer(crew, context={"request": request}).data
+
+
+def get_crew_reviews_data(crew_id):
+    reviews = CrewReview.objects.filter(crew_id=crew_id).select_related("author")
+    return CrewReviewListSerializer(reviews, many=True).data
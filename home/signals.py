@@ -0,0 +1,25 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from accounts.models import CustomUser
+from boards.models import Comment, Post
+from config.response_cache import invalidate, invalidate_on_change
+
+
+# 홈 화면 최신 게시글 섹션 스냅샷 무효화 (home/snapshot.py)
+invalidate_on_change("posts", Post, Comment)
+
+
+# 스냅샷에 작성자 닉네임이 들어가므로 닉네임이 바뀌면 함께 무효화
+# (DB 에서 읽은 닉네임을 모르는 유저는 바뀐 것으로 간주)
+@receiver(post_save, sender=CustomUser)
+def invalidate_posts_on_nickname_change(
+    sender, instance, created, raw, update_fields, **kwargs
+):
+    if created or raw:
+        return
+    if update_fields is not None and "nickname" not in update_fields:
+        return
+    if getattr(instance, "_loaded_nickname", None) == instance.nickname:
+        return
+    invalidate("posts")
+    instance._loaded_nickname = instance.nickname
@@ -0,0 +1,101 @@
+from django.contrib.auth.models import AnonymousUser
+from django.utils import timezone
+from boards.models import Post
+from boards.serializers import PostListSerializer
+from config.response_cache import (
+    KEY_PREFIX,
+    get_cache,
+    get_timeout,
+    get_version,
+    record_stat,
+)
+from config.viewer_state import ViewerState
+from crews.models import Crew
+from crews.serializers import CrewListSerializer
+from crews.views import get_top6_crews
+from promotions.serializers import PromotionArticleSerializer, PromotionSerializer
+from promotions.views import PromotionArticleViewSet, PromotionViewSet
+from races.serializers import RaceListSerializer
+from races.views import get_top6_races
+
+
+"""
+홈 화면 스냅샷
+
+- 배너, 아티클, 크루 top6, 대회 top6, 최신 게시글을 비회원 기준으로 한 번에 직렬화해 CACHES["response"] 에 저장
+- 키는 섹션이 의존하는 그룹 버전 + 사이트 주소 + 오늘 날짜
+    - 그룹 모델이 저장/삭제되면 버전이 바뀌어 다음 요청에서 다시 생성 (config/response_cache.py)
+    - 이미지 URL 이 절대 경로이고 D-day 가 날짜에 따라 바뀌므로 주소/날짜 포함
+- 로그인 유저는 스냅샷 복사본에 크루/대회 즐겨찾기 여부만 덮어씀 (쿼리 2번)
+"""
+
+SNAPSHOT_GROUPS = ("promotions", "promotion_articles", "crews", "races", "posts")
+LATEST_POST_COUNT = 5
+
+
+def get_latest_posts():
+    return (
+        Post.objects.select_related("author")
+        .with_comment_count()
+        .order_by("-created_at", "-id")[:LATEST_POST_COUNT]
+    )
+
+
+# 비회원 기준으로 모든 섹션 직렬화 (is_favorite 은 모두 False)
+def build_snapshot(request):
+    context = {"request": request, "viewer_state": ViewerState(AnonymousUser())}
+    return {
+        "promotions": PromotionSerializer(
+            PromotionViewSet.queryset.all(), many=True, context=context
+        ).data,
+        "promotion_articles": PromotionArticleSerializer(
+            PromotionArticleViewSet.queryset.all(), many=True, context=context
+        ).data,
+        "crews": CrewListSerializer(
+            get_top6_crews(Crew.objects.all()), many=True, context=context
+        ).data,
+        "races": RaceListSerializer(
+            get_top6_races(timezone.localdate()), many=True, context=context
+        ).data,
+        "posts": PostListSerializer(
+            get_latest_posts(), many=True, context=context
+        ).data,
+    }
+
+
+def get_snapshot_key(request):
+    source = ":".join(
+        [
+            get_version(SNAPSHOT_GROUPS),
+            request.build_absolute_uri("/"),
+            timezone.localdate().isoformat(),
+        ]
+    )
+    return f"{KEY_PREFIX}:home:{source}"
+
+
+# 캐시된 스냅샷 반환 (없으면 생성 후 저장), (스냅샷, 캐시 히트 여부)
+def get_snapshot(request):
+    cache = get_cache()
+    key = get_snapshot_key(request)
+    snapshot = cache.get(key)
+    if snapshot is not None:
+        record_stat("hit")
+        return snapshot, True
+
+    record_stat("miss")
+    snapshot = build_snapshot(request)
+    cache.set(key, snapshot, get_timeout())
+    return snapshot, False
+
+
+# 로그인 유저의 크루/대회 즐겨찾기 여부 덮어쓰기 (관계별 쿼리 1번)
+def overlay_viewer_state(snapshot, user):
+    viewer_state = ViewerState(user)
+    viewer_state.add_pks("crew", [crew["id"] for crew in snapshot["crews"]])
+    viewer_state.add_pks("race", [race["id"] for race in snapshot["races"]])
+    for crew in snapshot["crews"]:
+        crew["is_favorite"] = viewer_state.get("crew_favorite", crew["id"])
+    for race in snapshot["races"]:
+        race["is_favorite"] = viewer_state.get("race_favorite", race["id"])
+    return snapshot
@@ -0,0 +1,206 @@
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+from accounts.models import CustomUser, LevelStep
+from boards.models import Post
+from config.query_budget import QueryBudgetTestMixin
+from crews.models import Crew, CrewFavorite
+from promotions.models import Promotion
+from races.models import Race, RaceFavorite
+
+
+class HomeTestCase(QueryBudgetTestMixin, TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.level = LevelStep.objects.create(
+            number=1, title="Level 1", min_distance=0, max_distance=100
+        )
+        self.user = CustomUser.objects.create_user(
+            username="test1",
+            email="test1@test.com",
+            password="test1234!",
+            nickname="러너1",
+            level=self.level,
+        )
+        today = timezone.localdate()
+        Promotion.objects.create(title="배너1", link_path="crew/1")
+        self.crew = Crew.objects.create(
+            name="크루1", location_city="seoul", is_opened=True, owner=self.user
+        )
+        self.race = Race.objects.create(
+            title="대회1",
+            organizer="주최자1",
+            description="대회1 설명",
+            start_date=today + timedelta(days=30),
+            end_date=today + timedelta(days=31),
+            reg_start_date=today - timedelta(days=1),
+            reg_end_date=today + timedelta(days=10),
+            author=self.user,
+            location="대회1 장소",
+            fees=5000,
+            register_url="http://test.com",
+            courses=["full"],
+        )
+        Post.objects.create(
+            author=self.user,
+            title="게시글1",
+            contents="내용",
+            post_classification="general",
+            category="general",
+        )
+
+    # 홈 화면 스냅샷 테스트
+    def test_home_snapshot(self):
+        print("[홈 화면 GET 테스트]")
+        print(">> 비회원 스냅샷을 캐시하고, 게시글이 바뀌면 다시 만든다.")
+        response = self.client.get("/home/")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(len(response.data["promotions"]), 1)
+        self.assertEqual(response.data["crews"][0]["id"], self.crew.id)
+        self.assertEqual(response.data["races"][0]["id"], self.race.id)
+        self.assertEqual(response.data["posts"][0]["title"], "게시글1")
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/home/")
+        self.assertEqual(response["X-Cache"], "HIT")
+
+        Post.objects.create(
+            author=self.user,
+            title="게시글2",
+            contents="내용",
+            post_classification="general",
+            category="general",
+        )
+        response = self.client.get("/home/")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["posts"][0]["title"], "게시글2")
+
+        # 닉네임이 바뀌면 다시 만들고, 다른 필드만 바뀌면 그대로 사용
+        user = CustomUser.objects.get(pk=self.user.pk)
+        user.location_district = "강남구"
+        user.save()
+        self.assertEqual(self.client.get("/home/")["X-Cache"], "HIT")
+        user.nickname = "러너1-새이름"
+        user.save()
+        response = self.client.get("/home/")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["posts"][0]["author_nickname"], "러너1-새이름")
+        print(
+            "------------------------------------------------------------------------완료 "
+        )
+
+    # 로그인 유저는 즐겨찾기 여부만 덮어씀
+    def test_home_viewer_overlay(self):
+        print("[홈 화면 로그인 유저 GET 테스트]")
+        self.client.get("/home/")
+        CrewFavorite.objects.create(user=self.user, crew=self.crew)
+        RaceFavorite.objects.create(user=self.user, race=self.race)
+        self.client.get("/home/")
+
+        self.client.force_authenticate(user=self.user)
+        with self.assertNumQueries(2):
+            response = self.client.get("/home/")
+        self.assertTrue(response.data["crews"][0]["is_favorite"])
+        self.assertTrue(response.data["races"][0]["is_favorite"])
+
+        # 다른 요청의 스냅샷에는 영향 없음
+        self.client.force_authenticate(user=None)
+        response = self.client.get("/home/")
+        self.assertFalse(response.data["crews"][0]["is_favorite"])
+        print(
+            "------------------------------------------------------------------------완료 "
+        )
+
+    # 쿼리 예산 (config/query_budget.py)
+    def test_home_query_budget(self):
+        for user in [None, self.user]:
+            self.client.force_authenticate(user=user)
+            self.assertQueryBudget("/home/", self.seed)
+
+    # 크루/대회/게시글을 n개씩 추가 (즐겨찾기 포함)
+    def seed(self, n):
+        for _ in range(n):
+            crew = Crew.objects.create(
+                name="크루", location_city="seoul", is_opened=True, owner=self.user
+            )
+            CrewFavorite.objects.create(user=self.user, crew=crew)
+            Post.objects.create(
+                author=self.user,
+                title="게시글",
+                contents="내용",
+                post_classification="general",
+                category="general",
+            )
+
+
+# 업로드 파일 서빙 (config/media.py)
+class MediaServingTestCase(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        cache.clear()
+
+        self.content = bytes(range(256)) * 4
+        os.makedirs(os.path.join(media_root, "crews"))
+        with open(os.path.join(media_root, "crews", "photo.jpg"), "wb") as file:
+            file.write(self.content)
+        self.path = "/media/crews/photo.jpg"
+
+    def test_etag_and_conditional_get(self):
+        response = self.client.get(self.path)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), self.content)
+        self.assertEqual(response["Content-Type"], "image/jpeg")
+        self.assertEqual(response["Content-Length"], "1024")
+        self.assertEqual(response["Cache-Control"], "public, max-age=86400")
+        etag = response["ETag"]
+        self.assertRegex(etag, r'^"[0-9a-f]{32}"$')
+
+        response = self.client.get(self.path, HTTP_IF_NONE_MATCH=f'W/{etag}, "other"')
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        response = self.client.get(self.path, HTTP_IF_NONE_MATCH='"other"')
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(self.client.get("/media/crews/none.jpg").status_code, 404)
+        self.assertEqual(self.client.get("/media/../manage.py").status_code, 404)
+
+    def test_range(self):
+        response = self.client.get(self.path, HTTP_RANGE="bytes=10-19")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), self.content[10:20])
+        self.assertEqual(response["Content-Range"], "bytes 10-19/1024")
+        self.assertEqual(response["Content-Length"], "10")
+
+        response = self.client.get(self.path, HTTP_RANGE="bytes=-100")
+        self.assertEqual(b"".join(response.streaming_content), self.content[-100:])
+        response = self.client.get(self.path, HTTP_RANGE="bytes=1000-")
+        self.assertEqual(response["Content-Range"], "bytes 1000-1023/1024")
+
+        response = self.client.get(self.path, HTTP_RANGE="bytes=2000-")
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */1024")
+
+        # 여러 구간, 바뀐 파일의 If-Range 는 전체 응답
+        response = self.client.get(self.path, HTTP_RANGE="bytes=0-1,5-6")
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(
+            self.path, HTTP_RANGE="bytes=0-1", HTTP_IF_RANGE='"old"'
+        )
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(MEDIA_ACCEL="x-accel-redirect")
+    def test_accel_redirect(self):
+        response = self.client.get(self.path)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Accel-Redirect"], "/protected-media/crews/photo.jpg")
+        self.assertEqual(response.content, b"")
+        self.assertIn("ETag", response)
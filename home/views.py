@@ -0,0 +1,16 @@
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from config.query_budget import query_budget
+from .snapshot import get_snapshot, overlay_viewer_state
+
+
+# 홈 화면 /home/ (배너, 아티클, 크루 top6, 대회 top6, 최신 게시글을 한 번에 반환)
+@api_view(["GET"])
+@query_budget(7)
+def home(request):
+    snapshot, is_hit = get_snapshot(request)
+    if request.user.is_authenticated:
+        return Response(overlay_viewer_state(snapshot, request.user))
+    response = Response(snapshot)
+    response["X-Cache"] = "HIT" if is_hit else "MISS"
+    return response
@@ -0,0 +1,397 @@
+import json
+import math
+import time
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from accounts.authentication import ClaimsTokenObtainPairSerializer
+from accounts.models import CustomUser
+from boards.models import Post
+from boards.view_counter import view_count_buffer
+from config.response_cache import get_cache
+from crews.models import Crew
+from promotions.models import Promotion, PromotionArticle
+from races.models import Race
+
+
+"""
+엔드포인트 벤치마크 커맨드
+
+- 공개 API 는 비회원, 마이페이지 등은 활동이 가장 많은 유저로 force_authenticate 해서 테스트 클라이언트로 요청
+    - JWT 발급/검증 비용은 제외
+    - {race}, {crew}, {post} 같은 경로 파라미터는 현재 DB 에서 고른 id 로 채우고, 대상이 없으면 건너뜀
+- 엔드포인트마다 --iterations 번 요청해 p50/p95/p99 지연(ms), 쿼리 수, 응답 크기(byte) 기록
+    - 기본은 요청마다 응답 캐시를 비운 콜드 측정, --warm 이면 캐시 유지
+- --output 으로 결과를 JSON 저장 (키는 "anon GET /races/{race}/" 형태라 데이터셋이 달라도 커밋 간 diff 가능)
+- --compare 로 이전 JSON 과 p95/쿼리 수 비교
+- --asgi 면 비동기 뷰를 AsyncClient(ASGI 핸들러)로 요청해 같은 데이터의 WSGI 경로와 p95/p99 비교
+    - WSGI 경로는 같은 데이터를 받는 동기 뷰 요청들을 차례로 보낸 전체 시간이 한 표본 ("wsgi GET ...")
+        - 백분위수는 더할 수 없으므로 엔드포인트별 p95 의 합이 아니라 합계 시간들의 p95
+    - 로그인 요청은 JWT 헤더로 인증, 섹션 스레드의 쿼리는 집계되지 않으므로 쿼리 수는 null
+- 기록 업로드 처리량: 활동이 가장 많은 유저로 --records 개 기록을 일괄 API 1번 / 단건 API N번으로 추가 (0 이면 생략)
+    - 요청마다 트랜잭션을 롤백하므로 데이터는 바뀌지 않음, records_per_second 는 p50 기준
+- 사용법: python manage.py benchmark [--iterations 20] [--output after.json] [--compare before.json]
+    - 데이터는 python manage.py seed_dataset 으로 준비
+"""
+
+ANONYMOUS_ENDPOINTS = [
+    "/home/",
+    "/races/",
+    "/races/?cursor=",
+    "/races/top6/",
+    "/races/{race}/",
+    "/races/{race}/reviews/",
+    "/crews/",
+    "/crews/top6/",
+    "/crews/{crew}/",
+    "/crews/{crew}/reviews/",
+    "/boards/",
+    "/boards/?cursor=",
+    "/boards/?category=training",
+    "/boards/{post}/",
+    "/boards/{post}/comments/",
+    "/boards/search?q=러닝",
+    "/boards/category",
+    "/promotions/",
+    "/promotions/post/",
+    "/search/suggest?q=한강",
+    "/accounts/profile/{user}/",
+    "/accounts/leaderboard/",
+]
+
+AUTHENTICATED_ENDPOINTS = [
+    "/home/",
+    "/accounts/mypage/info/",
+    "/accounts/mypage/record/",
+    "/accounts/mypage/crew/",
+    "/accounts/mypage/race/",
+    "/accounts/mypage/favorites/",
+    "/accounts/profile/{user}/",
+    "/accounts/leaderboard/?scope=city",
+    "/boards/likes?ids={post_ids}",
+]
+
+# 비동기 엔드포인트: 같은 데이터를 내려주는 WSGI 요청들
+ASGI_ENDPOINTS = {
+    ("asgi", "/accounts/async/profile/{user}/"): ["anon GET /accounts/profile/{user}/"],
+    ("asgi-auth", "/accounts/async/mypage/favorites/"): [
+        "auth GET /accounts/mypage/favorites/"
+    ],
+    ("asgi", "/races/async/{race}/"): [
+        "anon GET /races/{race}/",
+        "anon GET /races/{race}/reviews/",
+    ],
+    ("asgi", "/crews/async/{crew}/"): [
+        "anon GET /crews/{crew}/",
+        "anon GET /crews/{crew}/reviews/",
+    ],
+}
+
+RECORD_PATH = "/accounts/mypage/record/"
+BULK_RECORD_PATH = "/accounts/mypage/record/bulk/"
+
+PERCENTILES = (50, 95, 99)
+
+
+# nearest-rank 백분위수
+def percentile(sorted_values, percent):
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+# 경로 파라미터로 쓸 id 고르기 (가장 활동이 많은 대상)
+def get_path_parameters():
+    user = (
+        CustomUser.objects.annotate(activity=Count("posts"))
+        .order_by("-activity", "pk")
+        .first()
+    )
+    race = Race.objects.annotate(review_count=Count("reviews")).order_by(
+        "-review_count", "pk"
+    )
+    crew = Crew.objects.order_by("-member_count", "pk")
+    post = Post.objects.order_by("-like_count", "pk")
+    post_ids = list(Post.objects.order_by("-id").values_list("pk", flat=True)[:20])
+    parameters = {
+        "user": user.pk if user else None,
+        "race": race.values_list("pk", flat=True).first(),
+        "crew": crew.values_list("pk", flat=True).first(),
+        "post": post.values_list("pk", flat=True).first(),
+        "post_ids": ",".join(map(str, post_ids)) or None,
+    }
+    return parameters, user
+
+
+def fill_path(template, parameters):
+    try:
+        return template.format(**parameters)
+    except KeyError:
+        return None
+
+
+def summarize(timings, response, queries):
+    timings = sorted(timings)
+    result = {
+        f"p{percent}_ms": round(percentile(timings, percent), 2)
+        for percent in PERCENTILES
+    }
+    result.update(
+        {
+            "status": response.status_code,
+            "queries": queries,
+            "bytes": len(response.content),
+        }
+    )
+    return result
+
+
+class Command(BaseCommand):
+    help = "주요 엔드포인트의 지연 시간 백분위수, 쿼리 수, 응답 크기를 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations", type=int, default=20, help="엔드포인트별 요청 횟수"
+        )
+        parser.add_argument(
+            "--warm", action="store_true", help="응답 캐시를 비우지 않음"
+        )
+        parser.add_argument(
+            "--asgi", action="store_true", help="비동기 뷰를 ASGI 로 요청해 비교"
+        )
+        parser.add_argument(
+            "--records", type=int, default=100, help="업로드 처리량 측정 기록 수 (0 이면 생략)"
+        )
+        parser.add_argument("--output", help="결과 JSON 파일 경로")
+        parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일 경로")
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1:
+            raise CommandError("--iterations 는 1 이상이어야 합니다.")
+        self.iterations = options["iterations"]
+        self.warm = options["warm"]
+
+        parameters, user = get_path_parameters()
+        # 값이 없는 파라미터는 format 에서 KeyError 가 나도록 제외
+        parameters = {key: value for key, value in parameters.items() if value}
+
+        anonymous_client = APIClient()
+        authenticated_client = APIClient()
+        if user is not None:
+            authenticated_client.force_authenticate(user=user)
+
+        results = {}
+        for label, client, templates in (
+            ("anon", anonymous_client, ANONYMOUS_ENDPOINTS),
+            ("auth", authenticated_client, AUTHENTICATED_ENDPOINTS),
+        ):
+            if label == "auth" and user is None:
+                continue
+            for template in templates:
+                path = fill_path(template, parameters)
+                if path is None:
+                    self.stdout.write(f"건너뜀: {template} (대상 없음)")
+                    continue
+                results[f"{label} GET {template}"] = self.measure(client, path)
+        if options["records"] > 0 and user is not None:
+            results.update(
+                self.measure_record_upload(authenticated_client, options["records"])
+            )
+        if options["asgi"]:
+            results.update(self.measure_asgi(parameters, user))
+        # 게시글 상세 요청으로 쌓인 조회수 반영
+        view_count_buffer.flush()
+
+        report = {
+            "meta": {
+                "iterations": self.iterations,
+                "warm": self.warm,
+                "records": options["records"],
+                "counts": {
+                    "users": CustomUser.objects.count(),
+                    "crews": Crew.objects.count(),
+                    "races": Race.objects.count(),
+                    "posts": Post.objects.count(),
+                    "promotions": Promotion.objects.count(),
+                    "promotion_articles": PromotionArticle.objects.count(),
+                },
+            },
+            "results": results,
+        }
+        self.print_report(results)
+        self.print_throughput(results)
+        if options["asgi"]:
+            self.print_asgi_comparison(results)
+
+        if options["compare"]:
+            with open(options["compare"], encoding="utf-8") as file:
+                self.print_comparison(json.load(file)["results"], results)
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as file:
+                json.dump(report, file, ensure_ascii=False, indent=2, sort_keys=True)
+                file.write("\n")
+            self.stdout.write(self.style.SUCCESS(f"결과 저장: {options['output']}"))
+
+    def measure(self, client, path):
+        timings = []
+        for _ in range(self.iterations):
+            if not self.warm:
+                get_cache().clear()
+            with CaptureQueriesContext(connection) as context:
+                started = time.perf_counter()
+                response = client.get(path)
+                timings.append((time.perf_counter() - started) * 1000)
+        return summarize(timings, response, len(context.captured_queries))
+
+    # 기록 count 개를 일괄 API 1번 / 단건 API count 번으로 추가 (측정 후 롤백)
+    def measure_record_upload(self, client, count):
+        items = [
+            {"description": f"benchmark run {number}", "distance": 5000}
+            for number in range(count)
+        ]
+
+        def upload_bulk():
+            return [client.post(BULK_RECORD_PATH, items, format="json")]
+
+        def upload_each():
+            return [client.post(RECORD_PATH, item, format="json") for item in items]
+
+        results = {}
+        for name, upload in (
+            (f"auth POST {BULK_RECORD_PATH}", upload_bulk),
+            (f"auth POST {RECORD_PATH} (each)", upload_each),
+        ):
+            timings = []
+            for _ in range(self.iterations):
+                with transaction.atomic():
+                    with CaptureQueriesContext(connection) as context:
+                        started = time.perf_counter()
+                        responses = upload()
+                        timings.append((time.perf_counter() - started) * 1000)
+                    transaction.set_rollback(True)
+            result = summarize(timings, responses[-1], len(context.captured_queries))
+            seconds = max(result["p50_ms"], 0.01) / 1000
+            result["records_per_second"] = round(count / seconds, 1)
+            results[name] = result
+        return results
+
+    def measure_asgi(self, parameters, user):
+        headers = {}
+        if user is not None:
+            token = ClaimsTokenObtainPairSerializer.get_token(user).access_token
+            headers["authorization"] = f"Bearer {token}"
+
+        clients = {"anon": APIClient(), "auth": APIClient()}
+        if user is not None:
+            clients["auth"].force_authenticate(user=user)
+
+        results = {}
+        for (label, template), wsgi_names in ASGI_ENDPOINTS.items():
+            path = fill_path(template, parameters)
+            requests = []
+            for name in wsgi_names:
+                wsgi_label, wsgi_template = name.split(" GET ", 1)
+                requests.append(
+                    (clients[wsgi_label], fill_path(wsgi_template, parameters))
+                )
+            if (
+                path is None
+                or (label == "asgi-auth" and not headers)
+                or any(wsgi_path is None for _, wsgi_path in requests)
+            ):
+                self.stdout.write(f"건너뜀: {template} (대상 없음)")
+                continue
+            extra = headers if label == "asgi-auth" else {}
+            results[f"{label} GET {template}"] = async_to_sync(self.measure_async)(
+                path, extra
+            )
+            results[f"wsgi GET {template}"] = self.measure_sequence(requests)
+        return results
+
+    # 요청들을 차례로 보낸 전체 시간을 한 표본으로 측정
+    def measure_sequence(self, requests):
+        timings = []
+        for _ in range(self.iterations):
+            if not self.warm:
+                get_cache().clear()
+            with CaptureQueriesContext(connection) as context:
+                started = time.perf_counter()
+                for client, path in requests:
+                    response = client.get(path)
+                timings.append((time.perf_counter() - started) * 1000)
+        return summarize(timings, response, len(context.captured_queries))
+
+    async def measure_async(self, path, headers):
+        client = AsyncClient()
+        timings = []
+        for _ in range(self.iterations):
+            if not self.warm:
+                get_cache().clear()
+            started = time.perf_counter()
+            response = await client.get(path, **headers)
+            timings.append((time.perf_counter() - started) * 1000)
+        return summarize(timings, response, None)
+
+    # 비동기 엔드포인트 vs 같은 데이터를 받는 WSGI 요청들을 차례로 보낸 시간
+    def print_asgi_comparison(self, results):
+        self.stdout.write("\nASGI 대비 WSGI (p95 / p99 ms)")
+        for label, template in ASGI_ENDPOINTS:
+            asgi = results.get(f"{label} GET {template}")
+            wsgi = results.get(f"wsgi GET {template}")
+            if asgi is None or wsgi is None:
+                continue
+            self.stdout.write(
+                f"{asgi['p95_ms']:>8.2f} / {wsgi['p95_ms']:<8.2f}"
+                f" {asgi['p99_ms']:>8.2f} / {wsgi['p99_ms']:<8.2f}  {template}"
+            )
+
+    def print_throughput(self, results):
+        lines = [
+            f"{result['records_per_second']:>10.1f}  {name}"
+            for name, result in results.items()
+            if "records_per_second" in result
+        ]
+        if lines:
+            self.stdout.write("\n기록 업로드 처리량 (records/s, p50)")
+            self.stdout.write("\n".join(lines))
+
+    def print_report(self, results):
+        self.stdout.write(
+            f"{'p50':>8} {'p95':>8} {'p99':>8} {'queries':>7} {'bytes':>9}  endpoint"
+        )
+        for name, result in results.items():
+            line = (
+                f"{result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f}"
+                f" {result['queries'] if result['queries'] is not None else '-':>7}"
+                f" {result['bytes']:>9}  {name}"
+            )
+            if result["status"] >= 400:
+                line = self.style.ERROR(f"{line} ({result['status']})")
+            self.stdout.write(line)
+
+    def print_comparison(self, previous, results):
+        self.stdout.write("\n이전 결과 대비 (p95 ms / 쿼리 수)")
+        for name, result in results.items():
+            before = previous.get(name)
+            if before is None:
+                self.stdout.write(f"{'신규':>18}  {name}")
+                continue
+            delta = result["p95_ms"] - before["p95_ms"]
+            ratio = delta / before["p95_ms"] * 100 if before["p95_ms"] else 0
+            queries = [
+                "-" if count is None else count
+                for count in (before["queries"], result["queries"])
+            ]
+            line = (
+                f"{delta:>+9.2f} ({ratio:>+6.1f}%)"
+                f" {queries[0]:>3} -> {queries[1]:<3} {name}"
+            )
+            if None not in (before["queries"], result["queries"]) and (
+                result["queries"] > before["queries"]
+            ):
+                line = self.style.WARNING(line)
+            self.stdout.write(line)
@@ -0,0 +1,62 @@
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand
+from config.images import IMAGE_FIELDS, ImageTooLarge, build_variants, has_variants
+from config.response_cache import invalidate
+
+
+"""
+이미지 변형 일괄 생성 커맨드
+
+- build_variants_on_save 로 연결된 모든 이미지 필드(config/images.py)의 변형을 생성
+    - 기본은 변형이 없는 이미지만, --force 면 전부 다시 생성
+    - --threads 개 스레드로 병렬 생성
+- 끝나면 관련 응답 캐시 그룹 무효화
+- 사용법: python manage.py build_image_variants [--force] [--threads 4]
+"""
+
+
+class Command(BaseCommand):
+    help = "업로드된 이미지의 폭별 WebP/JPEG 변형을 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="이미 있는 변형도 다시 생성")
+        parser.add_argument("--threads", type=int, default=4, help="생성 스레드 수")
+
+    def handle(self, *args, **options):
+        built, skipped, failed = 0, 0, 0
+        groups = set()
+        with ThreadPoolExecutor(max_workers=max(options["threads"], 1)) as executor:
+            for model, field_name, field_groups in IMAGE_FIELDS:
+                field = model._meta.get_field(field_name)
+                names = (
+                    model.objects.exclude(**{f"{field_name}__isnull": True})
+                    .exclude(**{field_name: ""})
+                    .values_list(field_name, flat=True)
+                    .distinct()
+                )
+                jobs = []
+                for name in names.iterator():
+                    field_file = field.attr_class(None, field, name)
+                    if not options["force"] and has_variants(field_file):
+                        skipped += 1
+                        continue
+                    jobs.append(
+                        (name, executor.submit(build_variants, field.storage, name))
+                    )
+                for name, job in jobs:
+                    try:
+                        job.result()
+                        built += 1
+                    except (ImageTooLarge, OSError, ValueError) as error:
+                        failed += 1
+                        self.stderr.write(f"{name}: {error}")
+                if jobs:
+                    groups.update(field_groups)
+
+        if groups:
+            invalidate(*sorted(groups))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"변형 생성 {built}개, 건너뜀 {skipped}개, 실패 {failed}개"
+            )
+        )
@@ -0,0 +1,85 @@
+import re
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, get_resolver
+from rest_framework.test import APIClient
+from accounts.models import CustomUser
+from config.query_budget import get_budget, resolve_view_name
+from config.response_cache import get_cache
+
+
+"""
+라우트별 SQL 쿼리 수 리포트 커맨드
+
+- config/urls.py 의 모든 GET 라우트를 현재 DB 로 요청해 쿼리 수와 선언된 예산(config/query_budget.py)을 출력
+    - 경로 파라미터는 --pk 값(기본 1)으로 채움
+    - 응답 캐시를 비운 뒤 요청하고, 요청마다 트랜잭션을 롤백
+- 사용법: python manage.py query_report [--user 1] [--pk 1]
+"""
+
+SKIPPED_PREFIXES = ("admin/", "api/schema/", "media/")
+PARAMETER_PATTERN = re.compile(r"<[^>]+>|\(\?P<\w+>[^)]*\)")
+
+
+def iter_routes(patterns, prefix=""):
+    for pattern in patterns:
+        route = prefix + str(pattern.pattern).lstrip("^").rstrip("$")
+        if isinstance(pattern, URLResolver):
+            yield from iter_routes(pattern.url_patterns, route)
+        else:
+            yield route
+
+
+def get_sample_path(route, pk):
+    if route.startswith(SKIPPED_PREFIXES) or "format" in route:
+        return None
+    return "/" + PARAMETER_PATTERN.sub(str(pk), route).replace("\\", "")
+
+
+class Command(BaseCommand):
+    help = "모든 GET 라우트의 현재 SQL 쿼리 수와 쿼리 예산을 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, help="이 유저로 인증해 요청")
+        parser.add_argument("--pk", type=int, default=1, help="경로 파라미터 값")
+
+    def handle(self, *args, **options):
+        client = APIClient()
+        if options["user"]:
+            client.force_authenticate(user=CustomUser.objects.get(pk=options["user"]))
+
+        paths = []
+        for route in iter_routes(get_resolver().url_patterns):
+            path = get_sample_path(route, options["pk"])
+            if path and path not in paths:
+                paths.append(path)
+
+        over_budget = 0
+        for path in paths:
+            view_name = resolve_view_name(path, "get")
+            if view_name is None:
+                continue
+            status_code, count = self.measure(client, path)
+            budget = get_budget(path, "get")
+            line = (
+                f"{status_code:>3}  {count:>3} / {budget if budget is not None else '-':>3}"
+                f"  GET {path}  ({view_name})"
+            )
+            if budget is not None and count > budget:
+                over_budget += 1
+                self.stdout.write(self.style.ERROR(line))
+            else:
+                self.stdout.write(line)
+
+        summary = f"{len(paths)}개 라우트 중 예산 초과 {over_budget}개"
+        style = self.style.ERROR if over_budget else self.style.SUCCESS
+        self.stdout.write(style(summary))
+
+    def measure(self, client, path):
+        get_cache().clear()
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(path)
+            transaction.set_rollback(True)
+        return response.status_code, len(context.captured_queries)
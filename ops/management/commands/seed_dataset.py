@@ -0,0 +1,308 @@
+import random
+from datetime import timedelta
+from itertools import islice
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from accounts.models import CustomUser, JoinedCrew, JoinedRace, Record
+from boards import search
+from boards.models import Comment, Like, Post
+from config.constants import (
+    CATEGORY_CHOICES,
+    COURSE_CHOICES,
+    LOCATION_CITY_CHOICES,
+    MEET_DAY_CHOICES,
+    TIME_CHOICES,
+)
+from config.response_cache import get_cache
+from crews.models import Crew, CrewFavorite, CrewReview
+from races.models import Race, RaceFavorite, RaceReview
+
+
+"""
+대용량 가상 데이터 생성 커맨드
+
+- 운영 규모(유저 10만, 크루 1만, 대회 5천, 기록 200만, 게시글 50만)에 --scale 을 곱한 만큼 생성
+    - 모델별 개수는 --users, --crews, --races, --records, --posts 로 직접 지정 가능
+    - 가입/즐겨찾기/리뷰, 좋아요/댓글은 유저·게시글 수에 비례해 생성
+- bulk_create 로 배치 삽입하므로 save()/시그널이 실행되지 않음
+    - 끝난 뒤 sync_* 커맨드로 비정규화 컬럼(멤버/즐겨찾기/좋아요 수, 누적 거리/레벨, 대회 필터), 리더보드 합계와 검색 색인을 재계산
+    - 응답 캐시도 비움
+- 모든 유저의 비밀번호는 BENCHMARK_PASSWORD, --seed 가 같으면 같은 데이터 생성
+- 사용법: python manage.py seed_dataset --scale 0.01 [--seed 0]
+"""
+
+DEFAULT_COUNTS = {
+    "users": 100_000,
+    "crews": 10_000,
+    "races": 5_000,
+    "records": 2_000_000,
+    "posts": 500_000,
+}
+BENCHMARK_PASSWORD = "dalim1234!"
+BATCH_SIZE = 2000
+
+NICKNAME_WORDS = ["새벽", "한강", "달리는", "느린", "바람", "주말", "퇴근길", "산책"]
+CREW_WORDS = ["한강", "남산", "올림픽공원", "서울숲", "광안리", "해운대", "호수공원"]
+POST_TOPICS = ["러닝화 추천", "하프 완주 후기", "인터벌 훈련", "부상 회복", "코스 추천"]
+DISTRICTS = ["강남구", "마포구", "송파구", "수원시", "해운대구", "중구"]
+CREW_STATUS_WEIGHTS = {"member": 70, "keeping": 15, "not_member": 5, "quit": 10}
+
+
+def iter_batches(objects, size):
+    iterator = iter(objects)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class Command(BaseCommand):
+    help = "벤치마크용 대용량 가상 데이터를 bulk insert 로 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale", type=float, default=1.0, help="기본 개수에 곱할 비율"
+        )
+        for name, count in DEFAULT_COUNTS.items():
+            parser.add_argument(
+                f"--{name}", type=int, help=f"생성할 개수 (기본 {count:,} x scale)"
+            )
+        parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        self.random = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.today = timezone.localdate()
+        counts = {
+            name: (
+                options[name]
+                if options[name] is not None
+                else max(int(count * options["scale"]), 1)
+            )
+            for name, count in DEFAULT_COUNTS.items()
+        }
+
+        user_ids = self.create_users(counts["users"])
+        owner_ids = user_ids[::10]  # 10명 중 1명은 크루장
+        crew_ids = self.create_crews(counts["crews"], owner_ids)
+        race_ids = self.create_races(counts["races"], owner_ids)
+        self.create_crew_activity(user_ids, crew_ids)
+        self.create_race_activity(user_ids, race_ids)
+        self.insert(Record, self.generate_records(counts["records"], user_ids))
+        post_ids = self.create_posts(counts["posts"], user_ids)
+        self.insert(Like, self.generate_likes(post_ids, user_ids))
+        self.insert(Comment, self.generate_comments(post_ids, user_ids))
+
+        self.sync()
+        self.stdout.write(self.style.SUCCESS("가상 데이터 생성을 마쳤습니다."))
+
+    # 배치 단위로 삽입하고 새로 생긴 pk 목록 반환
+    def insert(self, model, objects, return_pks=False):
+        last_pk = model.objects.aggregate(last=Max("pk"))["last"] or 0
+        total = 0
+        with transaction.atomic():
+            for batch in iter_batches(objects, self.batch_size):
+                model.objects.bulk_create(batch)
+                total += len(batch)
+        self.stdout.write(f"{model.__name__}: {total:,}개")
+        if return_pks:
+            return list(
+                model.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)
+            )
+
+    def create_users(self, count):
+        start = (CustomUser.objects.aggregate(last=Max("pk"))["last"] or 0) + 1
+        password = make_password(BENCHMARK_PASSWORD)
+        cities = [city for city, _ in LOCATION_CITY_CHOICES]
+
+        def generate():
+            for number in range(start, start + count):
+                yield CustomUser(
+                    email=f"bench{number}@dalim.test",
+                    username=f"러너{number}",
+                    nickname=f"{self.random.choice(NICKNAME_WORDS)}러너{number}",
+                    password=password,
+                    user_type="crew" if number % 10 == 0 else "normal",
+                    location_city=self.random.choice(cities),
+                    location_district=self.random.choice(DISTRICTS),
+                )
+
+        return self.insert(CustomUser, generate(), return_pks=True)
+
+    def create_crews(self, count, owner_ids):
+        days = [day for day, _ in MEET_DAY_CHOICES]
+        times = [time for time, _ in TIME_CHOICES]
+        cities = [city for city, _ in LOCATION_CITY_CHOICES]
+
+        def generate():
+            for number in range(count):
+                crew = Crew(
+                    owner_id=self.random.choice(owner_ids),
+                    name=f"{self.random.choice(CREW_WORDS)} 러닝 크루 {number}",
+                    location_city=self.random.choice(cities),
+                    location_district=self.random.choice(DISTRICTS),
+                    meet_days=self.random.sample(days, self.random.randint(1, 3)),
+                    meet_time=self.random.choice(times),
+                    description="함께 달릴 크루원을 모집합니다.",
+                    is_opened=self.random.random() < 0.8,
+                )
+                crew.set_schedule_masks()
+                yield crew
+
+        return self.insert(Crew, generate(), return_pks=True)
+
+    def create_races(self, count, owner_ids):
+        courses = [course for course, _ in COURSE_CHOICES]
+        cities = [label for _, label in LOCATION_CITY_CHOICES]
+
+        def generate():
+            for number in range(count):
+                start_date = self.today + timedelta(days=self.random.randint(-180, 180))
+                reg_start_date = start_date - timedelta(
+                    days=self.random.randint(30, 90)
+                )
+                city = self.random.choice(cities)
+                yield Race(
+                    title=f"제{number}회 {city} 마라톤",
+                    organizer=f"{city} 육상연맹",
+                    description="도심을 달리는 마라톤 대회입니다.",
+                    start_date=start_date,
+                    end_date=start_date + timedelta(days=1),
+                    reg_start_date=reg_start_date,
+                    reg_end_date=reg_start_date
+                    + timedelta(days=self.random.randint(7, 25)),
+                    courses=self.random.sample(courses, self.random.randint(1, 3)),
+                    author_id=self.random.choice(owner_ids),
+                    location=f"{city} {self.random.choice(DISTRICTS)}",
+                    fees=self.random.choice([0, 10000, 30000, 50000]),
+                    register_url="https://example.com/register",
+                )
+
+        return self.insert(Race, generate(), return_pks=True)
+
+    # 유저별 크루 가입 0~2개, 즐겨찾기 0~3개, 가입 크루 리뷰
+    def create_crew_activity(self, user_ids, crew_ids):
+        statuses = list(CREW_STATUS_WEIGHTS)
+        weights = list(CREW_STATUS_WEIGHTS.values())
+        joined = []
+
+        def generate_members():
+            for user_id in user_ids:
+                for crew_id in self.random.sample(
+                    crew_ids, min(self.random.randint(0, 2), len(crew_ids))
+                ):
+                    status = self.random.choices(statuses, weights)[0]
+                    if status in ("member", "quit"):
+                        joined.append((user_id, crew_id))
+                    yield JoinedCrew(user_id=user_id, crew_id=crew_id, status=status)
+
+        def generate_favorites():
+            for user_id in user_ids:
+                for crew_id in self.random.sample(
+                    crew_ids, min(self.random.randint(0, 3), len(crew_ids))
+                ):
+                    yield CrewFavorite(user_id=user_id, crew_id=crew_id)
+
+        def generate_reviews():
+            for user_id, crew_id in joined:
+                if self.random.random() < 0.3:
+                    yield CrewReview(
+                        author_id=user_id, crew_id=crew_id, contents="좋은 크루입니다."
+                    )
+
+        self.insert(JoinedCrew, generate_members())
+        self.insert(CrewFavorite, generate_favorites())
+        self.insert(CrewReview, generate_reviews())
+
+    # 유저별 대회 참가 0~2개, 즐겨찾기 0~3개, 참가 대회 리뷰
+    def create_race_activity(self, user_ids, race_ids):
+        joined = []
+
+        def generate_joined():
+            for user_id in user_ids:
+                for race_id in self.random.sample(
+                    race_ids, min(self.random.randint(0, 2), len(race_ids))
+                ):
+                    joined.append((user_id, race_id))
+                    yield JoinedRace(user_id=user_id, race_id=race_id)
+
+        def generate_favorites():
+            for user_id in user_ids:
+                for race_id in self.random.sample(
+                    race_ids, min(self.random.randint(0, 3), len(race_ids))
+                ):
+                    yield RaceFavorite(user_id=user_id, race_id=race_id)
+
+        def generate_reviews():
+            for user_id, race_id in joined:
+                if self.random.random() < 0.2:
+                    yield RaceReview(
+                        author_id=user_id, race_id=race_id, contents="코스가 좋았어요."
+                    )
+
+        self.insert(JoinedRace, generate_joined())
+        self.insert(RaceFavorite, generate_favorites())
+        self.insert(RaceReview, generate_reviews())
+
+    # 최근 90일 안에 고르게 분포 (주간/월간 리더보드용)
+    def generate_records(self, count, user_ids):
+        now = timezone.now()
+        for _ in range(count):
+            yield Record(
+                user_id=self.random.choice(user_ids),
+                description="오늘의 러닝",
+                distance=self.random.randint(1000, 21000),
+                started_at=now
+                - timedelta(minutes=self.random.randint(0, 90 * 24 * 60)),
+            )
+
+    def create_posts(self, count, user_ids):
+        categories = [category for category, _ in CATEGORY_CHOICES]
+
+        def generate():
+            for number in range(count):
+                topic = self.random.choice(POST_TOPICS)
+                yield Post(
+                    author_id=self.random.choice(user_ids),
+                    title=f"{topic} {number}",
+                    contents=f"{topic}에 대한 이야기입니다. " * 5,
+                    post_classification="general",
+                    category=self.random.choice(categories),
+                    view_count=self.random.randint(0, 500),
+                )
+
+        return self.insert(Post, generate(), return_pks=True)
+
+    # 게시글별 좋아요 0~5개 (작성자 중복 없음)
+    def generate_likes(self, post_ids, user_ids):
+        for post_id in post_ids:
+            for user_id in self.random.sample(
+                user_ids, min(self.random.randint(0, 5), len(user_ids))
+            ):
+                yield Like(author_id=user_id, post_id=post_id)
+
+    # 게시글별 댓글 0~4개
+    def generate_comments(self, post_ids, user_ids):
+        for post_id in post_ids:
+            for _ in range(self.random.randint(0, 4)):
+                yield Comment(
+                    author_id=self.random.choice(user_ids),
+                    post_id=post_id,
+                    contents="좋은 글 감사합니다.",
+                )
+
+    # save()/시그널이 하던 비정규화 컬럼과 색인 갱신
+    def sync(self):
+        call_command("sync_crew_counts", stdout=self.stdout)
+        call_command("sync_race_filters", stdout=self.stdout)
+        call_command("sync_post_like_counts", stdout=self.stdout)
+        call_command("sync_user_distances", stdout=self.stdout)
+        call_command("rebuild_leaderboards", stdout=self.stdout)
+        if search.is_search_index_enabled():
+            call_command("rebuild_post_search_index", stdout=self.stdout)
+        get_cache().clear()
@@ -0,0 +1,140 @@
+import json
+import os
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+from PIL import Image
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from accounts.models import CustomUser, JoinedCrew, Record
+from boards.models import Like, Post
+from config.images import VARIANT_CACHE_ALIAS
+from config.testing import LOCMEM_SHARED_CACHES
+from crews.models import Crew
+from promotions.models import Promotion
+
+
+@override_settings(CACHES=LOCMEM_SHARED_CACHES, VIEW_COUNT_FLUSH_INTERVAL=0)
+class BenchmarkCommandTestCase(TestCase):
+    # 작은 규모로 데이터 생성 후 벤치마크 JSON 출력 확인
+    def test_seed_and_benchmark(self):
+        print("[벤치마크 커맨드 테스트]")
+        call_command(
+            "seed_dataset",
+            users=20,
+            crews=3,
+            races=3,
+            records=50,
+            posts=10,
+            stdout=StringIO(),
+        )
+        self.assertEqual(CustomUser.objects.count(), 20)
+        self.assertEqual(
+            sum(Crew.objects.values_list("member_count", flat=True)),
+            JoinedCrew.objects.filter(status="member").count(),
+        )
+        self.assertEqual(
+            sum(Post.objects.values_list("like_count", flat=True)),
+            Like.objects.count(),
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "benchmark.json")
+            with override_settings(ASYNC_CONCURRENT_SECTIONS=False):
+                call_command(
+                    "benchmark",
+                    iterations=2,
+                    asgi=True,
+                    records=20,
+                    output=output,
+                    stdout=StringIO(),
+                )
+            with open(output, encoding="utf-8") as file:
+                report = json.load(file)
+            call_command(
+                "benchmark", iterations=1, compare=output, stdout=StringIO()
+            )
+
+        results = report["results"]
+        self.assertEqual(report["meta"]["counts"]["users"], 20)
+        self.assertIn("anon GET /races/{race}/", results)
+        self.assertIn("auth GET /accounts/mypage/record/", results)
+        self.assertIn("asgi GET /races/async/{race}/", results)
+        self.assertIn("asgi-auth GET /accounts/async/mypage/favorites/", results)
+        self.assertIn("wsgi GET /races/async/{race}/", results)
+        self.assertEqual(
+            results["wsgi GET /races/async/{race}/"]["queries"],
+            results["anon GET /races/{race}/"]["queries"]
+            + results["anon GET /races/{race}/reviews/"]["queries"],
+        )
+        bulk = results["auth POST /accounts/mypage/record/bulk/"]
+        self.assertEqual(bulk["status"], 201)
+        self.assertGreater(bulk["records_per_second"], 0)
+        self.assertEqual(Record.objects.count(), 50)  # 측정 후 롤백
+        for name, result in results.items():
+            self.assertLess(result["status"], 400, name)
+            self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+        print(
+            "------------------------------------------------------------------------완료 "
+        )
+
+
+class BuildImageVariantsCommandTestCase(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(
+            username="test1", email="test1@test.com", password="test1234!"
+        )
+        caches[VARIANT_CACHE_ALIAS].clear()
+
+    def create_image(self, name, image_format, mode="RGB"):
+        buffer = BytesIO()
+        Image.new(mode, (300, 150), "blue").save(buffer, image_format)
+        return SimpleUploadedFile(name, buffer.getvalue())
+
+    # 저장 시 예약된 생성은 커밋 후 실행되므로 TestCase 에서는 변형이 없음
+    def test_build_missing_variants(self):
+        print("[이미지 변형 일괄 생성 커맨드 테스트]")
+        crew = Crew.objects.create(
+            name="크루1",
+            location_city="seoul",
+            owner=self.user,
+            thumbnail_image=self.create_image("crew.png", "PNG", mode="RGBA"),
+        )
+        Promotion.objects.create(
+            title="배너1",
+            link_path="crew/1",
+            banner_image=self.create_image("banner.jpg", "JPEG"),
+        )
+        response = self.client.get("/home/")
+        self.assertIsNone(response.data["crews"][0]["thumbnail_image_variants"])
+
+        output = StringIO()
+        call_command("build_image_variants", threads=2, stdout=output)
+        self.assertIn("변형 생성 2개, 건너뜀 0개", output.getvalue())
+
+        # 응답 캐시 그룹이 무효화되어 변형 URL 이 바로 보임
+        response = self.client.get("/home/")
+        variants = response.data["crews"][0]["thumbnail_image_variants"]
+        # 원본(300px)보다 넓은 폭은 원본 폭 하나로 합치고 키는 실제 폭
+        self.assertEqual(list(variants["webp"]), ["200w", "300w"])
+        self.assertIsNotNone(response.data["promotions"][0]["banner_image_variants"])
+        for width, size in (("200w", (200, 100)), ("300w", (300, 150))):
+            name = variants["jpeg"][width].split("/media/")[1]
+            with crew.thumbnail_image.storage.open(name) as file:
+                self.assertEqual(Image.open(file).size, size)
+
+        output = StringIO()
+        call_command("build_image_variants", stdout=output)
+        self.assertIn("변형 생성 0개, 건너뜀 2개", output.getvalue())
+        print(
+            "------------------------------------------------------------------------완료 "
+        )
@@ -1,14 +1,26 @@
 from .models import Promotion, PromotionArticle
 from rest_framework import serializers
+from config.images import ImageVariantsField
 
 
 class PromotionSerializer(serializers.ModelSerializer):
+    banner_image_variants = ImageVariantsField(source="banner_image")
+
     class Meta:
         model = Promotion
-        fields = ["id", "title", "banner_image", "link_path"]
+        fields = ["id", "title", "banner_image", "banner_image_variants", "link_path"]
 
 
 class PromotionArticleSerializer(serializers.ModelSerializer):
+    thumbnail_image_variants = ImageVariantsField(source="thumbnail_image")
+
     class Meta:
         model = PromotionArticle
-        fields = ["id", "title", "sub_title", "thumbnail_image", "link_path"]
+        fields = [
+            "id",
+            "title",
+            "sub_title",
+            "thumbnail_image",
+            "thumbnail_image_variants",
+            "link_path",
+        ]
@@ -0,0 +1,11 @@
+from config.images import build_variants_on_save
+from config.response_cache import invalidate_on_change
+from .models import Promotion, PromotionArticle
+
+
+# 프로모션 배너/아티클 비회원 응답 캐시 무효화 (config/response_cache.py)
+invalidate_on_change("promotions", Promotion)
+invalidate_on_change("promotion_articles", PromotionArticle)
+# 배너/썸네일 변형 생성 (config/images.py)
+build_variants_on_save(Promotion, "banner_image", groups=["promotions"])
+build_variants_on_save(PromotionArticle, "thumbnail_image", groups=["promotion_articles"])
@@ -1,3 +1,49 @@
 from django.test import TestCase
+from rest_framework.test import APIClient
+from accounts.models import CustomUser, LevelStep
+from config.response_cache import get_stats
+from .models import Promotion
 
-# Create your tests here.
+
+class PromotionResponseCacheTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.level = LevelStep.objects.create(
+            number=1, title="Level 1", min_distance=0, max_distance=100
+        )
+        self.user = CustomUser.objects.create_user(
+            username="test1",
+            email="test1@test.com",
+            password="test1234!",
+            level=self.level,
+        )
+        Promotion.objects.create(title="배너1", link_path="crew/1")
+
+    # 비회원 응답 캐시 테스트
+    def test_anonymous_response_cache(self):
+        print("[비회원 응답 캐시 테스트]")
+        print(">> 같은 요청은 캐시에서 반환하고, 프로모션이 바뀌면 다시 조회한다.")
+        stats = get_stats()
+        response = self.client.get("/promotions/")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(len(response.data), 1)
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/promotions/")
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertEqual(len(response.json()), 1)
+        self.assertEqual(get_stats()["hit"], stats["hit"] + 1)
+        self.assertEqual(get_stats()["miss"], stats["miss"] + 1)
+
+        Promotion.objects.create(title="배너2", link_path="crew/2")
+        response = self.client.get("/promotions/")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(len(response.data), 2)
+
+        # 로그인 유저는 캐시를 사용하지 않음
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get("/promotions/")
+        self.assertFalse(response.has_header("X-Cache"))
+        print(
+            "------------------------------------------------------------------------완료 "
+        )
@@ -2,6 +2,8 @@ from rest_framework.response import Response
 from rest_framework import viewsets
 from .models import Promotion, PromotionArticle
 from .serializers import PromotionSerializer, PromotionArticleSerializer
+from config.response_cache import cache_anonymous_response
+from config.query_budget import query_budget
 
 
 class ListOnlyViewSet(
@@ -17,7 +19,17 @@ class PromotionViewSet(ListOnlyViewSet):
     serializer_class = PromotionSerializer
     queryset = Promotion.objects.filter(is_show=True)
 
+    @query_budget(1)
+    @cache_anonymous_response("promotions")
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
 
 class PromotionArticleViewSet(ListOnlyViewSet):
     serializer_class = PromotionArticleSerializer
     queryset = PromotionArticle.objects.filter(is_show=True).order_by("-updated_at")[:3]
+
+    @query_budget(1)
+    @cache_anonymous_response("promotion_articles")
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
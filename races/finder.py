@@ -0,0 +1,77 @@
+from datetime import date
+from config.constants import COURSE_CHOICES, LOCATION_CITY_CHOICES
+
+
+"""
+대회 찾기 필터 정규화
+
+- courses: MultiSelectField 의 "Full,Half" 문자열 → RaceCourse 행으로 분리 (LIKE 대신 인덱스 조회)
+- region: 자유 입력인 location("서울 잠실종합운동장", "부산광역시 ...") → LOCATION_CITY_CHOICES 값
+- start_month: "2024-05" → 대회 시작일 범위 [2024-05-01, 2024-06-01)
+"""
+
+COURSE_KEYS = {key.lower(): key for key, _ in COURSE_CHOICES}
+
+# location 단어 앞 두 글자 → 지역
+REGION_PREFIXES = {
+    "서울": "seoul",
+    "경기": "gyeonggi",
+    "인천": "gyeonggi",
+    "강원": "gangwon",
+    "충청": "chungcheong",
+    "충북": "chungcheong",
+    "충남": "chungcheong",
+    "대전": "chungcheong",
+    "세종": "chungcheong",
+    "전라": "jeolla",
+    "전북": "jeolla",
+    "전남": "jeolla",
+    "광주": "jeolla",
+    "경상": "gyeongsang",
+    "경북": "gyeongsang",
+    "경남": "gyeongsang",
+    "부산": "gyeongsang",
+    "대구": "gyeongsang",
+    "울산": "gyeongsang",
+    "제주": "jeju",
+}
+
+REGION_KEYS = {
+    **{key: key for key, _ in LOCATION_CITY_CHOICES},
+    **{label: key for key, label in LOCATION_CITY_CHOICES},
+}
+
+
+# 코스 값 정규화 ("full" → "Full"). 선택지에 없는 값은 그대로 둠
+def normalize_course(course):
+    course = course.strip()
+    return COURSE_KEYS.get(course.lower(), course)
+
+
+def normalize_courses(courses):
+    if isinstance(courses, str):
+        courses = courses.split(",")
+    return {normalize_course(course) for course in courses or () if course.strip()}
+
+
+def region_from_location(location):
+    for word in (location or "").split():
+        region = REGION_PREFIXES.get(word[:2])
+        if region:
+            return region
+    return "etc"
+
+
+# "seoul,경기" → {"seoul", "gyeonggi"} (알 수 없는 값은 무시)
+def parse_regions(value):
+    return {
+        REGION_KEYS[v.strip()] for v in value.split(",") if v.strip() in REGION_KEYS
+    }
+
+
+# "2024-05" → (2024-05-01, 2024-06-01). 형식이 틀리면 ValueError
+def month_range(value):
+    year, month = (int(part) for part in value.split("-"))
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start, end
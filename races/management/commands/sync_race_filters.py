@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from races.models import Race
+
+
+"""
+대회 찾기 필터 컬럼 재계산 커맨드
+
+- courses 문자열 → RaceCourse 행, location → region 을 다시 채움
+- 컬럼/테이블 추가 후 기존 대회 데이터를 채울 때 사용
+- 사용법: python manage.py sync_race_filters
+"""
+
+
+class Command(BaseCommand):
+    help = "대회의 RaceCourse 행과 region 을 courses / location 기준으로 재계산합니다."
+
+    def handle(self, *args, **options):
+        races = Race.objects.all()
+        synced = races.sync_courses()
+        changed = races.sync_regions()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{synced}개 대회의 코스를 갱신했습니다. (지역 변경 {changed}개)"
+            )
+        )
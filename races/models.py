@@ -1,8 +1,132 @@
 from django.db import models
+from django.db.models import (
+    Case,
+    DurationField,
+    Exists,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Value,
+    When,
+)
 from django.conf import settings
-from config.constants import COURSE_CHOICES
+from django.utils import timezone
+from config.constants import COURSE_CHOICES, LOCATION_CITY_CHOICES
+from config.images import validate_image_pixels
+from .finder import normalize_courses, region_from_location
 from multiselectfield import MultiSelectField
-from datetime import date
+
+
+REG_STATUS_UPCOMING = "접수예정"
+REG_STATUS_OPEN = "접수중"
+REG_STATUS_CLOSED = "접수마감"
+
+# reg_status 정렬 순서 (접수중 → 접수예정 → 접수마감)
+REG_STATUS_ORDER = {REG_STATUS_OPEN: 0, REG_STATUS_UPCOMING: 1, REG_STATUS_CLOSED: 2}
+
+
+"""
+대회 접수 상태 / D-day 쿼리
+
+- 기준일은 서버 로컬 날짜가 아닌 TIME_ZONE(Asia/Seoul) 기준 오늘 (timezone.localdate)
+- with_registration(): registration_status, registration_order, registration_d_day 주석 추가
+    → 파이썬에서 정렬/필터링하지 않고 SQL ORDER BY / WHERE 로 처리
+"""
+
+
+class RaceQuerySet(models.QuerySet):
+    def upcoming(self, today=None):
+        return self.filter(reg_start_date__gt=today or timezone.localdate())
+
+    def open_for_registration(self, today=None):
+        today = today or timezone.localdate()
+        return self.filter(reg_start_date__lte=today, reg_end_date__gte=today)
+
+    def closed(self, today=None):
+        return self.filter(reg_end_date__lt=today or timezone.localdate())
+
+    def filter_reg_status(self, reg_status, today=None):
+        if reg_status == REG_STATUS_UPCOMING:
+            return self.upcoming(today)
+        elif reg_status == REG_STATUS_OPEN:
+            return self.open_for_registration(today)
+        elif reg_status == REG_STATUS_CLOSED:
+            return self.closed(today)
+        return self
+
+    def with_registration(self, today=None):
+        today = today or timezone.localdate()
+        return self.annotate(
+            registration_status=Case(
+                When(reg_start_date__gt=today, then=Value(REG_STATUS_UPCOMING)),
+                When(reg_end_date__lt=today, then=Value(REG_STATUS_CLOSED)),
+                default=Value(REG_STATUS_OPEN),
+                output_field=models.CharField(),
+            ),
+            registration_order=Case(
+                *[
+                    When(registration_status=status, then=Value(order))
+                    for status, order in REG_STATUS_ORDER.items()
+                ],
+                output_field=models.IntegerField(),
+            ),
+            registration_d_day=ExpressionWrapper(
+                F("reg_end_date") - Value(today), output_field=DurationField()
+            ),
+        )
+
+    # 대회 찾기 필터 (races/finder.py)
+    def not_ended(self, today=None):
+        return self.filter(end_date__gte=today or timezone.localdate())
+
+    def with_courses(self, courses):
+        return self.filter(
+            Exists(
+                RaceCourse.objects.filter(
+                    race=OuterRef("pk"), course__in=normalize_courses(courses)
+                )
+            )
+        )
+
+    def in_regions(self, regions):
+        return self.filter(region__in=regions)
+
+    def in_month(self, month_start, month_end):
+        return self.filter(start_date__gte=month_start, start_date__lt=month_end)
+
+    def fee_between(self, fee_min=None, fee_max=None):
+        queryset = self
+        if fee_min is not None:
+            queryset = queryset.filter(fees__gte=fee_min)
+        if fee_max is not None:
+            queryset = queryset.filter(fees__lte=fee_max)
+        return queryset
+
+    # courses 문자열을 RaceCourse 행으로 다시 채움
+    def sync_courses(self):
+        races = list(self.only("id", "courses"))
+        RaceCourse.objects.filter(race__in=races).delete()
+        RaceCourse.objects.bulk_create(
+            [
+                RaceCourse(race=race, course=course)
+                for race in races
+                for course in normalize_courses(race.courses)
+            ],
+            batch_size=500,
+        )
+        return len(races)
+
+    # location 으로부터 region 재계산
+    def sync_regions(self):
+        races = list(self.only("id", "location", "region"))
+        changed = []
+        for race in races:
+            region = region_from_location(race.location)
+            if race.region != region:
+                race.region = region
+                changed.append(race)
+        self.model.objects.bulk_update(changed, ["region"], batch_size=500)
+        return len(changed)
 
 
 class Race(models.Model):
@@ -15,31 +139,72 @@ class Race(models.Model):
     reg_end_date = models.DateField()  # 신청접수 마감일
     courses = MultiSelectField(choices=COURSE_CHOICES)  # 대회 코스 복수 선택
     thumbnail_image = models.ImageField(
-        upload_to="races/thumbnail_images/%Y/%m/%d/", null=True
+        upload_to="races/thumbnail_images/%Y/%m/%d/",
+        null=True,
+        validators=[validate_image_pixels],
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateField(auto_now=True)
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     location = models.CharField(max_length=100)  # 대회 장소
+    region = models.CharField(
+        max_length=20, choices=LOCATION_CITY_CHOICES, default="etc", editable=False
+    )  # location 에서 추출한 지역 (save 시 갱신)
     fees = models.IntegerField(default=0)  # 참가비용
     register_url = models.URLField(null=True)  # 대회 신청 페이지(외부링크)
 
+    objects = RaceQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["reg_start_date", "reg_end_date"], name="race_reg_period_idx"
+            ),
+            models.Index(
+                fields=["reg_end_date", "reg_start_date"], name="race_reg_end_idx"
+            ),
+            models.Index(fields=["end_date", "start_date"], name="race_end_date_idx"),
+            models.Index(fields=["start_date", "id"], name="race_start_date_idx"),
+            models.Index(fields=["region", "start_date"], name="race_region_idx"),
+            models.Index(fields=["fees"], name="race_fees_idx"),
+        ]
+
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        self.region = region_from_location(self.location)
+        super().save(*args, **kwargs)
+        self.sync_courses()
+
+    # courses 와 RaceCourse 행 동기화 (바뀐 코스만 추가/삭제)
+    def sync_courses(self):
+        courses = normalize_courses(self.courses)
+        existing = set(self.course_set.values_list("course", flat=True))
+        if existing - courses:
+            self.course_set.filter(course__in=existing - courses).delete()
+        if courses - existing:
+            RaceCourse.objects.bulk_create(
+                [RaceCourse(race=self, course=course) for course in courses - existing]
+            )
+
+    # with_registration() 주석이 있으면 그 값을 사용
     def d_day(self):
-        today = date.today()
-        delta = self.reg_end_date - today
+        if "registration_d_day" in self.__dict__:
+            return self.registration_d_day.days
+        delta = self.reg_end_date - timezone.localdate()
         return delta.days
 
     def reg_status(self):
-        today = date.today()
+        if "registration_status" in self.__dict__:
+            return self.registration_status
+        today = timezone.localdate()
         if self.reg_start_date > today:
-            return "접수예정"
+            return REG_STATUS_UPCOMING
         elif self.reg_start_date <= today <= self.reg_end_date:
-            return "접수중"
+            return REG_STATUS_OPEN
         elif self.reg_end_date < today:
-            return "접수마감"
+            return REG_STATUS_CLOSED
         else:
             return "날짜 확인 필요"
 
@@ -47,6 +212,25 @@ class Race(models.Model):
         return RaceFavorite.objects.filter(user=user, race=self).exists()
 
 
+# 대회 코스 (courses 를 코스별 행으로 정규화, 코스 필터용)
+class RaceCourse(models.Model):
+    race = models.ForeignKey(Race, on_delete=models.CASCADE, related_name="course_set")
+    course = models.CharField(max_length=10, choices=COURSE_CHOICES)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["race", "course"], name="unique_race_course"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["course", "race"], name="racecourse_course_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.race} - {self.course}"
+
+
 class RaceFavorite(models.Model):
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
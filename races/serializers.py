@@ -1,18 +1,15 @@
 from rest_framework import serializers
+from config.images import ImageVariantsField
+from config.viewer_state import ViewerStateListSerializer, get_viewer_state
 from .models import Race, RaceReview
 
 
-def check_is_favorite(user, race):
-    if user.is_authenticated:
-        return race.is_favorite(user)
-    return False
-
-
 class RaceListSerializer(serializers.ModelSerializer):
     reg_status = serializers.CharField()
     is_favorite = serializers.SerializerMethodField()
     d_day = serializers.IntegerField()
     courses = serializers.SerializerMethodField()
+    thumbnail_image_variants = ImageVariantsField(source="thumbnail_image")
 
     class Meta:
         model = Race
@@ -28,8 +25,10 @@ class RaceListSerializer(serializers.ModelSerializer):
             "reg_end_date",
             "courses",
             "thumbnail_image",
+            "thumbnail_image_variants",
             "is_favorite",
         ]
+        list_serializer_class = ViewerStateListSerializer
 
     def get_reg_status(self, obj):
         return obj.reg_status()
@@ -38,8 +37,7 @@ class RaceListSerializer(serializers.ModelSerializer):
         return obj.d_day()
 
     def get_is_favorite(self, obj):
-        user = self.context["request"].user
-        return check_is_favorite(user, obj)
+        return get_viewer_state(self.context).is_favorite_race(obj)
 
     def get_courses(self, obj):
         if isinstance(obj.courses, list):
@@ -54,6 +52,7 @@ class RaceDetailSerializer(serializers.ModelSerializer):
     d_day = serializers.SerializerMethodField()
     is_favorite = serializers.SerializerMethodField()
     courses = serializers.SerializerMethodField()
+    thumbnail_image_variants = ImageVariantsField(source="thumbnail_image")
 
     class Meta:
         model = Race
@@ -68,6 +67,7 @@ class RaceDetailSerializer(serializers.ModelSerializer):
             "reg_end_date",
             "courses",
             "thumbnail_image",
+            "thumbnail_image_variants",
             "location",
             "fees",
             "reg_status",
@@ -75,6 +75,7 @@ class RaceDetailSerializer(serializers.ModelSerializer):
             "is_favorite",
             "register_url",
         ]
+        list_serializer_class = ViewerStateListSerializer
 
     def get_reg_status(self, obj):
         return obj.reg_status()
@@ -83,10 +84,7 @@ class RaceDetailSerializer(serializers.ModelSerializer):
         return obj.d_day()
 
     def get_is_favorite(self, obj):
-        user = self.context["request"].user
-        if user.is_authenticated:
-            return obj.is_favorite(user)
-        return False
+        return get_viewer_state(self.context).is_favorite_race(obj)
 
     def get_courses(self, obj):
         if isinstance(obj.courses, list):
@@ -0,0 +1,9 @@
+from config.images import build_variants_on_save
+from config.response_cache import invalidate_on_change
+from .models import Race
+
+
+# 대회 목록/top6 비회원 응답 캐시 무효화 (config/response_cache.py)
+invalidate_on_change("races", Race)
+# 썸네일 변형 생성 (config/images.py)
+build_variants_on_save(Race, "thumbnail_image", groups=["races"])
@@ -1,11 +1,13 @@
 from rest_framework.test import APIClient
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
 from races.models import Race, RaceReview, RaceFavorite
 from accounts.models import CustomUser, LevelStep
 from django.contrib.auth import get_user_model
-from datetime import date
+from django.utils import timezone
+from datetime import date, timedelta
+from config.query_budget import QueryBudgetTestMixin
 
 User = get_user_model()
 
@@ -142,6 +144,156 @@ class RaceTestCase(TestCase):
             "------------------------------------------------------------------------완료 "
         )
 
+    # 접수 상태/D-day 는 DB 에서 계산, top6 는 마감 임박순
+    def test_race_reg_status_and_d_day_annotations(self):
+        print("[접수 상태/D-day 테스트]")
+        print(">> 접수중 대회는 마감 임박순으로, D-day 와 접수 상태가 함께 반환된다.")
+        today = timezone.localdate()
+        races = [
+            Race.objects.create(
+                title=f"접수중 대회{days}",
+                organizer="주최자",
+                description="설명",
+                start_date=today + timedelta(days=30),
+                end_date=today + timedelta(days=30),
+                reg_start_date=today - timedelta(days=1),
+                reg_end_date=today + timedelta(days=days),
+                author=self.user1,
+                location="장소",
+                courses=["10km"],
+            )
+            for days in (5, 0, 3)
+        ]
+        response = self.client.get("/races/top6/")
+        self.assertEqual(
+            [race["id"] for race in response.data],
+            [races[1].id, races[2].id, races[0].id],
+        )
+        self.assertEqual([race["d_day"] for race in response.data], [0, 3, 5])
+        self.assertEqual(response.data[0]["reg_status"], "접수중")
+
+        response = self.client.get("/races/?reg_status=접수마감&include_ended=true")
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertEqual(response.data["results"][0]["reg_status"], "접수마감")
+
+        response = self.client.get("/races/?ordering=reg_status&include_ended=true")
+        self.assertEqual(response.data["results"][0]["reg_status"], "접수중")
+        self.assertEqual(response.data["results"][-1]["reg_status"], "접수마감")
+        print(
+            "------------------------------------------------------------------------완료 "
+        )
+
+    # 정렬 값이 같은 대회가 많아도 (정렬 값, id) 커서로 빠짐없이 앞뒤로 이동
+    def test_race_cursor_with_ties(self):
+        print("[대회 목록 커서 테스트]")
+        print(">> 접수 상태/마감일이 같은 대회도 페이지마다 겹치거나 빠지지 않는다.")
+        today = timezone.localdate()
+        Race.objects.bulk_create(
+            Race(
+                title=f"같은 마감일 대회{i}",
+                organizer="주최자",
+                description="설명",
+                start_date=today + timedelta(days=30),
+                end_date=today + timedelta(days=30),
+                reg_start_date=today - timedelta(days=1),
+                reg_end_date=today + timedelta(days=5),
+                author=self.user1,
+                location="장소",
+            )
+            for i in range(7)
+        )
+        expected = list(
+            Race.objects.with_registration(today)
+            .order_by("registration_order", "reg_end_date", "id")
+            .values_list("id", flat=True)
+        )
+
+        pages, url = [], "/races/?ordering=reg_status&include_ended=true&size=3"
+        while url:
+            response = self.client.get(url)
+            pages.append([race["id"] for race in response.data["results"]])
+            url = response.data["next"]
+        self.assertEqual(sum(pages, []), expected)
+        self.assertTrue(all(len(page) == 3 for page in pages[:-1]))
+
+        previous = self.client.get(response.data["previous"])
+        self.assertEqual([race["id"] for race in previous.data["results"]], pages[-2])
+        self.assertEqual(self.client.get("/races/?cursor=abc").status_code, 404)
+        print(
+            "------------------------------------------------------------------------완료 "
+        )
+
+    # 대회 찾기 (코스/시작 월/지역/참가비 필터, 커서 페이지네이션)
+    def test_race_finder(self):
+        print("[대회 찾기 테스트]")
+        print(
+            ">> 종료된 대회는 기본 제외되고, 코스/월/지역/참가비로 걸러 커서 단위로 반환한다."
+        )
+        today = timezone.localdate()
+        races = [
+            Race.objects.create(
+                title=f"대회 찾기{i}",
+                organizer="주최자",
+                description="설명",
+                start_date=today + timedelta(days=10 * i),
+                end_date=today + timedelta(days=10 * i),
+                reg_start_date=today - timedelta(days=1),
+                reg_end_date=today + timedelta(days=5),
+                author=self.user1,
+                location=location,
+                fees=fees,
+                courses=courses,
+            )
+            for i, (location, fees, courses) in enumerate(
+                [
+                    ("서울 잠실종합운동장", 30000, ["Full", "10km"]),
+                    ("부산광역시 해운대", 50000, ["Half"]),
+                    ("서울특별시 여의도공원", 0, ["10km", "5km"]),
+                ],
+                start=1,
+            )
+        ]
+        self.assertEqual(races[1].region, "gyeongsang")
+        self.assertEqual(
+            set(races[0].course_set.values_list("course", flat=True)),
+            {"Full", "10km"},
+        )
+
+        response = self.client.get("/races/")
+        self.assertEqual(
+            [race["id"] for race in response.data["results"]], [r.id for r in races]
+        )
+
+        response = self.client.get("/races/?course=10km&region=서울&fee_max=10000")
+        self.assertEqual(
+            [race["id"] for race in response.data["results"]], [races[2].id]
+        )
+
+        month = races[1].start_date.strftime("%Y-%m")
+        response = self.client.get(f"/races/?start_month={month}&course=half")
+        self.assertIn(races[1].id, [race["id"] for race in response.data["results"]])
+
+        response = self.client.get("/races/?size=2")
+        self.assertEqual(
+            [race["id"] for race in response.data["results"]],
+            [races[0].id, races[1].id],
+        )
+        response = self.client.get(response.data["next"])
+        self.assertEqual(
+            [race["id"] for race in response.data["results"]], [races[2].id]
+        )
+
+        races[0].courses = ["Half"]
+        races[0].save()
+        response = self.client.get("/races/?course=Full")
+        self.assertEqual(response.data["results"], [])
+
+        response = self.client.get("/races/?fee_min=abc")
+        self.assertEqual(response.status_code, 400)
+        print(
+            "------------------------------------------------------------------------완료 "
+        )
+
     # 대회 리뷰 목록 조회 테스트
     def test_race_reviews_list_view(self):
         print("[대회 리뷰 목록 조회 테스트]")
@@ -152,3 +304,69 @@ class RaceTestCase(TestCase):
         print(
             "------------------------------------------------------------------------완료 "
         )
+
+
+# 쿼리 예산 (config/query_budget.py)
+class RaceQueryBudgetTestCase(QueryBudgetTestMixin, TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(
+            username="test1", email="test1@test.com", password="test1234!"
+        )
+        self.race = self.create_race("대회")
+        self.seeded = 0
+
+    def create_race(self, title):
+        today = timezone.localdate()
+        return Race.objects.create(
+            title=title,
+            organizer="주최자",
+            description="설명",
+            start_date=today + timedelta(days=30),
+            end_date=today + timedelta(days=31),
+            reg_start_date=today - timedelta(days=1),
+            reg_end_date=today + timedelta(days=10),
+            author=self.user,
+            location="서울 잠실",
+            fees=5000,
+            register_url="http://test.com",
+            courses=["full", "half"],
+        )
+
+    # 대회, 즐겨찾기, 리뷰를 n개씩 추가
+    def seed(self, n):
+        for _ in range(n):
+            self.seeded += 1
+            author = CustomUser.objects.create(
+                username=f"seed{self.seeded}", email=f"seed{self.seeded}@test.com"
+            )
+            race = self.create_race(f"대회 {self.seeded}")
+            RaceFavorite.objects.create(user=self.user, race=race)
+            RaceReview.objects.create(race=self.race, author=author, contents="리뷰")
+
+    def test_race_query_budget(self):
+        for user in [None, self.user]:
+            self.client.force_authenticate(user=user)
+            self.assertQueryBudget("/races/", self.seed)
+            self.assertQueryBudget("/races/?cursor=", self.seed)
+            self.assertQueryBudget("/races/top6/", self.seed)
+            self.assertQueryBudget(f"/races/{self.race.pk}/", self.seed)
+            self.assertQueryBudget(f"/races/{self.race.pk}/reviews/", self.seed)
+
+    # 비동기 상세 (config/async_sections.py), 테스트 트랜잭션의 데이터를 보도록 섹션을 순서대로 실행
+    @override_settings(ASYNC_CONCURRENT_SECTIONS=False)
+    def test_race_detail_async(self):
+        self.seed(2)
+        path = f"/races/async/{self.race.pk}/"
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "race": self.client.get(f"/races/{self.race.pk}/").json(),
+                "reviews": self.client.get(f"/races/{self.race.pk}/reviews/").json(),
+            },
+        )
+        self.assertEqual(self.client.get("/races/async/0/").status_code, 404)
+        self.assertEqual(self.client.post(path).status_code, 405)
+        self.assertQueryBudget(path, self.seed)
@@ -5,6 +5,7 @@ from . import views
 urlpatterns = [
     path("", views.race_list, name="race_list"),
     path("<int:race_id>/", views.race_detail, name="race_detail"),
+    path("async/<int:race_id>/", views.race_detail_async, name="race_detail_async"),
     path("<int:race_id>/reviews/", views.race_reviews, name="race_reviews"),
     path(
         "<int:race_id>/reviews/<int:review_id>/",
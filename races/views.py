@@ -6,25 +6,105 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExampl
 from django.db.models import Q
 from django.shortcuts import get_object_or_404
 from .models import Race, RaceReview, RaceFavorite
+from .finder import month_range, parse_regions
+from config.pagination import KeysetCursorPagination
+from config.response_cache import cache_anonymous_response
+from config.query_budget import query_budget
+from config.async_sections import (
+    as_drf_request,
+    authenticate,
+    gather_sections,
+    json_response,
+    require_GET,
+)
+from rest_framework.exceptions import NotFound
+from django.utils import timezone
 from .serializers import *
-from datetime import date
 
 
-# 대회 목록 조회
+# Cursor Pagination (OFFSET 없이 (정렬 필드, id) 키셋으로 조회, config/pagination.py)
+class RaceCursorPagination(KeysetCursorPagination):
+    page_size = 12
+    page_size_query_param = "size"
+    max_page_size = 100
+    ordering = ("start_date", "id")
+
+
+# 정렬 파라미터 → ORDER BY
+RACE_ORDERINGS = {
+    "": ("start_date", "id"),
+    "start_date": ("start_date", "id"),
+    "d_day": ("reg_end_date", "id"),
+    "reg_status": ("registration_order", "reg_end_date", "id"),
+}
+
+
+def parse_fee(value):
+    return int(value) if value != "" else None
+
+
+# 대회 목록 조회 (대회 찾기)
 @extend_schema(
     parameters=[
         OpenApiParameter(
             name="search", description="Search keyword", required=False, type=str
         ),
+        OpenApiParameter(
+            name="course",
+            description="코스 (Full,Half,10km,5km,3km 중 콤마로 여러 개)",
+            required=False,
+            type=str,
+        ),
+        OpenApiParameter(
+            name="start_month",
+            description="대회 시작 월 (YYYY-MM)",
+            required=False,
+            type=str,
+        ),
+        OpenApiParameter(
+            name="region",
+            description="지역 (seoul,gyeonggi,... 또는 서울,경기,... 콤마로 여러 개)",
+            required=False,
+            type=str,
+        ),
+        OpenApiParameter(
+            name="fee_min", description="최소 참가비", required=False, type=int
+        ),
+        OpenApiParameter(
+            name="fee_max", description="최대 참가비", required=False, type=int
+        ),
+        OpenApiParameter(
+            name="include_ended",
+            description="true 면 종료된 대회도 포함 (기본: 제외)",
+            required=False,
+            type=bool,
+        ),
+        OpenApiParameter(
+            name="cursor",
+            description="다음/이전 페이지 커서 (응답의 next/previous 링크, 첫 페이지는 생략)",
+            required=False,
+            type=str,
+        ),
+        OpenApiParameter(
+            name="size", description="페이지당 대회 수", required=False, type=int
+        ),
         OpenApiParameter(
             name="reg_status",
             description="접수예정/접수중/접수마감",
             required=False,
             type=str,
         ),
+        OpenApiParameter(
+            name="ordering",
+            description="start_date: 대회일순(기본), d_day: 접수 마감 임박순, reg_status: 접수중→접수예정→접수마감 순",
+            required=False,
+            type=str,
+        ),
     ]
 )
 @api_view(["GET"])
+@query_budget(2)
+@cache_anonymous_response("races")
 def race_list(request):
     races = Race.objects.all()
 
@@ -35,27 +115,92 @@ def race_list(request):
             | Q(description__icontains=search_keyword)
         )
 
+    # 접수 상태/D-day 는 Asia/Seoul 기준 오늘로 SQL 에서 계산 (races/models.py)
+    today = timezone.localdate()
     search_reg_status = request.GET.get("reg_status", "")
-    today = date.today()
-    if search_reg_status == "접수예정":
-        races = races.filter(reg_start_date__gt=today)
-    elif search_reg_status == "접수중":
-        races = races.filter(reg_start_date__lte=today, reg_end_date__gte=today)
-    elif search_reg_status == "접수마감":
-        races = races.filter(reg_end_date__lt=today)
-
-    serializer = RaceListSerializer(races, many=True, context={"request": request})
-    return Response(serializer.data)
+    races = races.filter_reg_status(search_reg_status, today)
+
+    # 이미 끝난 대회는 기본 제외
+    if request.GET.get("include_ended") != "true":
+        races = races.not_ended(today)
+
+    courses = request.GET.get("course", "")
+    if courses:
+        races = races.with_courses(courses)
+
+    regions = request.GET.get("region", "")
+    if regions:
+        races = races.in_regions(parse_regions(regions))
+
+    try:
+        start_month = request.GET.get("start_month", "")
+        if start_month:
+            races = races.in_month(*month_range(start_month))
+        races = races.fee_between(
+            parse_fee(request.GET.get("fee_min", "")),
+            parse_fee(request.GET.get("fee_max", "")),
+        )
+    except ValueError:
+        return Response(
+            {"error": "start_month 는 YYYY-MM, fee_min/fee_max 는 숫자여야 합니다."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    ordering = RACE_ORDERINGS.get(request.GET.get("ordering", ""))
+    if ordering is None:
+        return Response(
+            {"error": "ordering 은 start_date, d_day, reg_status 중 하나여야 합니다."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    races = races.with_registration(today)
+
+    # 항상 커서 페이지네이션 (cursor 가 없으면 첫 페이지)
+    paginator = RaceCursorPagination()
+    paginator.ordering = ordering
+    page = paginator.paginate_queryset(races, request)
+    serializer = RaceListSerializer(page, many=True, context={"request": request})
+    return paginator.get_paginated_response(serializer.data)
 
 
 # 대회 상세 조회
 @api_view(["GET"])
+@query_budget(2)
 def race_detail(request, race_id):
-    race = get_object_or_404(Race, pk=race_id)
+    race = get_object_or_404(Race.objects.with_registration(), pk=race_id)
     serializer = RaceDetailSerializer(race, context={"request": request})
     return Response(serializer.data)
 
 
+# 대회 상세 + 리뷰 비동기 조회 (ASGI, 두 섹션을 동시에 조회, config/async_sections.py)
+@query_budget(3)
+@require_GET
+async def race_detail_async(request, race_id):
+    error_response = await authenticate(request)
+    if error_response is not None:
+        return error_response
+    drf_request = as_drf_request(request)
+
+    sections = await gather_sections(
+        race=lambda: get_race_detail_data(race_id, drf_request),
+        reviews=lambda: get_race_reviews_data(race_id),
+    )
+    if sections["race"] is None:
+        return json_response({"detail": NotFound.default_detail}, status=404)
+    return json_response(sections)
+
+
+def get_race_detail_data(race_id, request):
+    race = Race.objects.with_registration().filter(pk=race_id).first()
+    if race is None:
+        return None
+    return RaceDetailSerializer(race, context={"request": request}).data
+
+
+def get_race_reviews_data(race_id):
+    reviews = RaceReview.objects.filter(race_id=race_id).select_related("author")
+    return RaceReviewListSerializer(reviews, many=True).data
+
+
 # 대회 리뷰 목록조회 및 리뷰 신규작성
 @extend_schema(
     methods=["POST"],
@@ -76,13 +221,12 @@ def race_detail(request, race_id):
     ],
 )
 @api_view(["GET", "POST"])
+@query_budget(2)
 def race_reviews(request, race_id):
     race = get_object_or_404(Race, id=race_id)
 
     if request.method == "GET":
-        reviews = RaceReview.objects.filter(race=race)
-        serializer = RaceReviewListSerializer(reviews, many=True)
-        return Response(serializer.data)
+        return Response(get_race_reviews_data(race.id))
 
     elif request.method == "POST":
         if request.user.is_authenticated:
@@ -140,16 +284,23 @@ def race_review_update(request, race_id, review_id):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+# 접수중 대회 중 마감 임박 6개 (race_top6, 홈 화면에서 공통 사용)
+def get_top6_races(today):
+    # D-day 오름차순 == 접수 마감일 오름차순 (ORDER BY ... LIMIT 6)
+    return (
+        Race.objects.open_for_registration(today)
+        .with_registration(today)
+        .order_by("reg_end_date", "id")[:6]
+    )
+
+
 # Top6 접수중 대회 목록 조회
 @api_view(["GET"])
+@query_budget(2)
+@cache_anonymous_response("races")
 def race_top6(request):
-    today = date.today()
-
-    open_races = Race.objects.filter(reg_start_date__lte=today, reg_end_date__gte=today)
-    sorted_races = sorted(open_races, key=lambda x: x.d_day(), reverse=False)[:6]
-    serializer = RaceListSerializer(
-        sorted_races, many=True, context={"request": request}
-    )
+    open_races = get_top6_races(timezone.localdate())
+    serializer = RaceListSerializer(open_races, many=True, context={"request": request})
     return Response(serializer.data)
 
 
@@ -0,0 +1,72 @@
+"""
+한글 자모 분해 유틸
+
+- decompose: "달림" → "ㄷㅏㄹㄹㅣㅁ" (겹모음/겹받침도 풀어서 입력 중인 글자와 비교 가능)
+- choseong: "달림 크루" → "ㄷㄹ ㅋㄹ"
+- is_choseong_query: "ㄷㄹ" 처럼 초성만으로 이루어진 검색어인지 확인
+"""
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+
+# 겹모음/겹받침 → 입력 순서대로의 자모
+COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ",
+    "ㅙ": "ㅗㅐ",
+    "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ",
+    "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ",
+    "ㄵ": "ㄴㅈ",
+    "ㄶ": "ㄴㅎ",
+    "ㄺ": "ㄹㄱ",
+    "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ",
+    "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ",
+}
+
+CHOSEONG_SET = set(CHOSEONG)
+
+
+def _syllable_index(char):
+    code = ord(char)
+    if HANGUL_BASE <= code <= HANGUL_LAST:
+        return code - HANGUL_BASE
+    return None
+
+
+def decompose(text):
+    result = []
+    for char in text:
+        index = _syllable_index(char)
+        if index is None:
+            result.append(COMPOUND_JAMO.get(char, char))
+            continue
+        jamo = CHOSEONG[index // 588] + JUNGSEONG[(index % 588) // 28]
+        jong = index % 28
+        if jong:
+            jamo += JONGSEONG[jong]
+        result.append("".join(COMPOUND_JAMO.get(j, j) for j in jamo))
+    return "".join(result)
+
+
+def choseong(text):
+    result = []
+    for char in text:
+        index = _syllable_index(char)
+        result.append(char if index is None else CHOSEONG[index // 588])
+    return "".join(result)
+
+
+def is_choseong_query(text):
+    return bool(text) and all(char in CHOSEONG_SET for char in text)
@@ -0,0 +1,224 @@
+import bisect
+import threading
+import time
+from collections import defaultdict
+from django.db import connections
+from .hangul import choseong, decompose, is_choseong_query
+
+
+"""
+자동완성용 인메모리 인덱스 (프로세스 단위)
+
+- 대상: 크루 이름, 대회 제목, 러너 닉네임
+- 각 이름을 소문자/공백 제거 후 두 가지 키로 저장
+    - jamo 키: 자모 분해 문자열 ("러ㄴ" 입력 중에도 "러닝"과 일치)
+    - choseong 키: 초성 문자열 ("ㄹㄴ" → "러닝")
+- 2글자 이상 검색어는 bigram 역색인으로 후보를 좁힌 뒤 부분일치 확인
+- 1글자 검색어는 정렬된 키 목록에서 bisect 로 접두어 검색
+- 첫 요청 시 DB 에서 한 번 빌드하고, 이후에는 시그널(search/signals.py)로 증분 갱신
+    - 다른 워커 프로세스의 변경을 반영하기 위해 REBUILD_INTERVAL 초마다 백그라운드 스레드에서 다시 빌드
+    - 새 인덱스를 따로 만든 뒤 통째로 교체 (그동안 검색은 기존 인덱스 사용)
+    - 빌드 중 들어온 증분 변경은 모아 두었다가 새 인덱스에 다시 적용
+    - 빌드는 한 번에 하나만 (_build_lock)
+"""
+
+REBUILD_INTERVAL = 600
+KIND_CHOICES = ("crew", "race", "runner")
+
+
+def normalize(text):
+    return "".join(text.lower().split())
+
+
+def _bigrams(key):
+    return {key[i : i + 2] for i in range(len(key) - 1)}
+
+
+class SuggestIndex:
+    def __init__(self, loader):
+        self._loader = loader  # () → [(kind, pk, label), ...]
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+        self._built_at = None
+        self._refresh_at = None  # 다음 백그라운드 빌드 시각
+        self._changes = None  # 빌드 중 들어온 변경 [(kind, pk, label 또는 None)]
+        self._reset()
+
+    def _reset(self):
+        self._entries = {}  # (kind, pk) → (label, jamo 키, choseong 키)
+        self._grams = defaultdict(set)  # bigram → {(kind, pk)}
+        self._sorted_keys = []  # [(키, kind, pk)] 접두어 검색용
+        self._sorted_dirty = False
+
+    @property
+    def is_built(self):
+        return self._built_at is not None
+
+    # wait=False 면 다른 빌드가 진행 중일 때 바로 반환
+    def build(self, wait=True):
+        if not self._build_lock.acquire(blocking=wait):
+            return
+        try:
+            self._build()
+        finally:
+            self._build_lock.release()
+
+    def _build(self):
+        with self._lock:
+            self._changes = []
+        try:
+            entries = self._loader()
+        except Exception:
+            with self._lock:
+                self._changes = None
+            raise
+        fresh = SuggestIndex(self._loader)
+        for kind, pk, label in entries:
+            fresh._add(kind, pk, label)
+        with self._lock:
+            for kind, pk, label in self._changes:
+                if label is None:
+                    fresh._remove(kind, pk)
+                else:
+                    fresh._add(kind, pk, label)
+            self._changes = None
+            self._entries = fresh._entries
+            self._grams = fresh._grams
+            self._sorted_keys = fresh._sorted_keys
+            self._sorted_dirty = fresh._sorted_dirty
+            self._built_at = time.monotonic()
+            self._refresh_at = self._built_at + REBUILD_INTERVAL
+
+    def _build_in_background(self):
+        try:
+            self.build(wait=False)
+        finally:
+            connections.close_all()
+
+    # 첫 빌드만 요청 스레드에서 (다른 요청은 빌드가 끝날 때까지 대기), 이후는 백그라운드
+    def ensure_built(self):
+        if self._built_at is None:
+            with self._build_lock:
+                if self._built_at is None:
+                    self._build()
+        elif time.monotonic() > self._refresh_at and not self._build_lock.locked():
+            # 빌드가 실패해도 다음 시도는 REBUILD_INTERVAL 뒤
+            self._refresh_at = time.monotonic() + REBUILD_INTERVAL
+            threading.Thread(target=self._build_in_background, daemon=True).start()
+
+    def _add(self, kind, pk, label):
+        key = (kind, pk)
+        if key in self._entries:
+            self._remove(kind, pk)
+        if not label:
+            return
+        normalized = normalize(label)
+        jamo_key = decompose(normalized)
+        choseong_key = choseong(normalized)
+        self._entries[key] = (label, jamo_key, choseong_key)
+        for gram in _bigrams(jamo_key) | _bigrams(choseong_key):
+            self._grams[gram].add(key)
+        self._sorted_dirty = True
+
+    def _remove(self, kind, pk):
+        key = (kind, pk)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        _, jamo_key, choseong_key = entry
+        for gram in _bigrams(jamo_key) | _bigrams(choseong_key):
+            keys = self._grams.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._grams[gram]
+        self._sorted_dirty = True
+
+    # 빌드 전이면 무시 (빌드 시 DB 에서 읽어오므로), 빌드 중이면 새 인덱스에도 적용하도록 기록
+    def add(self, kind, pk, label):
+        with self._lock:
+            if self._changes is not None:
+                self._changes.append((kind, pk, label))
+            if self.is_built:
+                self._add(kind, pk, label)
+
+    def remove(self, kind, pk):
+        with self._lock:
+            if self._changes is not None:
+                self._changes.append((kind, pk, None))
+            if self.is_built:
+                self._remove(kind, pk)
+
+    def _prefix_candidates(self, prefix):
+        if self._sorted_dirty:
+            self._sorted_keys = sorted(
+                (search_key, kind, pk)
+                for (kind, pk), (_, jamo_key, choseong_key) in self._entries.items()
+                for search_key in {jamo_key, choseong_key}
+            )
+            self._sorted_dirty = False
+        start = bisect.bisect_left(self._sorted_keys, (prefix,))
+        for search_key, kind, pk in self._sorted_keys[start:]:
+            if not search_key.startswith(prefix):
+                break
+            yield kind, pk
+
+    def search(self, query, kinds=KIND_CHOICES, limit=5):
+        self.ensure_built()
+        normalized = normalize(query)
+        if not normalized:
+            return {kind: [] for kind in kinds}
+
+        by_choseong = is_choseong_query(normalized)
+        needle = normalized if by_choseong else decompose(normalized)
+
+        with self._lock:
+            if len(needle) < 2:
+                candidates = set(self._prefix_candidates(needle))
+            else:
+                gram_sets = [self._grams.get(gram, set()) for gram in _bigrams(needle)]
+                candidates = set.intersection(*gram_sets) if gram_sets else set()
+
+            matches = defaultdict(list)
+            for kind, pk in candidates:
+                if kind not in kinds:
+                    continue
+                label, jamo_key, choseong_key = self._entries[(kind, pk)]
+                search_key = choseong_key if by_choseong else jamo_key
+                position = search_key.find(needle)
+                if position == -1:
+                    continue
+                # 접두어 일치 우선, 짧은 이름 우선
+                matches[kind].append(((position != 0, len(label), label), pk, label))
+
+        return {
+            kind: [
+                {"id": pk, "name": label}
+                for _, pk, label in sorted(matches[kind])[:limit]
+            ]
+            for kind in kinds
+        }
+
+
+def load_entries():
+    from django.contrib.auth import get_user_model
+    from crews.models import Crew
+    from races.models import Race
+
+    entries = [
+        ("crew", pk, name) for pk, name in Crew.objects.values_list("pk", "name")
+    ]
+    entries += [
+        ("race", pk, title) for pk, title in Race.objects.values_list("pk", "title")
+    ]
+    entries += [
+        ("runner", pk, nickname)
+        for pk, nickname in get_user_model()
+        .objects.filter(is_active=True)
+        .exclude(nickname="")
+        .values_list("pk", "nickname")
+    ]
+    return entries
+
+
+suggest_index = SuggestIndex(load_entries)
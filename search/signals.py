@@ -0,0 +1,55 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from crews.models import Crew
+from races.models import Race
+from .index import suggest_index
+
+
+"""
+자동완성 인덱스 증분 갱신
+
+- 크루 이름, 대회 제목, 유저 닉네임이 저장/삭제되면 커밋 후 인덱스에 반영
+"""
+
+
+def _on_commit_add(kind, pk, label):
+    transaction.on_commit(lambda: suggest_index.add(kind, pk, label))
+
+
+def _on_commit_remove(kind, pk):
+    transaction.on_commit(lambda: suggest_index.remove(kind, pk))
+
+
+@receiver(post_save, sender=Crew)
+def index_crew(sender, instance, **kwargs):
+    _on_commit_add("crew", instance.pk, instance.name)
+
+
+@receiver(post_save, sender=Race)
+def index_race(sender, instance, **kwargs):
+    _on_commit_add("race", instance.pk, instance.title)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def index_runner(sender, instance, **kwargs):
+    if instance.is_active:
+        _on_commit_add("runner", instance.pk, instance.nickname)
+    else:
+        _on_commit_remove("runner", instance.pk)
+
+
+@receiver(post_delete, sender=Crew)
+def unindex_crew(sender, instance, **kwargs):
+    _on_commit_remove("crew", instance.pk)
+
+
+@receiver(post_delete, sender=Race)
+def unindex_race(sender, instance, **kwargs):
+    _on_commit_remove("race", instance.pk)
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def unindex_runner(sender, instance, **kwargs):
+    _on_commit_remove("runner", instance.pk)
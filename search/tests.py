@@ -0,0 +1,80 @@
+from rest_framework.test import APITestCase, APIClient
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from crews.models import Crew
+from .hangul import choseong, decompose
+from .index import SuggestIndex, suggest_index
+
+
+User = get_user_model()
+
+
+# 한글 자모 분해
+class HangulTestCase(APITestCase):
+    def test_decompose(self):
+        self.assertEqual(decompose("달림"), "ㄷㅏㄹㄹㅣㅁ")
+        self.assertEqual(decompose("닭"), "ㄷㅏㄹㄱ")
+        self.assertEqual(decompose("run"), "run")
+
+    def test_choseong(self):
+        self.assertEqual(choseong("달림 크루"), "ㄷㄹ ㅋㄹ")
+
+
+# 자동완성
+class SuggestTestCase(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="testpassword", nickname="새벽러너"
+        )
+        self.crew1 = Crew.objects.create(
+            name="한강 러닝 크루", location_city="seoul", owner=self.user
+        )
+        self.crew2 = Crew.objects.create(
+            name="Run Seoul", location_city="seoul", owner=self.user
+        )
+        suggest_index.build()
+
+    def test_suggest_by_prefix_and_partial_syllable(self):
+        response = self.client.get("/search/suggest?q=한강")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["crew"][0]["id"], self.crew1.id)
+
+        # 입력 중인 글자("러ㄴ")도 일치
+        response = self.client.get("/search/suggest?q=러ㄴ")
+        self.assertEqual(response.data["crew"][0]["id"], self.crew1.id)
+        self.assertEqual(response.data["runner"][0]["id"], self.user.id)
+
+        response = self.client.get("/search/suggest?q=run&type=crew")
+        self.assertEqual(list(response.data), ["crew"])
+        self.assertEqual(response.data["crew"][0]["id"], self.crew2.id)
+
+    def test_suggest_by_choseong(self):
+        response = self.client.get("/search/suggest?q=ㅎㄱ")
+        self.assertEqual(response.data["crew"][0]["id"], self.crew1.id)
+
+    # 저장/삭제 시 인덱스 증분 갱신
+    def test_suggest_follows_changes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            crew = Crew.objects.create(
+                name="서울숲 모닝런", location_city="seoul", owner=self.user
+            )
+        response = self.client.get("/search/suggest?q=서울숲")
+        self.assertEqual(response.data["crew"][0]["id"], crew.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            crew.delete()
+        response = self.client.get("/search/suggest?q=서울숲")
+        self.assertEqual(response.data["crew"], [])
+
+    # 다시 빌드하는 동안 들어온 변경은 새 인덱스에도 반영
+    def test_rebuild_replays_changes_during_load(self):
+        def loader():
+            index.add("crew", 2, "성수 러닝")
+            index.remove("crew", 1)
+            return [("crew", 1, "한강 러닝")]
+
+        index = SuggestIndex(loader)
+        index.build()
+        results = index.search("러닝", kinds=("crew",))
+        self.assertEqual(results["crew"], [{"id": 2, "name": "성수 러닝"}])
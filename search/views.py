@@ -0,0 +1,31 @@
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from .index import KIND_CHOICES, suggest_index
+
+
+# 자동완성 /search/suggest?q=키워드&type=crew,race,runner
+@extend_schema(
+    parameters=[
+        OpenApiParameter(
+            name="q", description="검색 키워드 (초성 검색 가능)", type=str
+        ),
+        OpenApiParameter(
+            name="type",
+            description="crew, race, runner 중 선택 (쉼표 구분, 생략 시 전체)",
+            type=str,
+        ),
+        OpenApiParameter(name="size", description="종류별 최대 개수", type=int),
+    ]
+)
+@api_view(["GET"])
+def suggest(request):
+    keyword = request.GET.get("q", "")
+    selected_types = request.GET.get("type", "")
+    kinds = [kind for kind in selected_types.split(",") if kind in KIND_CHOICES]
+    try:
+        size = min(max(int(request.GET.get("size", 5)), 1), 20)
+    except ValueError:
+        size = 5
+    results = suggest_index.search(keyword, kinds=kinds or KIND_CHOICES, limit=size)
+    return Response(results)